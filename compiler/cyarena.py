@@ -0,0 +1,155 @@
+# cyarena.py
+import dataclasses
+import marshal
+from array import array
+import cytree as tree
+from cycompiler import context, context_paths
+
+# every tree node class by kind, in the order cytree defines them
+nodekinds:'tuple[type[tree.tree_node], ...]' = tuple(cls for cls in vars(tree).values()
+    if isinstance(cls, type) and issubclass(cls, tree.tree_node) and cls is not tree.tree_node)
+kindids = {cls:kind for kind,cls in enumerate(nodekinds)}
+
+# how each field is held in the kids column, one slot per field:
+# NODE a handle, 0 for none, STR and BOOL an int, the rest the kids index
+# of a count followed by that many handles, strings or (string, handle) pairs
+NODE, STR, BOOL, NODES, STRS, PAIRS = range(6)
+fieldcodes = {
+    tree.tree_node:NODE, 'tree_node|None':NODE, str:STR, 'bool|None':BOOL,
+    tuple[tree.tree_node, ...]:NODES, tuple[str, ...]:STRS,
+    tuple[tuple[str,tree.tree_node], ...]:PAIRS}
+
+def fieldschema(cls:'type[tree.tree_node]'):
+    return tuple(fieldcodes[f.type] for f in dataclasses.fields(cls) if not f.kw_only)
+
+schemas = tuple(map(fieldschema, nodekinds))
+lowers = tuple(getattr(cls, 'lower', None) for cls in nodekinds)
+statements_kind = kindids[tree.statements_n]
+
+class arena(tree.lowering):
+    '''
+    tree nodes as rows of columns addressed by integer handles, a row
+    holds the node's kind, its span and where its field slots start in
+    the shared kids column, names and operators are interned in strs
+
+    the builders are named after the cytree classes and take the same
+    arguments with handles for nodes, so the rules of cyparsefuns build
+    either tree through p.ast, rows of failed alternatives stay unused
+    '''
+
+    def __init__(self):
+        # row 0 is no node, so every handle is true
+        self.kinds = array('B', [0])
+        self.starts = array('i', [-1])
+        self.ends = array('i', [-1])
+        self.slots = array('i', [0])
+        self.kids = array('i')
+        self.strs:'list[str]' = []
+        self.strids:'dict[str, int]' = {}
+
+    def cols(self):
+        return self.kinds, self.starts, self.ends, self.slots, self.kids
+
+    def __len__(self):
+        return len(self.kinds) - 1
+
+    def intern(self, s:str):
+        if (i := self.strids.get(s)) is None:
+            i = self.strids[s] = len(self.strs)
+            self.strs.append(s)
+        return i
+
+    def add(self, kind:int, args:tuple):
+        kids = self.kids
+        codes = schemas[kind]
+        tail = len(kids) + len(codes)
+        row:'list[int]' = []
+        seqs:'list[int]' = []
+        for code, v in zip(codes, args):
+            if code == NODE: row.append(v or 0)
+            elif code == STR: row.append(self.intern(v))
+            elif code == BOOL: row.append(0 if v is None else 1 + v)
+            else:
+                if not isinstance(v, (tuple, list, array)):
+                    raise TypeError(f'{nodekinds[kind].__name__} takes a sequence for its field {len(row)}, not {v!r}')
+                row.append(tail + len(seqs))
+                seqs.append(len(v))
+                if code == NODES: seqs.extend(v)
+                elif code == STRS: seqs.extend(map(self.intern, v))
+                else:
+                    for op, n in v: seqs += (self.intern(op), n)
+        self.kinds.append(kind)
+        self.starts.append(-1)
+        self.ends.append(-1)
+        self.slots.append(len(kids))
+        kids.extend(row)
+        kids.extend(seqs)
+        return len(self.kinds) - 1
+
+    def span(self, h:int, start:int, end:int):
+        self.starts[h] = start
+        self.ends[h] = end
+
+    def fields(self, h:int):
+        '''the fields of row h as the lower of its class takes them'''
+        kids, strs = self.kids, self.strs
+        i = self.slots[h]
+        r:'list[object]' = []
+        for code in schemas[self.kinds[h]]:
+            v = kids[i]
+            i += 1
+            if code == NODE: r.append(v)
+            elif code == STR: r.append(strs[v])
+            elif code == BOOL: r.append(None if v == 0 else v == 2)
+            else:
+                n = kids[v]
+                v += 1
+                if code == NODES: r.append(kids[v:v + n])
+                elif code == STRS: r.append(tuple(strs[k] for k in kids[v:v + n]))
+                else: r.append(tuple(zip(map(strs.__getitem__, kids[v:v + 2*n:2]), kids[v + 1:v + 2*n:2])))
+        return r
+
+    def statements(self, h:int):
+        '''cytree.statements for a handle'''
+        if self.kinds[h] == statements_kind: return self.fields(h)[0]
+
+    def asm(self, h:int, ctx: context) -> context_paths:
+        if not (lower := lowers[kind := self.kinds[h]]):
+            raise NotImplementedError(f"asm not implemented for '{nodekinds[kind].__name__}'")
+        return lower(self, ctx, *self.fields(h))
+
+    def setrange(self, h:int, ctx: context):
+        return ctx.setrange(self.starts[h], self.ends[h]) if self.starts[h] >= 0 else ctx
+
+    def node(self, h:int) -> 'tree.tree_node|None':
+        '''row h as cytree objects, for tools that want the object tree'''
+        if not h: return None
+        args = []
+        for code, v in zip(schemas[kind := self.kinds[h]], self.fields(h)):
+            if code == NODE: v = self.node(v)
+            elif code == NODES: v = tuple(map(self.node, v))
+            elif code == PAIRS: v = tuple((op, self.node(n)) for op, n in v)
+            args.append(v)
+        return nodekinds[kind](*args, start=self.starts[h], end=self.ends[h])
+
+    def tobytes(self):
+        return marshal.dumps((tuple(col.tobytes() for col in self.cols()), tuple(self.strs)))
+
+    @classmethod
+    def frombytes(cls, data:bytes):
+        blobs, strs = marshal.loads(data)
+        a = cls()
+        for col, blob in zip(a.cols(), blobs):
+            del col[:]
+            col.frombytes(blob)
+        for s in strs: a.intern(s)
+        return a
+
+def builder(kind:int):
+    def build(self:arena, *args:object):
+        return self.add(kind, args)
+    build.__name__ = nodekinds[kind].__name__
+    return build
+
+for kind, cls in enumerate(nodekinds):
+    setattr(arena, cls.__name__, builder(kind))
@@ -0,0 +1,739 @@
+# cybench.py
+import contextlib
+import dataclasses
+import mmap
+import os
+import random
+import re
+import subprocess
+import tempfile
+import sys
+import time
+import tracemalloc
+import types
+import cylexer as lex
+import cyparser
+import cycache
+import cyparsefuns as funs
+import cycompiler as comp
+import cytree as tree
+import cyarena
+import cygen
+import cypyparser
+import cylower
+import cyclient
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+def gencorpus(nlines:int):
+    with open(os.path.join(here, 'main.cy'), 'r') as f:
+        lines = f.read().split('\n')
+    reps = nlines // len(lines) + 1
+    return '\n'.join((lines * reps)[:nlines]) + '\n'
+
+def peakmem(fn, *args):
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+
+def timeit(fn, *args, reps:int=3):
+    best = None
+    for _ in range(reps):
+        start = time.perf_counter()
+        r = fn(*args)
+        t = time.perf_counter() - start
+        if best is None or t < best: best = t
+    return best, r
+
+
+############################################################
+# reference: one regex attempt per token kind, in order
+class seq_lexer(lex.lexer):
+
+    def gettoks(self):
+        m = lex.headpat.match(self.file)
+        self.fidx_start = 0
+        s,e = m.span('ind')
+        self.newline(s, e)
+        done = e == self.filelen
+        while not done:
+            yield
+            self.fidx_start = self.fidx_end
+            if self.tabpat(): done = self.fidx_end == self.filelen
+            elif self.spcpat(): pass
+            elif self.idfpat(): pass
+            elif self.opspat(): pass
+            elif self.numpat(): pass
+            else: self.badpat()
+        yield
+        self.fidx_start = self.filelen
+        self.next(lex.endtok, self.filelen, self.filelen, self.filelen)
+        yield
+
+    def tabpat(self):
+        if m := lex.nwlpat.match(self.file, self.fidx_end):
+            if m2 := lex.spcpat.match(self.file, m.end()): s,e = m2.span()
+            else: s = e = m.end()
+            if self.depth and e < self.filelen: self.fidx_end = e
+            else: self.newline(s, e)
+            return True
+
+    def spcpat(self):
+        if m := lex.spcpat.match(self.file, self.fidx_end):
+            self.fidx_end = m.end()
+            return True
+
+    def opspat(self):
+        if m := lex.opspat.match(self.file, self.fidx_end):
+            s,e = m.span()
+            op = lex.opids[self.file[s:e]]
+            self.next(lex.opstok, s, e, e, op)
+            if op in lex.cython.brackets: self.depth = max(self.depth + lex.cython.brackets[op], 0)
+            return True
+
+    def idfpat(self):
+        if m := lex.idfpat.match(self.file, self.fidx_end):
+            s,e = m.span()
+            if self.file[s:e] in lex.keywords:
+                self.next(lex.opstok, s, e, e, lex.opids[self.file[s:e]])
+            else: self.next(lex.idftok, s, e, e)
+            return True
+
+    def numpat(self):
+        if m := lex.numpat.match(self.file, self.fidx_end):
+            s,e = m.span()
+            self.next(lex.numtok, s, e, e)
+            return True
+
+    def badpat(self):
+        pat = self.file[self.fidx_end]
+        self.error(f"unexpected char '{pat}'", *self.lnum_lidx(self.fidx_start))
+
+
+def bench_lexer(sizes:'tuple[int, ...]'=(10_000, 100_000)):
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        t_seq, l_seq = timeit(seq_lexer, 'bench.cy', file)
+        t_new, l_new = timeit(lex.lexer, 'bench.cy', file)
+        assert list(l_seq.toks) == list(l_new.toks), 'token streams differ'
+        ntoks = len(l_new.toks)
+        print(f'lexer {nlines:>9} lines {ntoks:>9} toks '
+            f'seq {ntoks/t_seq:>12,.0f} tok/s '
+            f'master {ntoks/t_new:>12,.0f} tok/s '
+            f'x{t_seq/t_new:.2f}')
+
+
+############################################################
+# reference: per-line concatenation onto an attribute and a copy of every line
+def seq_normalize(file:str):
+    file = file + '\\'
+    self = types.SimpleNamespace(file=str())
+    lines:'list[str]' = []
+    fidx = 0
+    ls_fidxs:'list[int]' = [-1]
+    le_fidxs:'list[int]' = [-1]
+    for line in file.split('\n'):
+        ls_fidxs.append(fidx)
+        if line and line[-1] == '\\':
+            subline = line[:-1]
+            fidx += len(subline)
+            tfidx = fidx
+            self.file += subline
+        else:
+            tfidx = fidx + len(line)
+            self.file += line + '\n'
+            fidx = tfidx+1
+        le_fidxs.append(tfidx)
+        lines.append(line)
+    return self.file, ls_fidxs, le_fidxs, lines
+
+
+def bench_normalize(sizes:'tuple[int, ...]'=(1_000, 10_000, 100_000, 1_000_000), seq_max:int=100_000):
+    joined = gencorpus(1_000).replace('    asdf:int', '    asdf\\\n:int')
+    nfile, ls_fidxs, le_fidxs = lex.normalize(joined)
+    sfile, sls, sle, _ = seq_normalize(joined)
+    assert (sfile, sls, sle) == (nfile, list(ls_fidxs), list(le_fidxs)), 'normalization differs'
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        t_new, (nfile, ls_fidxs, le_fidxs) = timeit(lex.normalize, file)
+        m_new = peakmem(lex.normalize, file)
+        line = f'normalize {nlines:>9} lines join {t_new*1e3:>9.1f} ms {m_new/2**20:>8.1f} MiB'
+        if nlines <= seq_max:
+            t_seq, (sfile, sls, sle, _) = timeit(seq_normalize, file, reps=1)
+            m_seq = peakmem(seq_normalize, file)
+            assert (sfile, sls, sle) == (nfile, list(ls_fidxs), list(le_fidxs)), 'normalization differs'
+            line += f' | concat {t_seq*1e3:>9.1f} ms {m_seq/2**20:>8.1f} MiB x{t_seq/t_new:.1f}'
+        print(line)
+
+
+def bench_toktable(sizes:'tuple[int, ...]'=(10_000, 100_000)):
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        m_file = peakmem(lex.normalize, file)
+        tracemalloc.start()
+        l = lex.lexer('bench.cy', file)
+        m_table = tracemalloc.get_traced_memory()[0]
+        toks = tuple(l.toks) # the tuple of lextok the lexer used to keep
+        m_objs = tracemalloc.get_traced_memory()[0] - m_table
+        tracemalloc.stop()
+        m_table -= m_file
+        ntoks = len(toks)
+        print(f'toktable {nlines:>9} lines {ntoks:>9} toks '
+            f'lextok tuple {m_objs/ntoks:>7.1f} B/tok '
+            f'table {m_table/ntoks:>7.1f} B/tok '
+            f'x{m_objs/m_table:.1f}')
+
+
+def editline(lines:'list[str]', i:int):
+    '''the i-th seeded one line edit of the lines of a gencorpus, as (lnum, text)'''
+    lnum = 1 + (i * 7919) % (len(lines) - 2)
+    while not lines[lnum-1].strip(): lnum += 1 # a blank line has no block
+    # keep the line's indentation so the blocks around it stay valid
+    line = lines[lnum-1]
+    indent = line[:len(line) - len(line.lstrip())]
+    return lnum, f'{indent}x{i} = y + {i}\n'
+
+def bench_edit(sizes:'tuple[int, ...]'=(10_000, 100_000), edits:int=100):
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        lines = file.split('\n')
+        t_full, l = timeit(lex.lexer, 'bench.cy', file, reps=1)
+        start = time.perf_counter()
+        relexed = 0
+        for i in range(edits):
+            lnum, text = editline(lines, i)
+            t0, _, new_end = l.edit(lnum, lnum + 1, text)
+            relexed += new_end - t0
+        t_edit = (time.perf_counter() - start) / edits
+        print(f'edit {nlines:>9} lines full lex {t_full*1e3:>8.1f} ms '
+            f'edit {t_edit*1e3:>7.2f} ms relexed {relexed/edits:>5.1f} toks/edit '
+            f'x{t_full/t_edit:.0f}')
+
+
+def copytails(l:lex.lexer):
+    '''
+    what an edit in the middle of l moves whatever it relexes, the source
+    string is copied and the tails of the token and line columns move by
+    one row, timed on a row added for it so no column is reallocated
+    '''
+    cols = [(col, len(col) // 2) for col in (*l.toks.cols(), l.ls_fidxs, l.le_fidxs)]
+    for col, row in cols: col.insert(row, 0)
+    start = time.perf_counter()
+    mid = len(l.file) // 2
+    l.file[:mid] + 'x' + l.file[mid:]
+    for col, row in cols: del col[row]
+    return time.perf_counter() - start
+
+def bench_editscale(sizes:'tuple[int, ...]'=(10_000, 100_000, 400_000), edits:int=50):
+    '''
+    one line edits as the file grows, the source and the columns are flat
+    so an edit still costs time linear in the file for the copies
+    '''
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        lines = file.split('\n')
+        l = lex.lexer('bench.cy', file)
+        times = []
+        for i in range(edits):
+            lnum, text = editline(lines, i)
+            start = time.perf_counter()
+            l.edit(lnum, lnum + 1, text)
+            times.append(time.perf_counter() - start)
+        t_edit = sorted(times)[len(times) // 2]
+        t_copy = min(copytails(l) for _ in range(3))
+        print(f'editscale {nlines:>9} lines {len(l.toks):>9} toks '
+            f'edit {t_edit*1e3:>7.2f} ms median {t_edit/nlines*1e9:>6.1f} us/1k lines '
+            f'copies {t_copy*1e3:>7.2f} ms')
+
+
+def bench_strings(sizes:'tuple[int, ...]'=(2**20, 4 * 2**20)):
+    oldpat = re.compile(r'\"(\\\"|[^\"])*\"') # cythonlexer.strpat
+    for size in sizes:
+        doc = ('lorem ipsum dolor "sit" amet\n' * (size // 29))[:size]
+        blob = ''.join('\\x%02x' % (i % 256) for i in range(size // 4))
+        for name, lit, old in (('docstring', f'"""{doc}"""', None), ('blob', f'b"{blob}\\""', f'"{blob}\\""')):
+            file = f'x = {lit}\ny = 1\n'
+            t_new, l = timeit(lex.lexer, 'bench.cy', file)
+            assert l.toks[3].str == lit, 'literal not lexed as one token'
+            line = f'strings {name:>9} {len(lit)/2**20:>5.1f} MiB lex {len(lit)/t_new/2**20:>8.1f} MiB/s'
+            if old:
+                t_old, m = timeit(oldpat.match, old, reps=1)
+                assert m.group() == old
+                line += f' | regex {len(lit)/t_old/2**20:>8.1f} MiB/s x{t_old/t_new:.1f}'
+            print(line)
+
+
+def lexread(filename:str):
+    with open(filename, 'r') as f:
+        return lex.lexer(filename, f.read())
+
+def lexmap(filename:str):
+    with open(filename, 'rb') as f:
+        return lex.lexer(filename, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+def bench_input(sizes:'tuple[int, ...]'=(10_000, 100_000)):
+    for nlines in sizes:
+        with tempfile.NamedTemporaryFile('w', suffix='.cy', delete=False) as f:
+            f.write(gencorpus(nlines))
+        try:
+            t_read, l_read = timeit(lexread, f.name)
+            t_map, l_map = timeit(lexmap, f.name)
+            assert list(l_read.toks) == list(l_map.toks), 'token streams differ'
+            del l_read, l_map
+            m_read = peakmem(lexread, f.name)
+            m_map = peakmem(lexmap, f.name)
+            size = os.path.getsize(f.name)
+        finally: os.unlink(f.name)
+        print(f'input {nlines:>9} lines {size/2**20:>6.1f} MiB '
+            f'read {t_read*1e3:>8.1f} ms {m_read/2**20:>7.1f} MiB '
+            f'| mmap {t_map*1e3:>8.1f} ms {m_map/2**20:>7.1f} MiB '
+            f'x{t_read/t_map:.2f}')
+
+
+def bench_cache(sizes:'tuple[int, ...]'=(10_000, 100_000)):
+    with tempfile.TemporaryDirectory() as path:
+        cache = cycache.tokcache(path)
+        for nlines in sizes:
+            file = gencorpus(nlines)
+            t_lex, l = timeit(lex.lexer, 'bench.cy', file)
+            cache.clear()
+            t_store, _ = timeit(lex.lexer, 'bench.cy', file, False, cache, reps=1)
+            t_load, c = timeit(lex.lexer, 'bench.cy', file, False, cache)
+            assert list(l.toks) == list(c.toks), 'token streams differ'
+            size = sum(e.stat().st_size for e in os.scandir(path))
+            print(f'cache {nlines:>9} lines lex {t_lex*1e3:>8.1f} ms '
+                f'store {t_store*1e3:>8.1f} ms load {t_load*1e3:>7.1f} ms '
+                f'entry {size/2**20:>6.1f} MiB x{t_lex/t_load:.0f}')
+
+
+def parse(file:str, stream:bool=False, memo:bool=True, first:bool=True,
+        cls:'type[cyparser.parser]'=cyparser.parser):
+    p = cls('bench.cy', file, stream, memo=memo, first=first)
+    funs.file_r(p)
+    return p
+
+def parsetree(file:str, cls:'type[cyparser.parser]'=cyparser.parser):
+    return funs.file_r(cls('bench.cy', file))
+
+
+############################################################
+# reference: operators tested by type and by string set membership
+class set_parser(cyparser.parser):
+
+    opsets:'dict[int, frozenset[str]]' = {}
+
+    @classmethod
+    def opset(cls, ops:int):
+        '''the strings of mask ops, which the rules used to pass as set literals'''
+        if (s := cls.opsets.get(ops)) is None:
+            s = cls.opsets[ops] = frozenset(op for op, i in lex.opids.items() if lex.opbits[i] & ops)
+        return s
+
+    def getop(self, ops:int, err:'str|None'=None):
+        if isinstance(tok := self.tok, lex.opstok) and tok.str in self.opset(ops):
+            return tok
+        if err: self.error(err)
+
+    def nextop(self, ops:int, err:'str|None'=None):
+        if isinstance(tok := self.tok, lex.opstok) and tok.str in self.opset(ops):
+            self.next()
+            return tok
+        if err: self.error(err)
+
+
+def bench_parse(sizes:'tuple[int, ...]'=(2_000, 10_000)):
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        assert parsetree(file, set_parser) == parsetree(file), 'trees differ'
+        t_lex, l = timeit(lex.lexer, 'bench.cy', file, reps=7)
+        t_set, _ = timeit(parse, file, False, True, True, set_parser, reps=7)
+        t_new, _ = timeit(parse, file, reps=7)
+        t_set, t_new = t_set - t_lex, t_new - t_lex
+        ntoks = len(l.toks)
+        print(f'parse {nlines:>9} lines {ntoks:>9} toks '
+            f'sets {ntoks/t_set:>10,.0f} tok/s masks {ntoks/t_new:>10,.0f} tok/s '
+            f'x{t_set/t_new:.2f}')
+
+
+def genassign(nlines:int):
+    '''assignments that parse their targets as expressions first, seeded'''
+    rng = random.Random(nlines)
+    forms = ('a{i}.b[c] = d.e[f] + g * {i}', 'x{i}, y = y, x{i}', 'a.b{i} += {i}',
+        'n{i}:int = {i} + m', 'k{i}[j][{i}] = (p, q)')
+    return ''.join(rng.choice(forms).format(i=i) + '\n' for i in range(nlines))
+
+def bench_memo(sizes:'tuple[int, ...]'=(2_000, 10_000)):
+    for name, gen in (('main', gencorpus), ('assign', genassign)):
+        for nlines in sizes:
+            file = gen(nlines)
+            t_off, _ = timeit(parse, file, False, False)
+            t_on, p = timeit(parse, file, False, True)
+            m_off = peakmem(parse, file, True, False)
+            m_on = peakmem(parse, file, True, True)
+            print(f'memo {name:>6} {nlines:>9} lines '
+                f'off {t_off*1e3:>9.1f} ms on {t_on*1e3:>9.1f} ms x{t_off/t_on:.2f} '
+                f'hits {p.memo_hits:>7} misses {p.memo_misses:>7} '
+                f'table {p.memo_peak:>4} entries '
+                f'stream off {m_off/2**20:>6.1f} MiB on {m_on/2**20:>6.1f} MiB')
+
+
+def bench_first(sizes:'tuple[int, ...]'=(2_000, 10_000)):
+    for name, gen in (('main', gencorpus), ('assign', genassign)):
+        for nlines in sizes:
+            file = gen(nlines)
+            t_off, _ = timeit(parse, file, False, True, False)
+            t_on, p = timeit(parse, file, False, True, True)
+            print(f'first {name:>6} {nlines:>9} lines '
+                f'off {t_off*1e3:>9.1f} ms on {t_on*1e3:>9.1f} ms x{t_off/t_on:.2f} '
+                f'{p.first_skips:>7} rule calls skipped')
+
+
+def bench_stream(sizes:'tuple[int, ...]'=(2_000, 10_000)):
+    for nlines in sizes:
+        file = gencorpus(nlines)
+        m_eager = peakmem(parse, file)
+        m_stream = peakmem(parse, file, True)
+        toks = parse(file, True).lexer.toks
+        print(f'stream {nlines:>9} lines {len(toks):>9} toks '
+            f'window {toks.peak:>5} toks '
+            f'eager {m_eager/2**20:>7.1f} MiB '
+            f'stream {m_stream/2**20:>7.1f} MiB')
+
+
+def genparse(file:str, lowered:bool=False):
+    p = cyparser.parser('bench.cy', file)
+    assert (n := cypyparser.parse(p)), 'generated parser failed'
+    return cylower.lower(p.lexer, n) if lowered else p
+
+def bench_gen(sizes:'tuple[int, ...]'=(2_000, 10_000)):
+    assert not cygen.stale(), 'cypyparser.py or cyfirsts.py differs from what py.bnf generates, rerun cygen.py'
+    for name, gen in (('main', gencorpus), ('assign', genassign), ('postfix', genmethods)):
+        for nlines in sizes:
+            file = gen(nlines)
+            assert genparse(file, True) == parsetree(file), 'lowered tree differs from the hand rules'
+            t_lex, _ = timeit(lex.lexer, 'bench.cy', file)
+            t_hand, p = timeit(parse, file, reps=7)
+            t_gen, g = timeit(genparse, file, reps=7)
+            t_low, _ = timeit(genparse, file, True, reps=7)
+            ntoks = len(p.lexer.toks)
+            t_hand, t_gen, t_low = t_hand - t_lex, t_gen - t_lex, t_low - t_lex
+            print(f'gen {name:>7} {nlines:>9} lines {ntoks:>9} toks '
+                f'hand {ntoks/t_hand:>10,.0f} tok/s generated {ntoks/t_gen:>10,.0f} tok/s '
+                f'x{t_hand/t_gen:.2f} lowered {ntoks/t_low:>10,.0f} tok/s x{t_hand/t_low:.2f} '
+                f'memo hits {g.memo_hits:>7} misses {g.memo_misses:>7}')
+
+
+def genchain(nlines:int, nops:int):
+    '''assignments of operator chains nops operators long, seeded'''
+    rng = random.Random(nops)
+    ops = ('+', '-', '*', '//', '%', '<<', '>>', '&', '^', '|', '<', '==', '!=', 'and', 'or')
+    def term(j:int, op:str):
+        if op in ('and', 'or'): return f' {op} {rng.choice(("", "not "))}a{j}'
+        return f' {op} {rng.choice(("", "-", "~"))}a{j}'
+    def chain():
+        return 'a0' + ''.join(term(j, rng.choice(ops)) for j in range(1, nops + 1))
+    return ''.join(f'x{i} = {chain()}\n' for i in range(nlines))
+
+@contextlib.contextmanager
+def swapped(module:types.ModuleType, **names:object):
+    '''module's globals replaced by names while a reference is timed'''
+    saved = {name:getattr(module, name) for name in names}
+    for name, value in names.items(): setattr(module, name, value)
+    try: yield
+    finally:
+        for name, value in saved.items(): setattr(module, name, value)
+
+
+############################################################
+# reference: one rule per layer of the grammar from 'or' down to '**'
+@cyparser.first
+@cyparser.memo
+def disjunction_r(p:cyparser.parser):
+    if args := tuple(gen_layer(p, conjunction_r, funs.or_op, "no conjunction after 'or' operator")):
+        return args[0] if len(args) == 1 else p.ast.or_block_n(args)
+
+def conjunction_r(p:cyparser.parser):
+    if args := tuple(gen_layer(p, inversion_r, funs.and_op, "no conjunction after 'and' operator")):
+        return args[0] if len(args) == 1 else p.ast.and_block_n(args)
+
+def gen_layer(p:cyparser.parser, rule, op:int, err:str):
+    if a := p.rule(rule):
+        yield a
+        while p.nextop(op):
+            yield p.rule_err(rule, err)
+
+def inversion_r(p:cyparser.parser):
+    if p.nextop(funs.not_op):
+        return p.ast.unary_op_n('not', p.rule_err(inversion_r, "no inversion after 'not' operator"))
+    return p.rule(comparison_r)
+
+def comparison_r(p:cyparser.parser):
+    if expr := p.rule(bitwise_or_r):
+        if comps := tuple(gen_comparison(p)):
+            return p.ast.compare_n(expr, comps)
+        return expr
+
+def gen_comparison(p:cyparser.parser):
+    while op := funs.comparison_op_pr(p):
+        yield op.str, p.rule_err(bitwise_or_r, f"no bitwise_or after operator")
+
+def bitwise_or_r(p:cyparser.parser):
+    '''the operands in a linked list, joined tightest priority first'''
+    if f := p.rule(factor_r):
+        f_node = root = fact_bit_fn(f)
+        opmap:'dict[tuple[int,int],op_bit_fn]' = {}
+        while op := p.nextop(funs.bitwise_ops):
+            f = p.rule_err(factor_r, f"no factor after '{op.str}' operator")
+            op_node = op_bit_fn(p, op.str, f_node, f)
+            f_node = op_node.next
+            opmap[funs.bitwise_op_priority[op.str], len(opmap)] = op_node
+        for key in sorted(opmap): opmap[key].join()
+        return root.fact
+
+@dataclasses.dataclass
+class fact_bit_fn:
+    fact:object
+    prev:'op_bit_fn|None' = None
+    next:'op_bit_fn|None' = None
+
+class op_bit_fn:
+
+    def __init__(self, p:cyparser.parser, op:str, prev:fact_bit_fn, f:object):
+        self.p = p
+        self.op = op
+        self.prev = prev
+        prev.next = self
+        self.next = fact_bit_fn(f, self)
+
+    def join(self):
+        # a    +    b    -          ...
+        # prev self next next.next
+        self.prev.fact = self.p.ast.binary_op_n(self.op, self.prev.fact, self.next.fact)
+        self.prev.next = self.next.next
+        if self.next.next:
+            self.next.next.prev = self.prev
+
+def factor_r(p:cyparser.parser):
+    if op := p.nextop(funs.factor_ops):
+        return p.ast.unary_op_n(op.str, p.rule_err(factor_r, f"no factor after '{op.str}' operator"))
+    return p.rule(power_r)
+
+def power_r(p:cyparser.parser):
+    if a := p.rule(funs.await_primary_r):
+        if p.nextop(funs.dstar_op):
+            return p.ast.binary_op_n('**', a, p.rule_err(factor_r, "no factor after '**' operator"))
+        return a
+
+layered = {'disjunction_r':disjunction_r, 'bitwise_or_r':bitwise_or_r}
+
+
+def bench_chains(chains:'tuple[int, ...]'=(4, 16, 64, 256), ntoks:int=100_000):
+    for nops in chains:
+        file = genchain(max(1, ntoks // (nops * 2 + 4)), nops)
+        with swapped(funs, **layered): n_layer = parsetree(file)
+        assert n_layer == parsetree(file), 'trees differ'
+        del n_layer
+        t_lex, l = timeit(lex.lexer, 'bench.cy', file, reps=7)
+        with swapped(funs, **layered): t_layer, _ = timeit(parse, file, reps=7)
+        t_climb, _ = timeit(parse, file, reps=7)
+        t_layer, t_climb = t_layer - t_lex, t_climb - t_lex
+        n = len(l.toks)
+        print(f'chains {nops:>5} ops {n:>9} toks '
+            f'layered {n/t_layer:>10,.0f} tok/s climbing {n/t_climb:>10,.0f} tok/s '
+            f'x{t_layer/t_climb:.2f}')
+
+
+def genmethods(nlines:int):
+    '''method chains, subscripts and attribute targets, seeded'''
+    rng = random.Random(nlines)
+    forms = ('self.items[{i}].name = obj.get(k{i}).strip().lower()',
+        'r{i} = db.query(m).filter(m.id == {i}).order_by(m.t).first()',
+        'x{i} = a.b.c.d[{i}].e(f).g[h].i', 'cfg.opts[k{i}].vals.append(v.copy())')
+    return ''.join(rng.choice(forms).format(i=i) + '\n' for i in range(nlines))
+
+############################################################
+# reference: a closure per chain, every step run and spanned by p.rule
+def primary_r(p:cyparser.parser):
+    if a := p.rule(funs.atom_r):
+        r = a
+        def sub_primary_r(p:cyparser.parser):
+            return p.getop(funs.lookahead_set) and sub_primary_pr(p, r)
+        while a := p.rule(sub_primary_r): r = a
+        return r
+
+@cyparser.first
+def t_primary_r(p:cyparser.parser):
+    if (a := p.rule(funs.atom_r)) and p.getop(funs.lookahead_set):
+        r = a
+        def sub_t_primary_r(p:cyparser.parser):
+            if (s := sub_primary_pr(p, r)) and p.getop(funs.lookahead_set):
+                return s
+        while a := p.rule(sub_t_primary_r): r = a
+        return r
+
+def sub_primary_pr(p:cyparser.parser, a:object):
+    '''funs.sub_primary_pr trying a generator expression before the arguments'''
+    if p.tok.bit & (funs.dot_op | funs.lsqb_op): return funs.sub_primary_pr(p, a)
+    elif n := p.rule(funs.genexp_r):
+        return p.ast.call_n(a, p.ast.arguments_n((n,)))
+    elif args := p.rule(funs.p_arguments_r):
+        return p.ast.call_n(a, args)
+
+stepwise = {'primary_r':primary_r, 't_primary_r':t_primary_r}
+
+
+def bench_postfix(sizes:'tuple[int, ...]'=(2_000, 10_000)):
+    for nlines in sizes:
+        file = genmethods(nlines)
+        with swapped(funs, **stepwise): n_step = parsetree(file)
+        assert n_step == parsetree(file), 'trees differ'
+        del n_step
+        t_lex, l = timeit(lex.lexer, 'bench.cy', file, reps=7)
+        with swapped(funs, **stepwise): t_step, _ = timeit(parse, file, reps=7)
+        t_loop, _ = timeit(parse, file, reps=7)
+        t_step, t_loop = t_step - t_lex, t_loop - t_lex
+        ntoks = len(l.toks)
+        print(f'postfix {nlines:>9} lines {ntoks:>9} toks '
+            f'stepwise {ntoks/t_step:>10,.0f} tok/s loop {ntoks/t_loop:>10,.0f} tok/s '
+            f'x{t_step/t_loop:.2f}')
+
+
+def treenodes(n:object):
+    '''the tree nodes under n and how many of them carry a span'''
+    nodes = spanned = 0
+    stack = [n]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, (list, tuple)): stack.extend(n)
+        elif isinstance(n, tree.tree_node):
+            nodes += 1
+            spanned += n.start >= 0
+            stack.extend(getattr(n, f.name) for f in dataclasses.fields(n))
+    return nodes, spanned
+
+def rangesets(n:tree.tree_node):
+    '''the range-set contexts the asm of n emits'''
+    count = 0
+    seen:'set[int]' = set()
+    stack = [ctx := comp.context('program', 'start')]
+    n.asm(ctx)
+    while stack:
+        ctx = stack.pop()
+        if id(ctx) in seen: continue
+        seen.add(id(ctx))
+        count += ctx._op == 'range-set'
+        stack.extend(ctx._ctxs.values())
+    return count
+
+def bench_nodes(nlines:int=10_000):
+    for name in ('main.cy', 'test.cy', 'corpus'):
+        if name == 'corpus': file = gencorpus(nlines)
+        else:
+            with open(os.path.join(here, name), 'r') as f: file = f.read()
+        tracemalloc.start()
+        try:
+            n = funs.file_r(cyparser.parser(name, file))
+            size = tracemalloc.get_traced_memory()[0] # what the tree keeps alive
+        finally: tracemalloc.stop()
+        nodes, spanned = treenodes(n)
+        print(f'nodes {name:>8} {nodes:>9} nodes {spanned:>9} spanned '
+            f'tree {size/2**20:>7.2f} MiB {rangesets(n):>7} range-sets')
+
+
+def rebuild(n:object) -> object:
+    '''a copy of the tree under n made through the node constructors'''
+    if isinstance(n, list): return [rebuild(a) for a in n]
+    if isinstance(n, tuple): return tuple(rebuild(a) for a in n)
+    if isinstance(n, tree.tree_node):
+        return type(n)(*(rebuild(getattr(n, f.name)) for f in dataclasses.fields(n) if f.init and not f.kw_only))
+    return n
+
+def bench_tree(nlines:int=100_000):
+    file = gencorpus(nlines)
+    tracemalloc.start()
+    try:
+        n = funs.file_r(cyparser.parser('bench.cy', file))
+        size = tracemalloc.get_traced_memory()[0]
+    finally: tracemalloc.stop()
+    nodes, _ = treenodes(n)
+    t_build, _ = timeit(rebuild, n)
+    print(f'tree {nlines:>9} lines {nodes:>9} nodes {size/2**20:>7.1f} MiB '
+        f'{size/nodes:>6.0f} B/node build {t_build*1e3:>7.1f} ms {nodes/t_build:>11,.0f} nodes/s')
+
+
+def bench_arena(nlines:int=100_000):
+    file = gencorpus(nlines)
+    tracemalloc.start()
+    try:
+        n = funs.file_r(cyparser.parser('bench.cy', file))
+        m_tree = tracemalloc.get_traced_memory()[0]
+    finally: tracemalloc.stop()
+    del n
+    tracemalloc.start()
+    try:
+        a = cyarena.arena()
+        h = funs.file_r(cyparser.parser('bench.cy', file, arena=a))
+        m_arena = tracemalloc.get_traced_memory()[0]
+    finally: tracemalloc.stop()
+    t_dump, data = timeit(a.tobytes)
+    t_load, b = timeit(cyarena.arena.frombytes, data)
+    assert b.node(h) == a.node(h), 'arena differs after a round trip'
+    print(f'arena {nlines:>9} lines {len(a):>9} rows '
+        f'tree {m_tree/2**20:>7.1f} MiB arena {m_arena/2**20:>7.1f} MiB x{m_tree/m_arena:.1f} '
+        f'bytes {len(data)/2**20:>6.1f} MiB dump {t_dump*1e3:>6.1f} ms load {t_load*1e3:>6.1f} ms')
+
+
+def bench_daemon(reps:int=10):
+    with tempfile.TemporaryDirectory() as path:
+        sock = os.path.join(path, 'bench.sock')
+        server = subprocess.Popen([sys.executable, os.path.join(here, 'cyserver.py'), f'--socket={sock}'])
+        try:
+            while not os.path.exists(sock): time.sleep(0.01)
+            for name in ('test.cy', 'main.cy'):
+                filename = os.path.join(here, name)
+                with open(filename, 'r') as f: source = f.read()
+                run = lambda *args: subprocess.run([sys.executable, *args], capture_output=True, check=True)
+                t_cold, _ = timeit(run, os.path.join(here, 'main.py'), filename, reps=reps)
+                t_client, _ = timeit(run, os.path.join(here, 'cyclient.py'), filename, f'--socket={sock}', reps=reps)
+                def fresh():
+                    fresh.n += 1 # a new source each time, so the server compiles it
+                    return cyclient.compile_file(filename, f'{source}\nx{fresh.n} = 1\n', path=sock)
+                fresh.n = 0
+                t_warm, r = timeit(fresh, reps=reps)
+                assert r['ok'] and not r['cached'], r['output']
+                t_hit, r = timeit(cyclient.compile_file, filename, None, False, False, sock, reps=reps)
+                assert r['cached']
+                print(f'daemon {name:>8} cold {t_cold*1e3:>7.1f} ms client {t_client*1e3:>7.1f} ms '
+                    f'warm {t_warm*1e3:>7.2f} ms cached {t_hit*1e3:>6.2f} ms x{t_cold/t_warm:.0f}')
+        finally:
+            cyclient.request({'shutdown':True}, sock)
+            server.wait()
+
+
+benches = {
+    'lexer': bench_lexer,
+    'normalize': bench_normalize,
+    'toktable': bench_toktable,
+    'parse': bench_parse,
+    'gen': bench_gen,
+    'chains': bench_chains,
+    'postfix': bench_postfix,
+    'stream': bench_stream,
+    'nodes': bench_nodes,
+    'tree': bench_tree,
+    'arena': bench_arena,
+    'memo': bench_memo,
+    'first': bench_first,
+    'edit': bench_edit,
+    'editscale': bench_editscale,
+    'strings': bench_strings,
+    'input': bench_input,
+    'cache': bench_cache,
+    'daemon': bench_daemon,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or benches:
+        benches[name]()
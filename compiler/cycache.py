@@ -0,0 +1,114 @@
+# cycache.py
+import hashlib
+import marshal
+import os
+import tempfile
+import time
+import zlib
+import cylexer as lex
+
+def lexer_version():
+    '''hash of the lexer's own source, so any change to it starts a new cache'''
+    with open(lex.__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+def default_dir():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cylexer')
+
+class tokcache:
+    '''
+    on disk cache of lexed token columns keyed by the hash of the lexing
+    buffer and the lexer version, one file per key holding the marshaled
+    column bytes deflated at the fastest level
+
+    files are written to a temporary name and renamed into place so other
+    processes only ever see whole entries, hits refresh the file's mtime
+    and stores evict the oldest entries once the cache outgrows max_bytes,
+    temporary files a crashed writer left behind count toward max_bytes and
+    are removed once they are older than tmp_grace seconds
+    '''
+
+    def __init__(self, path:'str|None'=None, max_bytes:int=256 * 2**20, tmp_grace:float=60.0):
+        self.path = path or default_dir()
+        self.max_bytes = max_bytes
+        self.tmp_grace = tmp_grace
+        self.version = lexer_version()
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, lines:lex.lexer):
+        file = lines.file
+        h = hashlib.sha256(self.version.encode())
+        h.update(b's' if isinstance(file, str) else b'b') # offsets differ between str and bytes
+        h.update('\0'.join((lines.lang.tokpat.pattern, *lines.lang.opnames)).encode()) # the language table
+        h.update(file.encode() if isinstance(file, str) else file)
+        return h.hexdigest()
+
+    def entry(self, key:str):
+        return os.path.join(self.path, key + '.tok')
+
+    def load(self, lines:lex.lexer):
+        '''fills the token table of lines from the cache, false on a miss'''
+        name = self.entry(self.key(lines))
+        try:
+            with open(name, 'rb') as f:
+                blobs = marshal.loads(zlib.decompress(f.read()))
+        except (OSError, EOFError, ValueError, TypeError, zlib.error):
+            return False
+        try: os.utime(name)
+        except OSError: pass # a read only or just evicted entry is still a hit
+        cols = lines.toks.cols()
+        if not (isinstance(blobs, tuple) and len(blobs) == len(cols)
+                and all(isinstance(blob, bytes) for blob in blobs)
+                and len({len(blob) / col.itemsize for col, blob in zip(cols, blobs)}) == 1):
+            return False # not an entry this version wrote
+        for col, blob in zip(cols, blobs):
+            col.frombytes(blob)
+        lines.tidx = len(lines.toks)
+        return True
+
+    def store(self, lines:lex.lexer):
+        blobs = tuple(col.tobytes() for col in lines.toks.cols())
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(marshal.dumps(blobs), 1))
+            os.replace(tmp, self.entry(self.key(lines)))
+        except OSError:
+            if os.path.exists(tmp): os.unlink(tmp)
+            return
+        self.evict()
+
+    def evict(self):
+        '''
+        removes stale temporary files, then the least recently used entries
+        until the cache fits max_bytes
+        '''
+        entries:'list[tuple[float, int, str]]' = []
+        total = 0
+        stale = time.time() - self.tmp_grace
+        with os.scandir(self.path) as it:
+            for e in it:
+                tmp = e.name.endswith('.tmp')
+                if not (tmp or e.name.endswith('.tok')): continue
+                try: st = e.stat()
+                except OSError: continue # evicted or renamed by another process
+                if tmp and st.st_mtime < stale:
+                    try: os.unlink(e.path) # left by a writer that died
+                    except OSError: pass
+                    continue
+                if not tmp: entries.append((st.st_mtime, st.st_size, e.path))
+                total += st.st_size # live temporaries are about to become entries
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes: break
+            try: os.unlink(path)
+            except OSError: pass
+            total -= size
+
+    def clear(self):
+        with os.scandir(self.path) as it:
+            for e in it:
+                if e.name.endswith(('.tok', '.tmp')):
+                    try: os.unlink(e.path)
+                    except OSError: pass
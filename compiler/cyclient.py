@@ -0,0 +1,70 @@
+# cyclient.py
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+
+# only the standard library, a client pays for none of the compiler's imports
+
+def default_socket():
+    '''
+    the socket in the user's runtime directory, else in a directory under
+    the temporary one that only the user may enter, raises OSError when
+    that directory is someone else's or open to others
+    '''
+    if base := os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(base, f'cyserver-{os.getuid()}.sock')
+    base = os.path.join(tempfile.gettempdir(), f'cyserver-{os.getuid()}')
+    try: os.mkdir(base, 0o700)
+    except FileExistsError: pass
+    st = os.lstat(base) # a symlink planted there is not the user's directory
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise OSError(f'{base} is not a private directory of this user')
+    return os.path.join(base, 'cyserver.sock')
+
+def request(req:dict, path:'str|None'=None):
+    '''
+    sends one request to the cyserver listening on path and returns its
+    reply, raises OSError when no server is listening there
+    '''
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path or default_socket())
+        s.sendall(json.dumps(req).encode() + b'\n')
+        s.shutdown(socket.SHUT_WR)
+        with s.makefile('rb') as f:
+            return json.loads(f.readline())
+
+def compile_file(filename:str, source:'str|None'=None, stream:bool=False, arena:bool=False, path:'str|None'=None):
+    '''
+    compiles filename on the server, or source under that name, the reply
+    holds the fields of main.compile_result and cached, true when the
+    server answered from its table of earlier results
+    '''
+    req = {'filename':filename, 'stream':stream, 'arena':arena}
+    if source is None: req['path'] = os.path.abspath(filename)
+    else: req['source'] = source
+    return request(req, path)
+
+def main(args:'list[str]'):
+    '''
+    compiles like main.py through the server, in this process when none is
+    listening, and returns the exit status main.py would end with
+    '''
+    stream = '--stream' in args
+    arena = '--arena' in args
+    path = next((a[len('--socket='):] for a in args if a.startswith('--socket=')), None)
+    filenames = [a for a in args if not a.startswith('--')]
+    status = 0
+    for filename in filenames:
+        try: r = compile_file(filename, stream=stream, arena=arena, path=path)
+        except OSError:
+            import main # no server, compile cold
+            r = vars(main.compile_file(filename, stream, arena=arena))
+        print(r['output'], end='')
+        if not r['ok']: status = -1
+    return status
+
+if __name__ == "__main__":
+    exit(main(sys.argv[1:]))
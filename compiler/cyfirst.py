@@ -0,0 +1,156 @@
+# cyfirst.py
+import os
+import re
+import cylexer as lex
+
+grammar = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'py.bnf')
+
+# token names of the grammar, the lexer never makes a TYPE_COMMENT
+tokens = {
+    'NAME': lex.idftok, 'NUMBER': lex.numtok, 'STRING': lex.strtok,
+    'NEWLINE': lex.tabtok, 'INDENT': lex.indtok, 'DEDENT': lex.dedtok,
+    'ENDMARKER': lex.endtok}
+keywords = {'ASYNC': 'async', 'AWAIT': 'await'}
+
+bnfpat = re.compile(r'''
+    (?P<spc>\s+|\#[^\n]*)
+    |(?P<str>'[^']*'|"[^"]*")
+    |(?P<idf>[_a-zA-Z][_a-zA-Z0-9]*)
+    |(?P<ops>[|()\[\]*+?&!~.,])
+    |(?P<bad>.)''', re.X)
+rulepat = re.compile(r'^([_a-z][_a-z0-9]*)[ \t]*:', re.M)
+
+def readbnf(filename:str=grammar):
+    '''
+    the rules of a PEG grammar file as name to a tree of its body,
+    nodes are ('alt', ...), ('seq', ...), ('opt', x), ('rep', x),
+    ('rep1', x), ('gather', sep, x), ('look', x), ('not', x), ('tok', kind),
+    ('lit', str), ('soft', str) for double quoted soft keywords and
+    ('rule', name), cuts are dropped
+    '''
+    with open(filename, 'r') as f:
+        text = f.read()
+    heads = list(rulepat.finditer(text))
+    rules:'dict[str, tuple]' = {}
+    for head, nxt in zip(heads, heads[1:] + [None]):
+        body = text[head.end():nxt.start() if nxt else len(text)]
+        toks = [(m.lastgroup, m.group()) for m in bnfpat.finditer(body) if m.lastgroup != 'spc']
+        rules[head.group(1)] = bnfbody(toks, head.group(1))
+    return rules
+
+def bnfbody(toks:'list[tuple[str, str]]', name:str):
+    i = 0
+    def peek():
+        return toks[i] if i < len(toks) else ('end', '')
+    def take(text:str):
+        nonlocal i
+        if peek()[1] != text: raise SyntaxError(f'{name}: expected {text!r} at {peek()[1]!r}')
+        i += 1
+
+    def alts():
+        if peek()[1] == '|': take('|')
+        r = [seq()]
+        while peek()[1] == '|':
+            take('|')
+            r.append(seq())
+        return r[0] if len(r) == 1 else ('alt', *r)
+
+    def seq():
+        r = []
+        while peek()[1] not in ('|', ')', ']', ''):
+            r.append(item())
+        return ('seq', *r)
+
+    def item():
+        nonlocal i
+        kind, text = peek()
+        if text in ('&', '!'):
+            i += 1
+            return ('look' if text == '&' else 'not', atom())
+        if text == '~':
+            i += 1
+            return ('seq',)
+        r = atom()
+        if kind == 'str' and peek()[1] == '.': # sep.elem+ gathers
+            i += 1
+            r = ('gather', r, atom())
+            take('+')
+            return r
+        while (text := peek()[1]) in ('*', '+', '?'):
+            i += 1
+            r = ('rep', r) if text == '*' else ('rep1', r) if text == '+' else ('opt', r)
+        return r
+
+    def atom():
+        nonlocal i
+        kind, text = peek()
+        i += 1
+        if text == '(':
+            r = alts()
+            take(')')
+            return r
+        if text == '[':
+            r = alts()
+            take(']')
+            return ('opt', r)
+        if kind == 'str': return ('lit' if text[0] == "'" else 'soft', text[1:-1])
+        if kind == 'idf': return ('tok', text) if text.isupper() else ('rule', text)
+        raise SyntaxError(f'{name}: unexpected {text!r}')
+
+    r = alts()
+    if i != len(toks): raise SyntaxError(f'{name}: unexpected {peek()[1]!r}')
+    return r
+
+def firstsets(rules:'dict[str, tuple]', lang:lex.language=lex.cython):
+    '''
+    the FIRST set of every rule as a mask of the tokens that can start it,
+    -1 (every token) for rules that can match nothing or are not defined
+    '''
+    def termmask(node:tuple):
+        if node[0] == 'tok':
+            name = node[1]
+            if name in keywords: return lang.opmask(keywords[name])
+            return lang.kindmask(tokens[name]) if name in tokens else 0
+        text = node[1]
+        if text in lang.opids: return lang.opmask(text)
+        if re.fullmatch(lex.idfpat, text): return lang.kindmask(lex.idftok) # soft keywords
+        return -1
+
+    first:'dict[str, int]' = {name:0 for name in rules}
+    nullable:'dict[str, bool]' = {name:False for name in rules}
+
+    def walk(node:tuple) -> 'tuple[int, bool]':
+        kind = node[0]
+        if kind == 'seq':
+            mask = 0
+            for sub in node[1:]:
+                m, null = walk(sub)
+                mask |= m
+                if not null: return mask, False
+            return mask, True
+        if kind == 'alt':
+            mask, null = 0, False
+            for sub in node[1:]:
+                m, n = walk(sub)
+                mask, null = mask | m, null or n
+            return mask, null
+        if kind in ('opt', 'rep'): return walk(node[1])[0], True
+        if kind == 'rep1': return walk(node[1])
+        if kind == 'gather': return walk(node[2])
+        if kind in ('look', 'not'): return 0, True
+        if kind == 'rule':
+            if node[1] not in rules: return -1, True
+            return first[node[1]], nullable[node[1]]
+        return termmask(node), False
+
+    changed = True
+    while changed: # left recursion only settles at the fixpoint
+        changed = False
+        for name, body in rules.items():
+            mask, null = walk(body)
+            mask |= first[name]
+            null = null or nullable[name]
+            if (mask, null) != (first[name], nullable[name]):
+                first[name], nullable[name] = mask, null
+                changed = True
+    return {name:-1 if nullable[name] else first[name] for name in rules}
@@ -0,0 +1,191 @@
+# cyfirsts.py
+# generated from py.bnf by cygen.py, edit the grammar and rerun it
+import cylexer as lex
+
+if lex.opnames != ('', '!', '!=', '%', '%=', '&', '&=', '(', ')', '*', '**', '**=', '*=', '+', '+=', ',', '-', '-=', '->', '.', '...', '/', '//', '//=', '/=', ':', ':=', ';', '<', '<<', '<<=', '<=', '<>', '=', '==', '>', '>=', '>>', '>>=', '?', '@', '@=', 'False', 'None', 'True', '[', ']', '^', '^=', 'and', 'as', 'assert', 'async', 'await', 'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'while', 'with', '{', '|', '|=', '}', '~'):
+    raise ImportError('cyfirsts.py was generated for other operators, rerun cygen.py')
+
+# the mask of the tokens that can start each rule, -1 when it can match nothing
+firsts = {
+    'file': 0x13c7ee7c7f83d0000112280,
+    'interactive': 0x1bc7ee7c7f83d0000112280,
+    'eval': 0x3c40a000203c0000112080,
+    'func_type': 0x80,
+    'fstring': 0x3c40a000203c0000112280,
+    'type_expressions': 0x3c40a000203c0000112680,
+    'statements': 0x3c7ee7c7f83d0000112280,
+    'statement': 0x3c7ee7c7f83d0000112280,
+    'statement_newline': 0x1bc7ee7c7f83d0000112280,
+    'simple_stmts': 0x3c4ee585683c0000112280,
+    'simple_stmt': 0x3c4ee585683c0000112280,
+    'compound_stmt': 0x1030024290010000000000,
+    'assignment': 0x38400000003c0000100280,
+    'augassign': 0x100000001024041825850,
+    'global_stmt': 0x10000000000000000,
+    'nonlocal_stmt': 0x400000000000000000,
+    'yield_stmt': 0x1000000000000000000000,
+    'assert_stmt': 0x8000000000000,
+    'del_stmt': 0x400000000000000,
+    'import_stmt': 0x48000000000000000,
+    'import_name': 0x40000000000000000,
+    'import_from': 0x8000000000000000,
+    'import_from_targets': 0x1000000000000000000280,
+    'import_from_as_names': 0x1000000000000000000000,
+    'import_from_as_name': 0x1000000000000000000000,
+    'dotted_as_names': 0x1000000000000000000000,
+    'dotted_as_name': 0x1000000000000000000000,
+    'dotted_name': 0x1000000000000000000000,
+    'if_stmt': 0x20000000000000000,
+    'elif_stmt': 0x800000000000000,
+    'else_block': 0x1000000000000000,
+    'while_stmt': 0x10000000000000000000,
+    'for_stmt': 0x4010000000000000,
+    'with_stmt': 0x20000010000000000000,
+    'with_item': 0x3c40a000203c0000112080,
+    'try_stmt': 0x1000000000000000000000,
+    'except_block': 0x1000000000000000000000,
+    'except_star_block': 0x1000000000000000000000,
+    'finally_block': 0x2000000000000000,
+    'match_stmt': 0x1000000000000000000000,
+    'subject_expr': 0x3c40a000203c0000112280,
+    'case_block': 0x1000000000000000000000,
+    'guard': 0x20000000000000000,
+    'patterns': 0x38400000003c0000010280,
+    'pattern': 0x38400000003c0000010080,
+    'as_pattern': 0x38400000003c0000010080,
+    'or_pattern': 0x38400000003c0000010080,
+    'closed_pattern': 0x38400000003c0000010080,
+    'literal_pattern': 0x28000000001c0000010000,
+    'literal_expr': 0x28000000001c0000010000,
+    'complex_number': 0x2000000000000000010000,
+    'signed_number': 0x2000000000000000010000,
+    'signed_real_number': 0x2000000000000000010000,
+    'real_number': 0x2000000000000000000000,
+    'imaginary_number': 0x2000000000000000000000,
+    'capture_pattern': 0x1000000000000000000000,
+    'pattern_capture_target': 0x1000000000000000000000,
+    'wildcard_pattern': 0x1000000000000000000000,
+    'value_pattern': 0x1000000000000000000000,
+    'attr': 0x1000000000000000000000,
+    'name_or_attr': 0x1000000000000000000000,
+    'group_pattern': 0x80,
+    'sequence_pattern': 0x200000000080,
+    'open_sequence_pattern': 0x38400000003c0000010280,
+    'maybe_sequence_pattern': 0x38400000003c0000010280,
+    'maybe_star_pattern': 0x38400000003c0000010280,
+    'star_pattern': 0x200,
+    'mapping_pattern': 0x40000000000000000000,
+    'items_pattern': 0x38000000001c0000010000,
+    'key_value_pattern': 0x38000000001c0000010000,
+    'double_star_pattern': 0x400,
+    'class_pattern': 0x1000000000000000000000,
+    'positional_patterns': 0x38400000003c0000010080,
+    'keyword_patterns': 0x1000000000000000000000,
+    'keyword_pattern': 0x1000000000000000000000,
+    'return_stmt': 0x8000000000000000000,
+    'raise_stmt': 0x4000000000000000000,
+    'function_def': 0x210010000000000,
+    'function_def_raw': 0x210000000000000,
+    'func_type_comment': 0x8000000000000000000000,
+    'params': 0x1000000000000000000600,
+    'parameters': 0x1000000000000000000600,
+    'slash_no_default': 0x1000000000000000000000,
+    'slash_with_default': 0x1000000000000000000000,
+    'star_etc': 0x600,
+    'kwds': 0x400,
+    'param_no_default': 0x1000000000000000000000,
+    'param_with_default': 0x1000000000000000000000,
+    'param_maybe_default': 0x1000000000000000000000,
+    'param': 0x1000000000000000000000,
+    'annotation': 0x2000000,
+    'default': 0x200000000,
+    'decorators': 0x10000000000,
+    'class_def': 0x80010000000000,
+    'class_def_raw': 0x80000000000000,
+    'block': 0xbc4ee585683c0000112280,
+    'star_expressions': 0x3c40a000203c0000112280,
+    'star_expression': 0x3c40a000203c0000112280,
+    'star_named_expressions': 0x3c40a000203c0000112280,
+    'star_named_expression': 0x3c40a000203c0000112280,
+    'assignment_expression': 0x1000000000000000000000,
+    'named_expression': 0x3c40a000203c0000112080,
+    'annotated_rhs': 0x3c40a000203c0000112280,
+    'expressions': 0x3c40a000203c0000112080,
+    'expression': 0x3c40a000203c0000112080,
+    'lambdef': 0x200000000000000000,
+    'lambda_params': 0x1000000000000000000600,
+    'lambda_parameters': 0x1000000000000000000600,
+    'lambda_slash_no_default': 0x1000000000000000000000,
+    'lambda_slash_with_default': 0x1000000000000000000000,
+    'lambda_star_etc': 0x600,
+    'lambda_kwds': 0x400,
+    'lambda_param_no_default': 0x1000000000000000000000,
+    'lambda_param_with_default': 0x1000000000000000000000,
+    'lambda_param_maybe_default': 0x1000000000000000000000,
+    'lambda_param': 0x1000000000000000000000,
+    'disjunction': 0x3c408000203c0000112080,
+    'conjunction': 0x3c408000203c0000112080,
+    'inversion': 0x3c408000203c0000112080,
+    'comparison': 0x3c400000203c0000112080,
+    'compare_op_bitwise_or_pair': 0x980000001c90000004,
+    'eq_bitwise_or': 0x400000000,
+    'noteq_bitwise_or': 0x4,
+    'lte_bitwise_or': 0x80000000,
+    'lt_bitwise_or': 0x10000000,
+    'gte_bitwise_or': 0x1000000000,
+    'gt_bitwise_or': 0x800000000,
+    'notin_bitwise_or': 0x800000000000000000,
+    'in_bitwise_or': 0x80000000000000000,
+    'isnot_bitwise_or': 0x100000000000000000,
+    'is_bitwise_or': 0x100000000000000000,
+    'bitwise_or': 0x3c400000203c0000112080,
+    'bitwise_xor': 0x3c400000203c0000112080,
+    'bitwise_and': 0x3c400000203c0000112080,
+    'shift_expr': 0x3c400000203c0000112080,
+    'sum': 0x3c400000203c0000112080,
+    'term': 0x3c400000203c0000112080,
+    'factor': 0x3c400000203c0000112080,
+    'power': 0x38400000203c0000100080,
+    'await_primary': 0x38400000203c0000100080,
+    'primary': 0x38400000003c0000100080,
+    'slices': 0x3c40a000203c0002112080,
+    'slice': 0x3c40a000203c0002112080,
+    'atom': 0x38400000003c0000100080,
+    'strings': 0x800000000000000000000,
+    'list': 0x200000000000,
+    'listcomp': 0x200000000000,
+    'tuple': 0x80,
+    'group': 0x80,
+    'genexp': 0x80,
+    'set': 0x40000000000000000000,
+    'setcomp': 0x40000000000000000000,
+    'dict': 0x40000000000000000000,
+    'dictcomp': 0x40000000000000000000,
+    'double_starred_kvpairs': 0x3c40a000203c0000112480,
+    'double_starred_kvpair': 0x3c40a000203c0000112480,
+    'kvpair': 0x3c40a000203c0000112080,
+    'for_if_clauses': 0x4010000000000000,
+    'for_if_clause': 0x4010000000000000,
+    'yield_expr': 0x1000000000000000000000,
+    'arguments': 0x3c40a000203c0000112680,
+    'arg': 0x3c40a000203c0000112280,
+    'args': 0x3c40a000203c0000112680,
+    'kwargs': 0x1000000000000000000600,
+    'starred_expression': 0x200,
+    'kwarg_or_starred': 0x1000000000000000000200,
+    'kwarg_or_double_starred': 0x1000000000000000000400,
+    'star_targets': 0x38400000003c0000100280,
+    'star_targets_list_seq': 0x38400000003c0000100280,
+    'star_targets_tuple_seq': 0x38400000003c0000100280,
+    'star_target': 0x38400000003c0000100280,
+    'target_with_star_atom': 0x38400000003c0000100080,
+    'star_atom': 0x200000000080,
+    'v_single_target': 0x80,
+    'single_target': 0x38400000003c0000100080,
+    'single_subscript_attribute_target': 0x38400000003c0000100080,
+    'del_targets': 0x38400000003c0000100080,
+    'del_target': 0x38400000003c0000100080,
+    'del_t_atom': 0x1000000000200000000080,
+    't_primary': 0x38400000003c0000100080,
+    't_lookahead': 0x200000080080,
+}
@@ -0,0 +1,412 @@
+# cygen.py
+import itertools
+import os
+import re
+import sys
+import cylexer as lex
+import cyfirst
+
+here = os.path.dirname(os.path.abspath(__file__))
+target = os.path.join(here, 'cypyparser.py')
+firsts_target = os.path.join(here, 'cyfirsts.py')
+
+# memorules picks these but 'python cybench.py gen' hits their table
+# entries for under one call in five, cheaper to parse them again
+unmemoized = frozenset({'atom', 'named_expression', 'simple_stmt'})
+
+def alternatives(node:tuple):
+    '''the alternatives of a rule body or group, each a seq'''
+    alts = node[1:] if node[0] == 'alt' else (node,)
+    return [alt if alt[0] == 'seq' else ('seq', alt) for alt in alts]
+
+def leading(alt:tuple):
+    '''the rule an alternative starts with, None when it starts with anything else'''
+    if len(alt) > 1 and alt[1][0] == 'rule': return alt[1][1]
+
+def groups(alts:'list[tuple]'):
+    '''alts split into runs that start with the same rule, and the rule'''
+    runs:'list[tuple[str|None, list[tuple]]]' = []
+    for alt in alts:
+        if (lead := leading(alt)) and runs and runs[-1][0] == lead: runs[-1][1].append(alt)
+        else: runs.append((lead, [alt]))
+    return runs
+
+def leads(node:tuple) -> 'set[str]':
+    '''the rules node can call first, inside groups and loops too'''
+    kind = node[0]
+    if kind == 'rule': return {node[1]}
+    if kind == 'seq': return leads(node[1]) if len(node) > 1 else set()
+    if kind == 'alt': return set().union(*map(leads, node[1:]))
+    if kind in ('opt', 'rep', 'rep1'): return leads(node[1])
+    if kind == 'gather': return leads(node[2])
+    return set()
+
+def reach(rules:'dict[str, tuple]', name:str):
+    '''the rules name can call before it reads a token, through leading rules'''
+    seen:'set[str]' = set()
+    stack = [name]
+    while stack:
+        for lead in leads(rules.get(stack.pop(), ('seq',))):
+            if lead not in seen:
+                seen.add(lead)
+                stack.append(lead)
+    return seen
+
+def unloop(rules:'dict[str, tuple]'):
+    '''
+    rules with indirect left recursion made directly left recursive by
+    inlining the leading rule of the cycle, the generator only grows seeds
+    for rules that start with themselves
+    '''
+    rules = dict(rules)
+    for name in rules:
+        if name not in reach(rules, name): continue
+        for _ in range(len(rules)):
+            alts = alternatives(rules[name])
+            for i, alt in enumerate(alts):
+                if (lead := leading(alt)) and lead != name and name in reach(rules, lead): break
+            else: break
+            alts[i:i + 1] = [('seq', *sub[1:], *alt[2:]) for sub in alternatives(rules[lead])]
+            rules[name] = ('alt', *alts)
+        else: raise SyntaxError(f'{name}: left recursion the generator cannot unroll')
+    return rules
+
+def walk(rules:'dict[str, tuple]'):
+    '''every node of the rules'''
+    stack = list(rules.values())
+    while stack:
+        node = stack.pop()
+        yield node
+        if node[0] not in ('tok', 'lit', 'soft', 'rule'): stack.extend(node[1:])
+
+def memorules(rules:'dict[str, tuple]'):
+    '''
+    the rules worth memoizing, the topmost rules two groups of alternatives
+    of one choice both reach before reading a token, so a failed group
+    leaves the next one a table hit, alternatives in a row that start with
+    the same rule are one group as they share one call
+    '''
+    reaches = {name:reach(rules, name) | {name} for name in rules}
+    memos:'set[str]' = set()
+    for name, body in rules.items():
+        for node in walk({name:body}):
+            if node[0] != 'alt': continue
+            # a left recursive rule grows its seed in a loop and never calls itself
+            firsts = [set().union(*(reaches[r] for r in leads(run[0]) if r in rules))
+                for lead, run in groups(alternatives(node)) if lead != name]
+            for a, b in itertools.combinations(firsts, 2):
+                shared = a & b
+                memos.update(r for r in shared if not any(r in reaches[s] for s in shared if s != r))
+    return memos
+
+def appends(cond:str):
+    '''whether the generated cond can leave kids in k when it fails'''
+    return 'k.append' in cond or '(p, k)' in cond
+
+class generator:
+    '''
+    writes py.bnf as recursive descent rules over cyparser.parser, a rule
+    returns a cytree.syntax_n of the rules it parsed or None with the
+    token restored, so every expression the generator emits either
+    matches or leaves the parser and the kids list k as they were
+    '''
+
+    def __init__(self, rules:'dict[str, tuple]', lang:lex.language=lex.cython):
+        self.lang = lang
+        self.rules = unloop(rules)
+        self.firsts = cyfirst.firstsets(self.rules, lang)
+        self.memos = memorules(self.rules) - unmemoized
+        self.idfbit = lang.kindmask(lex.idftok)
+        # the grammar's keywords the lexer reads as names, NAME must not match them
+        self.keywords = sorted({node[1] for node in walk(self.rules) if node[0] == 'lit'
+            and node[1] not in lang.opids and re.fullmatch(lex.idfpat, node[1])})
+        self.helpers:'list[list[str]]' = []
+
+    ############################################################
+    # tokens
+
+    def tokmask(self, node:tuple) -> 'int|None':
+        '''
+        the mask a token node is matched with, 0 when no token of the lexer
+        can match it, None for soft keywords that match by their text
+        '''
+        if node == ('tok', 'NAME') and self.keywords: return None
+        if node[0] == 'tok': return cyfirst.firstsets({'t':node}, self.lang)['t']
+        if node[1] in self.lang.opids: return self.lang.opmask(node[1])
+        if re.fullmatch(lex.idfpat, node[1]): return None
+        return 0
+
+    def tokset(self, node:tuple) -> 'int|None':
+        '''
+        the mask of a node that is one token out of a set, a token, a choice
+        of single tokens or a rule that is one, None for anything else
+        '''
+        kind = node[0]
+        if kind in ('tok', 'lit', 'soft'): return self.tokmask(node)
+        if kind == 'rule':
+            body = self.rules.get(node[1])
+            return None if body is None or body[0] == 'rule' else self.tokset(body)
+        if kind == 'seq' and len(node) == 2: return self.tokset(node[1])
+        if kind == 'alt':
+            mask = 0
+            for alt in node[1:]:
+                if (m := self.tokset(alt)) is None: return None
+                mask |= m
+            return mask
+
+    def first(self, node:tuple) -> 'tuple[int, bool]':
+        '''the mask of the tokens node can start with and whether it can match nothing'''
+        kind = node[0]
+        if kind == 'rule':
+            mask = self.firsts.get(node[1], 0)
+            return mask, mask == -1
+        if kind in ('tok', 'lit', 'soft'):
+            return self.idfbit if (m := self.tokmask(node)) is None else m, False
+        if kind == 'seq':
+            mask = 0
+            for sub in node[1:]:
+                m, null = self.first(sub)
+                mask |= m
+                if not null: return mask, False
+            return mask, True
+        if kind == 'alt':
+            mask, null = 0, False
+            for sub in node[1:]:
+                m, n = self.first(sub)
+                mask, null = mask | m, null or n
+            return mask, null
+        if kind in ('rep1', 'gather'): return self.first(node[-1])
+        if kind in ('opt', 'rep'): return self.first(node[1])[0], True
+        return 0, True
+
+    def guard(self, node:tuple):
+        '''the mask of the tokens node must start with, -1 when it can match nothing'''
+        mask, null = self.first(node)
+        return -1 if null else mask
+
+    ############################################################
+    # expressions, truthy when they match, restoring the parser when not
+
+    def expr(self, node:tuple, rule:str) -> 'str|None':
+        '''the expression matching node, None when nothing can match it'''
+        kind = node[0]
+        if node == ('tok', 'ENDMARKER'): # the last token, nothing follows it
+            return f'p.tok.bit & {self.tokmask(node):#x}'
+        if node == ('tok', 'NAME') and self.keywords:
+            return f'(p.tok.bit & {self.idfbit:#x} and p.tok.str not in keywords and p.next())'
+        if (mask := self.tokset(node)) is not None or kind in ('tok', 'lit', 'soft'):
+            if mask: return f'(p.tok.bit & {mask:#x} and p.next())'
+            if mask == 0: return None
+            return f"(p.tok.bit & {self.idfbit:#x} and p.tok.str == {node[1]!r} and p.next())"
+        if kind == 'rule':
+            if (call := self.call(node[1])) is None: return None
+            return f'({call} and not k.append(n))'
+        if kind == 'seq' and len(node) == 2: return self.expr(node[1], rule)
+        if kind == 'opt':
+            x = self.expr(node[1], rule)
+            return 'True' if x is None else f'({x} or True)'
+        if kind in ('look', 'not'):
+            if (mask := self.tokset(node[1])):
+                return f'p.tok.bit & {mask:#x}' if kind == 'look' else f'not p.tok.bit & {mask:#x}'
+            if (x := self.expr(node[1], rule)) is None:
+                return None if kind == 'look' else 'True'
+            return self.helper(rule, self.lookahead(x, kind == 'not'))
+        if kind == 'rep':
+            x = self.expr(node[1], rule)
+            return 'True' if x is None else self.helper(rule, self.loop(x, node[1], False))
+        if kind == 'rep1':
+            if (x := self.expr(node[1], rule)) is None: return None
+            return self.helper(rule, self.loop(x, node[1], True))
+        if kind == 'gather':
+            sep, elem = self.expr(node[1], rule), self.expr(node[2], rule)
+            if elem is None: return None
+            return self.helper(rule, self.gather(sep, elem))
+        alts = [a for alt in alternatives(node) if (a := self.seq(alt, rule)) is not None]
+        if not alts: return None
+        return self.helper(rule, self.choice(alts))
+
+    def call(self, name:str):
+        '''a call of rule name setting n, skipped on tokens outside its FIRST set'''
+        if name not in self.rules or not (mask := self.firsts[name]): return None
+        call = f'p.memo_rule({name}_r)' if name in self.memos else f'{name}_r(p)'
+        guard = '' if mask == -1 else f'p.tok.bit & {mask:#x} and '
+        return f'{guard}(n := {call})'
+
+    def seq(self, alt:tuple, rule:str):
+        '''the items of alt joined into one condition, None when it cannot match'''
+        items:'list[str]' = []
+        for sub in alt[1:]:
+            if (x := self.expr(sub, rule)) is None: return None
+            if x != 'True': items.append(x)
+        # tokens and rules test their own FIRST sets
+        if (mask := self.guard(alt)) != -1 and alt[1][0] not in ('tok', 'lit', 'soft', 'rule'):
+            items.insert(0, f'p.tok.bit & {mask:#x}')
+        return ' and '.join(items) or 'True'
+
+    ############################################################
+    # helpers, the groups and loops of a rule as functions of (p, k)
+
+    def helper(self, rule:str, body:'list[str]'):
+        name = f'_{rule}_{len(self.helpers) + 1}'
+        self.helpers.append([f"def {name}(p:parser, k:'list[tree_node]'):", *body])
+        return f'{name}(p, k)'
+
+    def choice(self, alts:'list[str]'):
+        body = ['    tok, nk = p.tok, len(k)']
+        for i, cond in enumerate(alts):
+            if i: body += ['    p.tok = tok', '    del k[nk:]']
+            body += [f'    if {cond}: return True']
+        return body + ['    p.tok = tok', '    del k[nk:]', '    return False']
+
+    def loop(self, x:str, node:tuple, once:bool):
+        body = [f'    if not {x}: return False'] if once else []
+        if (mask := self.tokset(node)):
+            return body + [f'    while p.tok.bit & {mask:#x}: p.next()', '    return True']
+        if self.first(node)[1]: # an item that can match nothing would spin
+            return body + ['    while True:', '        tidx = p.tok.tidx',
+                f'        if not {x} or p.tok.tidx == tidx: return True']
+        return body + [f'    while {x}: pass', '    return True']
+
+    def gather(self, sep:'str|None', elem:str):
+        body = [f'    if not {elem}: return False']
+        if sep is None: return body + ['    return True']
+        return body + ['    while True:', '        tok = p.tok',
+            f'        if not ({sep} and {elem}):', '            p.tok = tok', '            return True']
+
+    def lookahead(self, x:str, negative:bool):
+        return ['    tok, k = p.tok, []', f'    r = {x}', '    p.tok = tok',
+            f'    return {"not r" if negative else "bool(r)"}']
+
+    ############################################################
+    # rules
+
+    def node(self, name:str, start:str='tok'):
+        return f'p.span(p.ast.syntax_n({name!r}, tuple(k)), {start})'
+
+    def alts(self, name:str, alts:'list[tuple]', success:str, base:int=0, indent:str='    '):
+        '''
+        tries alts in order and runs success on the first that matches, an
+        alternative that is just a rule returns that rule's node as it is,
+        alternatives in a row that start with the same rule parse it once,
+        k holds base kids of the caller's
+        '''
+        reset = 'k.clear()' if base == 0 else f'del k[{base}:]'
+        body:'list[str]' = []
+        restore = kept = False # the token and the kids a failed alternative may leave
+        for lead, group in groups(alts):
+            if lead and (len(group) > 1 or len(group[0]) == 2) and self.tokset(group[0][1]) is None:
+                if (cond := self.call(lead)) is None: continue
+                if restore: body += [f'{indent}p.tok = tok', *[f'{indent}{reset}'] * kept]
+                body += [f'{indent}if {cond}:']
+                if len(group) == 1 and base == 0:
+                    body += [f'{indent}    return n']
+                    restore = kept = False # a failed call restores itself
+                    continue
+                body += [f'{indent}    k.append(n)']
+                restore = kept = True
+                # the rest of each alternative, an alternative that is just the rule always matches
+                conds:'list[tuple[str, bool]]' = []
+                for alt in group:
+                    if len(alt) == 2: conds.append(('True', True))
+                    elif (cond := self.seq(('seq', *alt[2:]), name)) is not None: conds.append((cond, False))
+                    if conds and conds[-1][0] == 'True': break
+                if len(conds) > 1: body += [f'{indent}    after = p.tok']
+                for i, (cond, bare) in enumerate(conds):
+                    if i: body += [f'{indent}    p.tok = after', *[f'{indent}    del k[{base + 1}:]'] * appends(conds[i-1][0])]
+                    if cond != 'True': body += [f'{indent}    if {cond}:', f'{indent}        {success}']
+                    elif bare and base == 0: body += [f'{indent}    return k[0]']
+                    else: body += [f'{indent}    {success}']
+                if conds and conds[-1][0] == 'True': restore = False
+                continue
+            for alt in group:
+                if (cond := self.seq(alt, name)) is None: continue
+                if restore: body += [f'{indent}p.tok = tok', *[f'{indent}{reset}'] * kept]
+                body += [f'{indent}if {cond}:', f'{indent}    {success}']
+                restore, kept = True, appends(cond)
+        if restore: body += [f'{indent}p.tok = tok']
+        return body
+
+    def rule(self, name:str):
+        alts = alternatives(self.rules[name])
+        seeds = [alt for alt in alts if leading(alt) != name]
+        head = [f'def {name}_r(p:parser):']
+        if len(seeds) == len(alts):
+            return [*head, '    tok, k = p.tok, []', *self.alts(name, alts, f'return {self.node(name)}')]
+        # left recursive, the seed grows by a tail of a recursive alternative per loop
+        lead = seeds[0][1] if len(seeds) == 1 and len(seeds[0]) == 2 else ('seq',)
+        if lead[0] == 'rule' and self.tokset(lead) is None and (call := self.call(lead[1])):
+            grow = [f'    if not ({call}): return', '    left = n'] # the seed is that rule's node
+        else:
+            seed = f'_{name}_seed'
+            self.helpers.append([f'def {seed}(p:parser):', '    tok, k = p.tok, []',
+                *self.alts(name, seeds, f'return {self.node(name)}')])
+            grow = [f'    if not (left := {seed}(p)): return']
+        tails = [('seq', *alt[2:]) for alt in alts if leading(alt) == name]
+        # most seeds grow no further, a token no tail starts with ends the loop at once
+        masks = list(map(self.guard, tails))
+        mask = 0
+        for m in masks: mask |= m
+        stop = [] if -1 in masks else [f'        if not p.tok.bit & {mask:#x}: return left']
+        return [*head, '    start = p.tok', *grow, '    while True:',
+            *stop, '        tok, k = p.tok, [left]',
+            *self.alts(name, tails, f'left = {self.node(name, "start")}; continue', 1, '        '),
+            '        return left']
+
+    def generate(self):
+        out = ['# cypyparser.py',
+            '# generated from py.bnf by cygen.py, edit the grammar and rerun it',
+            'from cyparser import parser',
+            'from cytree import tree_node',
+            'import cylexer as lex',
+            '',
+            f'if lex.opnames != {self.lang.opnames!r}:',
+            "    raise ImportError('cypyparser.py was generated for other operators, rerun cygen.py')",
+            '', f'keywords = frozenset({self.keywords!r})']
+        for name in self.rules:
+            self.helpers = []
+            out += ['', '', *self.rule(name)]
+            for h in self.helpers: out += ['', *h]
+        out += ['', '', 'def parse(p:parser):',
+            "    '''file_r past the newline the lexer starts every file with'''",
+            '    if p.nextnewline(): return file_r(p)']
+        return '\n'.join(out) + '\n'
+
+def firstsmodule(rules:'dict[str, tuple]', lang:lex.language=lex.cython):
+    '''the FIRST sets of rules as the module cyparser.first reads at import'''
+    out = ['# cyfirsts.py',
+        '# generated from py.bnf by cygen.py, edit the grammar and rerun it',
+        'import cylexer as lex',
+        '',
+        f'if lex.opnames != {lang.opnames!r}:',
+        "    raise ImportError('cyfirsts.py was generated for other operators, rerun cygen.py')",
+        '',
+        '# the mask of the tokens that can start each rule, -1 when it can match nothing',
+        'firsts = {']
+    out += [f'    {name!r}: {mask:#x},' if mask >= 0 else f'    {name!r}: -1,'
+        for name, mask in cyfirst.firstsets(rules, lang).items()]
+    return '\n'.join(out + ['}']) + '\n'
+
+def generate(filename:str=cyfirst.grammar, out:str=target, firsts_out:str=firsts_target):
+    '''what generating from filename writes, by path'''
+    rules = cyfirst.readbnf(filename)
+    return {out:generator(rules).generate(), firsts_out:firstsmodule(rules)}
+
+def stale(filename:str=cyfirst.grammar, out:str=target, firsts_out:str=firsts_target):
+    '''whether a module on disk is not what generating from filename writes'''
+    for path, text in generate(filename, out, firsts_out).items():
+        try:
+            with open(path, 'r') as f:
+                if f.read() != text: return True
+        except FileNotFoundError: return True
+    return False
+
+def main(filename:str=cyfirst.grammar, out:str=target, firsts_out:str=firsts_target):
+    for path, text in generate(filename, out, firsts_out).items():
+        with open(path, 'w') as f:
+            f.write(text)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    # --check only tells whether the modules on disk are out of date
+    if '--check' in args: exit(1 if stale(*(a for a in args if a != '--check')) else 0)
+    main(*args)
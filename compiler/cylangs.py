@@ -0,0 +1,32 @@
+# cylangs.py
+import cylexer as lex
+
+# the keywords and operators c.bnf uses
+c_keywords = {
+    'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do',
+    'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if',
+    'int', 'long', 'register', 'return', 'short', 'signed', 'sizeof', 'static',
+    'struct', 'switch', 'typedef', 'union', 'unsigned', 'void', 'volatile', 'while'}
+
+c_operators = {
+    '>>=', '<<=', '...',
+    '||', '|=', '^=', '>>', '>=', '==', '<=', '<<',
+    '/=', '->', '-=', '--', '+=', '++', '*=', '&=', '&&', '%=', '!=',
+    '~', '}', '|', '{', '^', ']', '[', '?', '>', '=', '<', ';', ':',
+    '/', '.', '-', ',', '+', '*', ')', '(', '&', '%', '!'}
+
+# floating constants first so 1.5 and .5 are not split at the dot
+c_numpat = (r'(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?[fFlL]?|[0-9]+[eE][+-]?[0-9]+[fFlL]?'
+    r'|0[xX][0-9a-fA-F]+[uUlL]*|0[bB][01]+|[0-9]+[uUlL]*')
+
+# string and character constants, wide ones with an L prefix
+c_strpat = r'L?(?P<quote>"|\')'
+
+c = lex.language('c', c_keywords, c_operators, c_numpat, c_strpat,
+    '//', ('/*', '*/'), directive='#')
+
+# d.bnf is a variant of the c.bnf grammar with the same terminals
+d = lex.language('d', c_keywords, c_operators, c_numpat, c_strpat,
+    '//', ('/*', '*/'), directive='#')
+
+languages = {lang.name: lang for lang in (lex.cython, c, d)}
@@ -1,13 +1,18 @@
 # cylexer.py
 import re
-from dataclasses import dataclass
+from mmap import mmap
+from bisect import bisect_left, bisect_right
+from array import array
+from math import isqrt
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NoReturn
+if TYPE_CHECKING: from cycache import tokcache
 
-nwlpat = re.compile(r'(\#[^\n]*| |\n)*\n')
 spcpat = re.compile(r' +')
 idfpat = re.compile(r'[_a-zA-Z][_a-zA-Z0-9]*')
 numpat = re.compile(r'0(x|X)[0-9a-fA-F]+|0(b|B)[01]+|0[0-7]*|[0-9]+')
 badpat = re.compile(r'.')
-strpat = re.compile(r"\"|\'|\'\'\'")
+strpat = re.compile(r'(?:[rR][bBfF]?|[bBfF][rR]?)?(?P<quote>\'\'\'|"""|\'|")')
 
 opsset = [
     '!', '?', '|', '&', '/', '{', '=', '<<=',
@@ -30,13 +35,117 @@ keywords = {'raise', 'continue', 'as', 'in', 'is', 'else',
     'async', 'global', 'elif', 'break', 'await', 'not',
     'import', 'await', 'not', 'import', 'assert', 'if', 'from'}
 
+class language:
+    '''
+    the lexing table of a front end, its keywords, operators, number and
+    string forms and comment syntax, and whether newlines and indentation
+    are tokens, compiled into the master patterns the lexer runs
+    '''
+
+    def __init__(self, name:str, keywords:'Iterable[str]', operators:'Iterable[str]',
+            numpat:str, strpat:str, line_comment:str, block_comment:'tuple[str, str]|None'=None,
+            indent:bool=False, directive:'str|None'=None):
+        self.name = name
+        self.keywords = frozenset(keywords)
+        self.operators = sorted(set(operators), key=len, reverse=True) # longest match first
+        self.indent = indent
+
+        # every operator and keyword gets a small id, 0 is left for other tokens
+        self.opnames = ('', *sorted(set(self.operators) | self.keywords))
+        assert len(self.opnames) <= 256, f'{name}: toktable keeps operator ids in one byte'
+        self.opids = {op:i for i,op in enumerate(self.opnames) if op}
+        self.opbits = (0, *(1 << i for i in range(1, len(self.opnames))))
+        # line breaks inside brackets are not newlines, only tracked when those are tokens
+        self.brackets = {self.opids[op]:d for ops,d in (('([{', 1), (')]}', -1))
+            for op in ops if op in self.opids} if indent else {}
+
+        lc = re.escape(line_comment)
+        alts:'list[tuple[str, str]]' = []
+        if indent:
+            self.nwlpat = re.compile(rf'({lc}[^\n]*| |\n)*(\n|\Z)') # the end of the buffer ends a line too
+            alts.append(('tab', self.nwlpat.pattern + '(?P<ind> *)'))
+            alts.append(('str', strpat))
+            alts.append(('spc', ' +'))
+        else:
+            bc = f'|{re.escape(block_comment[0])}(?s:.*?){re.escape(block_comment[1])}' if block_comment else ''
+            alts.append(('spc', rf'(?:[ \t\n\r\f\v]+|{lc}[^\n]*{bc})+'))
+            if block_comment: alts.append(('cmt', re.escape(block_comment[0]))) # one spc could not close
+            alts.append(('str', strpat))
+        alts.append(('idf', idfpat.pattern))
+        alts.append(('num', numpat))
+        alts.append(('ops', '|'.join(map(re.escape, self.operators))))
+        if directive: alts.append(('dir', re.escape(directive) + r'[^\n]*'))
+        if not indent: alts.append(('end', r'\Z'))
+        alts.append(('bad', badpat.pattern))
+
+        # one alternation, the first alternative that matches wins
+        self.tokpat = re.compile('|'.join(f'(?P<{kind}>{pat})' for kind,pat in alts))
+        # the first line has no newline before it
+        self.headpat = re.compile(f'(?P<tab>(?:{self.nwlpat.pattern})?(?P<ind> *))') if indent else self.tokpat
+        self.strpats = lexpats(self, str)
+        self.bytepats = lexpats(self, str.encode)
+
+    def pats(self, file:'str|bytes|mmap'):
+        return self.strpats if isinstance(file, str) else self.bytepats
+
+    def opmask(self, *ops:str):
+        '''
+        precompiles ops into a mask for the parser's getop/nextop,
+        ops the lexer never produces match nothing
+        '''
+        mask = 0
+        for op in ops: mask |= self.opbits[self.opids.get(op, 0)]
+        return mask
+
+    def kindmask(self, *types:'type[lextok]'):
+        '''
+        mask of the tokens of types that are not operators or keywords,
+        their bits sit above the operator bits so masks of both can mix
+        '''
+        mask = 0
+        for t in types: mask |= 1 << (len(self.opnames) + tokkinds[t])
+        return mask
+
+class lexpats:
+    '''
+    a language's master patterns and operator ids
+    for one type of lexing buffer, str or bytes
+    '''
+
+    def __init__(self, lang:language, enc:'Callable[[str], str|bytes]'):
+        self.tokpat = re.compile(enc(lang.tokpat.pattern))
+        self.headpat = re.compile(enc(lang.headpat.pattern))
+        self.opids = {enc(op):i for op,i in lang.opids.items()}
+        self.nwl = enc('\n')
+        self.bsl = enc('\\')[0] # what indexing the buffer gives for a backslash
+
+cython = language('cython', keywords, opsset, numpat.pattern, strpat.pattern, '#', indent=True)
+opnames, opids, opbits = cython.opnames, cython.opids, cython.opbits
+opmask, kindmask = cython.opmask, cython.kindmask
+nwlpat, tokpat, headpat = cython.nwlpat, cython.tokpat, cython.headpat
+
+class compile_error(Exception):
+    '''
+    a lexer or parser error, str() is the report naming the file
+    and line with a caret under the failing char and the message
+    '''
+
 @dataclass
 class lextok:
     str:str
     slen:int
     tidx:int
-    lnum:int
-    lidx:int
+    fidx:int # where the token starts in the lexing buffer
+    lines:'lexer' = field(repr=False, compare=False)
+    bit:int = 0 # opbits of the operator or keyword, else the kindmask bit of its type
+
+    @property
+    def lnum(self):
+        return self.lines.lnum(self.fidx)
+
+    @property
+    def lidx(self):
+        return self.lines.lidx(self.fidx)
 
 class strtok(lextok): pass
 class idftok(lextok): pass
@@ -44,111 +153,477 @@ class numtok(lextok): pass
 class opstok(lextok): pass
 class tabtok(lextok): pass
 class endtok(lextok): pass
+class dirtok(lextok): pass
+class indtok(lextok): pass
+class dedtok(lextok): pass
+
+toktypes:'tuple[type[lextok], ...]' = (strtok, idftok, numtok, opstok, tabtok, endtok, dirtok, indtok, dedtok)
+tokkinds = {t:kind for kind,t in enumerate(toktypes)}
+tabkind, indkind, dedkind = tokkinds[tabtok], tokkinds[indtok], tokkinds[dedtok]
+
+class tailshifts:
+    '''
+    offsets an edit moved, kept as breakpoints instead of rewriting every
+    row after the edit, row i of a column is off by deltas[m] for the last
+    breakpoint rows[m] at or before it, or by nothing before the first one,
+    the columns are rewritten once there are more breakpoints than the
+    square root of their length
+    '''
+
+    def __init__(self):
+        self.rows = array('q')
+        self.deltas = array('q')
+
+    def at(self, i:int):
+        m = bisect_right(self.rows, i)
+        return self.deltas[m-1] if m else 0
+
+    def get(self, col:array, i:int):
+        return col[i] + self.at(i) if self.rows else col[i]
+
+    def bisect(self, col:array, x:int, right:bool=False):
+        '''
+        bisect_left or bisect_right of x in the shifted col, the first rows
+        of the runs between breakpoints are bisected before the run holding x
+        '''
+        rows, deltas = self.rows, self.deltas
+        lo, hi = 0, len(rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            v = col[rows[mid]] + deltas[mid]
+            if v < x or right and v == x: lo = mid + 1
+            else: hi = mid
+        start, d = (rows[lo-1], deltas[lo-1]) if lo else (0, 0)
+        end = rows[lo] if lo < len(rows) else len(col)
+        return (bisect_right if right else bisect_left)(col, x - d, start, end)
+
+    def splice(self, i:int, j:int, n:int, delta:int, cols:'tuple[array, ...]'):
+        '''
+        rows i to j of cols were replaced by n rows holding their offsets
+        less at(i), the rows after them moved by delta
+        '''
+        rows, deltas = self.rows, self.deltas
+        a, b = bisect_right(rows, i), bisect_right(rows, j)
+        dj = (deltas[b-1] if b else 0) + delta
+        moved = n - (j - i)
+        self.rows = rows[:a] + array('q', map(moved.__add__, rows[b:]))
+        self.deltas = deltas[:a] + array('q', map(delta.__add__, deltas[b:]))
+        while a and self.rows[a-1] == i + n: # the replaced rows were all dropped
+            a -= 1
+            del self.rows[a], self.deltas[a]
+        if dj != (self.deltas[a-1] if a else 0) and i + n < len(cols[0]):
+            self.rows.insert(a, i + n)
+            self.deltas.insert(a, dj)
+        if len(self.rows) > isqrt(len(cols[0])): self.fold(cols)
+
+    def fold(self, cols:'tuple[array, ...]'):
+        rows, deltas = self.rows, self.deltas
+        for m, d in enumerate(deltas):
+            s, e = rows[m], rows[m+1] if m + 1 < len(rows) else len(cols[0])
+            for col in cols:
+                col[s:e] = array('q', map(d.__add__, col[s:e]))
+        self.rows, self.deltas = array('q'), array('q')
+
+class toktable:
+    '''
+    token columns over the shared lexing buffer,
+    lextok objects are only created when a token is indexed
+    '''
+
+    def __init__(self, lines:'lexer'):
+        self.lines = lines
+        self.file = lines.file
+        self.decode = not isinstance(self.file, str)
+        self.opnames, self.opbits = lines.lang.opnames, lines.lang.opbits
+        self.kindbits = tuple(map(lines.lang.kindmask, toktypes))
+        self.kinds = array('B')
+        self.fidxs = array('q')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.ops = array('B')
+        self.shifts = tailshifts() # of fidxs, starts and ends after edits
+
+    def cols(self):
+        return self.kinds, self.fidxs, self.starts, self.ends, self.ops
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, tidx:int) -> lextok:
+        return self.maketok(tidx, tidx)
+
+    def maketok(self, i:int, tidx:int) -> lextok:
+        '''
+        lextok for row i of the columns, operators and keywords take their
+        text from opnames so only other tokens slice and decode the buffer
+        '''
+        t = toktypes[kind := self.kinds[i]]
+        d = self.shifts.at(i) if self.shifts.rows else 0
+        if op := self.ops[i]: pat, bit = self.opnames[op], self.opbits[op]
+        else:
+            if t is endtok: pat = "EOF"
+            else:
+                pat = self.file[self.starts[i]+d:self.ends[i]+d]
+                if self.decode: pat = pat.decode()
+            bit = self.kindbits[kind]
+        return t(pat, len(pat), tidx, self.fidxs[i] + d, self.lines, bit)
+
+    def __iter__(self):
+        for tidx in range(len(self.kinds)):
+            yield self[tidx]
+
+    def append(self, t:type[lextok], fidx:int, start:int, end:int, op:int):
+        self.kinds.append(tokkinds[t])
+        self.fidxs.append(fidx)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.ops.append(op)
+
+    def pop(self):
+        for col in self.cols():
+            del col[-1]
+
+    def release(self, tidx:int):
+        pass
+
+    def blocks(self, tidx:int, floor:int=0, below:'list[int]|None'=None):
+        '''
+        the block stack before token tidx, the widths of the INDENTs still
+        open there, a NEWLINE to an unindented line closed all before it,
+        the scan stops at token floor when the stack there is below
+        '''
+        kinds, starts, ends = self.kinds, self.starts, self.ends
+        widths:'list[int]' = []
+        closed = 0
+        for i in range(tidx - 1, floor - 1, -1):
+            kind = kinds[i]
+            if kind == dedkind: closed += 1
+            elif kind == indkind:
+                if closed: closed -= 1
+                else: widths.append(ends[i] - starts[i])
+            elif kind == tabkind and ends[i] == starts[i]: break
+        else:
+            if below: return below[:len(below)-closed] + widths[::-1]
+        return [0, *reversed(widths)]
+
+class tokstream(toktable):
+    '''
+    toktable that lexes on demand and only keeps the window
+    of tokens from the last released index onwards
+    '''
+
+    def __init__(self, lines:'lexer', scan:'Iterator[None]'):
+        super().__init__(lines)
+        self.scan = scan
+        self.base = 0 # tidx of the first token in the window
+        self.peak = 0 # largest window seen, in tokens
+
+    def __len__(self):
+        return self.base + len(self.kinds)
+
+    def __getitem__(self, tidx:int) -> lextok:
+        while tidx >= self.base + len(self.kinds):
+            if next(self.scan, True): raise IndexError(tidx)
+        if tidx < self.base:
+            raise IndexError(f'token {tidx} was released')
+        return self.maketok(tidx - self.base, tidx)
+
+    def release(self, tidx:int):
+        self.peak = max(self.peak, len(self.kinds))
+        drop = tidx - self.base
+        if drop > len(self.kinds) // 2: # compact once half the window is dead
+            for col in self.cols():
+                del col[:drop]
+            self.base = tidx
+
+def joinlines(file:'str|bytes|mmap'):
+    '''
+    joins continuation lines and returns the joined text with the start
+    and end offset of every line in it, the start table has one more entry
+    for the line after the last newline
+    '''
+    nwl, cont = ('\n', '\\\n') if isinstance(file, str) else (b'\n', b'\\\n')
+    bsl = cont[0] # what indexing the buffer gives for a backslash
+    ls_fidxs = array('q', [0])
+    le_fidxs = array('q')
+    ls, le = ls_fidxs.append, le_fidxs.append
+    find = file.find
+    fidx = find(nwl)
+
+    if find(cont) < 0:
+        while fidx >= 0:
+            le(fidx)
+            fidx = find(nwl, fidx + 1)
+        ls_fidxs.extend(map((1).__add__, le_fidxs))
+        return file, ls_fidxs, le_fidxs
+
+    shift = 0 # chars removed by joined lines so far
+    while fidx >= 0:
+        if fidx and file[fidx-1] == bsl:
+            shift += 2
+            le(fidx + 1 - shift)
+        else: le(fidx - shift)
+        ls(fidx + 1 - shift)
+        fidx = find(nwl, fidx + 1)
+    if isinstance(file, mmap): file = bytes(file) # joining copies anyway
+    return file.replace(cont, cont[:0]), ls_fidxs, le_fidxs
+
+def normalize(file:'str|bytes|mmap'):
+    '''
+    joins continuation lines and returns the lexing buffer with the start
+    and end offset of every source line in it, the buffer is file itself
+    when nothing is joined, line 0 stands for the missing newline before
+    the first line so line numbers start at 1
+    '''
+    file, ls_fidxs, le_fidxs = joinlines(file)
+    le_fidxs.append(len(file))
+    return file, array('q', [-1]) + ls_fidxs, array('q', [-1]) + le_fidxs
 
 class lexer:
 
-    def __init__(self, filename:str, file:str):
+    def __init__(self, filename:str, file:'str|bytes|mmap', stream:bool=False,
+            cache:'tokcache|None'=None, lang:language=cython):
+        '''
+        lexes file in lang, a str or a bytes like buffer such as an mmap
+        is lexed in place with bytes patterns, offsets are then in bytes,
+        a cycache.tokcache reuses the tokens of a buffer lexed before
+        '''
         self.filename = filename
-        file = '\n' + file + '\n\n\\'
         self.fidx_end = 0
-        self.file = str()
-        self.lines:'list[str]' = []
-
-        fidx = 0
-        self.ls_fidxs:'list[int]' = []
-        self.le_fidxs:'list[int]' = []
-        for line in file.split('\n'):
-            self.ls_fidxs.append(fidx)
-            if line and line[-1] == '\\':
-                subline = line[:-1]
-                fidx += len(subline)
-                tfidx = fidx
-                self.file += subline
-            else:
-                tfidx = fidx + len(line)
-                self.file += line + '\n'
-                fidx = tfidx+1
-            self.le_fidxs.append(tfidx)
-            self.lines.append(line)
+        self.file, self.ls_fidxs, self.le_fidxs = normalize(file)
+        self.lshifts = tailshifts() # of ls_fidxs and le_fidxs after edits
+        self.lang = lang
+        self.pats = lang.pats(self.file)
 
         self.filelen = len(self.file)
-        self.lnum = 0 # changes with iterator
+        self.last_lnum = 0 # last line found by lnum
         self.tidx = 0 # changes with iterator
-        self.fidx_start = -1 # changes with iterator
-
-        def gettoks():
-            while self.fidx_start < self.fidx_end:
-                self.fidx_start = self.fidx_end
-                if info := self.strpat(): yield info
-                elif info := self.tabpat(): yield info
-                elif info := self.spcpat(): pass
-                elif info := self.idfpat(): yield info
-                elif info := self.opspat(): yield info
-                elif info := self.numpat(): yield info
-                elif info := self.badpat(): yield info
-                else:
-                    yield self.next(endtok, "EOF", self.filelen)
+        self.fidx_start = -1 # changes with iterator, -1 before the first line
+        self.indents = [0] # widths of the open blocks, changes with iterator
+        self.depth = 0 # open brackets, changes with iterator
+
+        if stream:
+            self.toks = tokstream(self, self.gettoks())
+        else:
+            self.toks = toktable(self)
+            if cache and cache.load(self): return
+            for _ in self.gettoks(): pass
+            if cache: cache.store(self)
+
+    def gettoks(self) -> 'Iterator[None]':
+        file, filelen = self.file, self.filelen
+        match, opids, brackets = self.pats.tokpat.match, self.pats.opids, self.lang.brackets
+        pat = self.pats.headpat if self.fidx_start < 0 else self.pats.tokpat
+        self.fidx_start = self.fidx_end
+        m = pat.match(file, self.fidx_end)
+        while True:
+            kind = m.lastgroup
+            if kind == 'spc':
+                self.fidx_end = m.end()
+            elif kind == 'tab':
+                s,e = m.span('ind')
+                if self.depth and e < filelen: self.fidx_end = e # inside brackets
+                else: self.newline(s, e)
+                if e == filelen: # the last line is done, its newline closed every block
+                    yield
+                    self.fidx_start = e
+                    self.next(endtok, e, e, e)
+                    yield
                     return
-            self.error("lexer no move", self.lnum, self.lidx_start())
-        self.toks = tuple(gettoks())
+            elif kind == 'str':
+                e = self.strend(m.end(), m.group('quote'))
+                self.next(strtok, self.fidx_start, e, e)
+            elif kind == 'idf':
+                s,e = m.span()
+                op = opids.get(m.group(), 0) # keywords only
+                self.next(opstok if op else idftok, s, e, e, op)
+            elif kind == 'ops':
+                s,e = m.span()
+                op = opids[m.group()]
+                self.next(opstok, s, e, e, op)
+                if op in brackets: self.depth = max(self.depth + brackets[op], 0)
+            elif kind == 'num':
+                s,e = m.span()
+                self.next(numtok, s, e, e)
+            elif kind == 'end': # languages without tab tokens
+                self.next(endtok, filelen, filelen, filelen)
+                yield
+                return
+            elif kind == 'dir':
+                s,e = m.span()
+                self.next(dirtok, s, e, e)
+            elif kind == 'cmt':
+                self.error("unterminated comment", *self.lnum_lidx(self.fidx_start))
+            else:
+                c = self.text(*m.span())
+                self.error(f"unexpected char '{c}'", *self.lnum_lidx(self.fidx_start))
+            yield
+            self.fidx_start = self.fidx_end
+            m = match(file, self.fidx_end)
+
+    def newline(self, s:int, e:int):
+        '''
+        a NEWLINE token for the line break before the indentation s to e,
+        then the INDENT or DEDENTs that take the block stack to its width,
+        the end of the file has no indentation so it closes every block
+        '''
+        self.next(tabtok, s, e, e)
+        indents, width = self.indents, e - s
+        if width == indents[-1]: return
+        self.fidx_start = e # block tokens sit on the first token of the line
+        if width > indents[-1]:
+            indents.append(width)
+            self.next(indtok, s, e, e)
+            return
+        while width < indents[-1]:
+            indents.pop()
+            self.next(dedtok, e, e, e)
+        if width != indents[-1]:
+            self.error("unindent does not match any outer indentation level", *self.lnum_lidx(e))
+
+    def strend(self, fidx:int, quote:str):
+        '''
+        end of the string literal whose body starts at fidx,
+        a quote only closes it after an even run of backslashes
+        '''
+        file, bsl = self.file, self.pats.bsl
+        find = file.find
+        if len(quote) == 1 and (limit := find(self.pats.nwl, fidx)) >= 0: pass
+        else: limit = self.filelen
+        while (qidx := find(quote, fidx, limit)) >= 0:
+            bidx = qidx
+            while file[bidx-1] == bsl: bidx -= 1
+            if (qidx - bidx) % 2 == 0:
+                return qidx + len(quote)
+            fidx = qidx + 1
+        self.error("unterminated string", *self.lnum_lidx(self.fidx_start))
+
+    def continued(self, lnum:int):
+        get = self.lshifts.get
+        return lnum + 1 < len(self.ls_fidxs) and get(self.le_fidxs, lnum) == get(self.ls_fidxs, lnum+1)
+
+    def rawline(self, lnum:int):
+        if self.continued(lnum): return self.line(lnum) + '\\\n'
+        if lnum + 1 < len(self.ls_fidxs): return self.line(lnum) + '\n'
+        return self.line(lnum) # the text after the last newline
+
+    def edit(self, lstart:int, lend:int, text:str):
+        '''
+        replaces source lines lstart up to lend with text and relexes from
+        the logical line holding the edit until the new tokens line up with
+        the old ones again, returns (tidx, old_end, new_end) when the tokens
+        tidx to old_end were replaced by the tokens tidx to new_end
+        '''
+        toks = self.toks
+        assert not isinstance(toks, tokstream), 'cannot edit a token stream'
+        assert isinstance(self.file, str), 'cannot edit a bytes buffer'
+        nlines = len(self.ls_fidxs)
+        assert 0 < lstart < nlines and lstart <= lend <= nlines, 'edit out of range'
+        if text and text[-1] != '\n': text += '\n'
+
+        # widen the edit to whole logical lines
+        r0, r1 = lstart, lend
+        while self.continued(r0-1): r0 -= 1
+        raw = ''.join(map(self.rawline, range(r0, lstart))) + text
+        raw += ''.join(map(self.rawline, range(lend, r1)))
+        while raw.endswith('\\\n') and r1 < nlines:
+            raw += self.rawline(r1)
+            r1 += 1
+
+        lines = self.lshifts
+        a, b = lines.get(self.ls_fidxs, r0), lines.get(self.ls_fidxs, r1) if r1 < nlines else self.filelen
+        raw, ls_fidxs, le_fidxs = joinlines(raw)
+        if r1 < nlines: del ls_fidxs[-1]
+        else: le_fidxs.append(len(raw)) # the edit runs to the end of the text
+        delta = len(raw) - (b - a)
+        self.file = self.file[:a] + raw + self.file[b:]
+        self.filelen = len(self.file)
+        # only the edited lines are written, the lines after them move lazily
+        base = a - lines.at(r0)
+        self.ls_fidxs[r0:r1] = array('q', map(base.__add__, ls_fidxs))
+        self.le_fidxs[r0:r1] = array('q', map(base.__add__, le_fidxs))
+        lines.splice(r0, r1, len(ls_fidxs), delta, (self.ls_fidxs, self.le_fidxs))
+        self.last_lnum = 0
+
+        # restart on the newline before the edit, no brackets are open there
+        # unless it is the last one, which the end of the file always makes
+        shifts, fidxs = toks.shifts, toks.fidxs
+        t0 = max(shifts.bisect(fidxs, a - 1, right=True) - 1, 0)
+        while t0 and (toks.kinds[t0] != tabkind or shifts.get(toks.ends, t0) == self.filelen - delta): t0 -= 1
+        self.fidx_end = shifts.get(fidxs, t0)
+        self.fidx_start = -1 if t0 == 0 else self.fidx_end
+        below = toks.blocks(t0)
+        self.indents, self.depth = below[:], 0
+        self.toks = new = toktable(self)
+
+        # first old token that can line up, the first line's tab never does
+        j = max(shifts.bisect(fidxs, b), 1)
+        end = a + len(raw) # first char after the edit
+        layout = (tabkind, indkind, dedkind)
+        ntoks = 0
+        for _ in self.gettoks():
+            if len(new) == ntoks: continue
+            ntoks = len(new)
+            # line up on the first token of a line, where the old and
+            # new lexer agree on the blocks and no brackets are open
+            if self.fidx_start < end or ntoks < 2 or new.kinds[-2] not in layout: continue
+            fidx, kind = self.fidx_start - delta, new.kinds[-1]
+            if kind in layout: continue
+            # block tokens share the offset of the token they precede
+            while j < len(toks) and ((f := shifts.get(fidxs, j)) < fidx
+                    or f == fidx and toks.kinds[j] in layout): j += 1
+            if (j < len(toks) and shifts.get(fidxs, j) == fidx and toks.kinds[j] == kind
+                    and toks.kinds[j-1] in layout and toks.blocks(j, t0, below) == self.indents):
+                new.pop()
+                break
+        else: j = len(toks)
+
+        # the new tokens are stored less the shift at t0, the tail moves lazily
+        toks.file = self.file
+        base = -shifts.at(t0)
+        toks.kinds[t0:j], toks.ops[t0:j] = new.kinds, new.ops
+        for col, ncol in zip((fidxs, toks.starts, toks.ends), (new.fidxs, new.starts, new.ends)):
+            col[t0:j] = array('q', map(base.__add__, ncol)) if base else ncol
+        shifts.splice(t0, j, len(new), delta, (fidxs, toks.starts, toks.ends))
+        self.toks = toks
+        self.tidx = len(toks)
+        return t0, j, t0 + len(new)
+
+    def lnum(self, fidx:int):
+        '''
+        line holding the buffer offset fidx,
+        tries the line found last time before bisecting
+        '''
+        if self.lshifts.rows: return self.lshifts.bisect(self.le_fidxs, fidx)
+        lnum, le_fidxs = self.last_lnum, self.le_fidxs
+        if fidx <= le_fidxs[lnum] and (lnum == 0 or fidx > le_fidxs[lnum-1]):
+            return lnum
+        self.last_lnum = lnum = bisect_left(le_fidxs, fidx)
+        return lnum
 
     def lidx(self, fidx:int):
-        return fidx - self.ls_fidxs[self.lnum]
-
-    def lidx_start(self):
-        return self.fidx_start - self.ls_fidxs[self.lnum]
-
-    def error(self, msg:str, lnum:int, lidx:int):
-        print(f'File "{self.filename}", line {lnum}')
-        print(self.lines[lnum])
-        print(' ' * lidx + '^')
-        print(msg)
-        exit(-1)
-
-    def next(self, t:type[lextok], pat:str, end:int):
-        self.fidx_end = end
-        while self.fidx_start > self.le_fidxs[self.lnum]:
-            self.lnum += 1
-        r = t(pat, len(pat), self.tidx, self.lnum, self.lidx(self.fidx_start))
+        return fidx - self.lshifts.get(self.ls_fidxs, self.lnum(fidx))
+
+    def lnum_lidx(self, fidx:int):
+        lnum = self.lnum(fidx)
+        return lnum, fidx - self.lshifts.get(self.ls_fidxs, lnum)
+
+    def text(self, start:int, end:int):
+        text = self.file[start:end]
+        return text if isinstance(text, str) else text.decode(errors='replace')
+
+    def line(self, lnum:int):
+        get = self.lshifts.get
+        return self.text(get(self.ls_fidxs, lnum), get(self.le_fidxs, lnum))
+
+    def error(self, msg:str, lnum:int, lidx:int) -> NoReturn:
+        raise compile_error('\n'.join((
+            f'File "{self.filename}", line {lnum}',
+            self.line(lnum),
+            ' ' * lidx + '^',
+            msg)))
+
+    def next(self, t:type[lextok], start:int, end:int, fidx_end:int, op:int=0):
+        self.fidx_end = fidx_end
+        self.toks.append(t, self.fidx_start, start, end, op)
         self.tidx += 1
-        return r
-
-    def tabpat(self):
-        if m := nwlpat.match(self.file, self.fidx_end):
-            if m2 := spcpat.match(self.file, m.end()):
-                s,e = m2.span()
-                pat = self.file[s:e]
-                return self.next(tabtok, pat, e)
-            return self.next(tabtok, str(), m.end())
-
-    def spcpat(self):
-        if m := spcpat.match(self.file, self.fidx_end):
-            self.fidx_end = m.end()
-            return True
-
-    def opspat(self):
-        if m := opspat.match(self.file, self.fidx_end):
-            s,e = m.span()
-            pat = self.file[s:e]
-            return self.next(opstok, pat, e)
-
-    def strpat(self) -> 'lextok | None':
-        return None
-    def idfpat(self) -> 'lextok | None':
-        if m := idfpat.match(self.file, self.fidx_end):
-            s,e = m.span()
-            pat = self.file[s:e]
-            if pat in keywords:
-                return self.next(opstok, pat, e)
-            return self.next(idftok, pat, e)
-
-    def numpat(self) -> 'lextok | None':
-        if m := numpat.match(self.file, self.fidx_end):
-            s,e = m.span()
-            pat = self.file[s:e]
-            return self.next(numtok, pat, e)
-
-    def badpat(self) -> 'lextok | None':
-        if self.fidx_end < self.filelen:
-            pat = self.file[(s := self.fidx_end)]
-            self.error(f"unexpected char '{pat}'", self.lnum, self.lidx_start())
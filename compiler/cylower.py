@@ -0,0 +1,285 @@
+# cylower.py
+from typing import TYPE_CHECKING, NoReturn
+import cylexer as lex
+import cytree
+from cytree import syntax_n, tree_node
+if TYPE_CHECKING:
+    from cyarena import arena as ast_arena
+
+def lower(lines:lex.lexer, n:syntax_n, arena:'ast_arena|None'=None):
+    '''the nodes cyparsefuns builds for the tree cypyparser parsed from lines'''
+    return lowerer(lines, arena).lower(n)
+
+class lowerer:
+    '''
+    lowers the syntax_n trees of cypyparser into the nodes the rules of
+    cyparsefuns build, the method for a py.bnf rule is its name with _l,
+    a syntax_n keeps the rules it parsed and leaves its tokens to its
+    span, so the tokens between its args are read back from the lexer,
+    nodes are built through ast, cytree objects or handles into arena
+    '''
+
+    def __init__(self, lines:lex.lexer, arena:'ast_arena|None'=None):
+        self.lines = lines
+        self.toks = lines.toks
+        self.arena = arena
+        self.ast = cytree if arena is None else arena
+
+    def error(self, n:syntax_n, msg:str) -> NoReturn:
+        tok = self.toks[n.start]
+        self.lines.error(msg, tok.lnum, tok.lidx)
+
+    def lower(self, n:syntax_n) -> 'tree_node|int':
+        if not (fn := getattr(self, n.rule + '_l', None)):
+            self.error(n, f'"{n.rule}" is Not Implemented')
+        r = fn(n)
+        # spanned by the outermost rule that returned it, as parser.rule does
+        if self.arena is None: r.start, r.end = n.start, n.end
+        else: self.arena.span(r, n.start, n.end)
+        return r
+
+    def parts(self, n:syntax_n) -> 'list[lex.lextok|syntax_n]':
+        '''the args of n and the tokens between them in source order'''
+        parts:'list[lex.lextok|syntax_n]' = []
+        tidx = n.start
+        for a in n.args:
+            parts.extend(map(self.toks.__getitem__, range(tidx, a.start)))
+            parts.append(a)
+            tidx = a.end
+        parts.extend(map(self.toks.__getitem__, range(tidx, n.end)))
+        return parts
+
+    def ops(self, n:syntax_n):
+        '''the text of the tokens n parsed itself'''
+        return [t.str for t in self.parts(n) if isinstance(t, lex.lextok)]
+
+    def each(self, n:syntax_n, *flat:str):
+        '''the args of n lowered, the args of those of rules flat in their place'''
+        for a in n.args:
+            if a.rule in flat: yield from self.each(a, *flat)
+            else: yield self.lower(a)
+
+    def lowered(self, n:syntax_n, *flat:str):
+        return tuple(self.each(n, *flat))
+
+    def tupled(self, n:syntax_n):
+        '''if the args of n are separated or ended by commas'''
+        return len(n.args) > 1 or self.toks[n.end - 1].str == ','
+
+    ############################################################
+    # statements
+
+    def file_l(self, n:syntax_n):
+        if not n.args: self.error(n, 'expected statements')
+        return self.ast.program_n(self.lower(n.args[0]))
+
+    def statements_l(self, n:syntax_n):
+        stmts:'list[tree_node|int]' = []
+        for r in self.each(n):
+            if args := self.ast.statements(r): stmts.extend(args)
+            else: stmts.append(r)
+        return stmts[0] if len(stmts) == 1 else self.ast.statements_n(tuple(stmts))
+
+    def simple_stmts_l(self, n:syntax_n):
+        args = self.lowered(n)
+        return args[0] if len(args) == 1 else self.ast.statements_n(args)
+
+    def simple_stmt_l(self, n:syntax_n):
+        # 'pass', 'break' and 'continue', which the rules leave out too
+        self.error(n, f'"{self.toks[n.start].str}" is Not Implemented')
+
+    def block_l(self, n:syntax_n):
+        return self.lower(n.args[0])
+
+    def if_stmt_l(self, n:syntax_n):
+        test, block, *orelse = n.args
+        false = self.lower(orelse[0]) if orelse else self.ast.pass_n()
+        return self.ast.if_n(self.lower(test), self.lower(block), false)
+
+    elif_stmt_l = if_stmt_l
+    else_block_l = block_l
+
+    ############################################################
+    # assignments
+
+    def assignment_l(self, n:syntax_n):
+        first, *rest = n.args
+        op = self.toks[first.end].str
+        if first.start > n.start and (name := self.toks[n.start].str) != '(': # NAME ':' expression
+            trgt, (hint, *rhs) = self.ast.idf_trgt_n(name), n.args
+        elif op in (':', ')'): # a single target with a hint
+            trgt, (hint, *rhs) = self.lower(first), rest
+        elif op != '=': # augassign, its tokens are inlined
+            return self.ast.binary_op_n(op, self.lower(first), self.lower(rest[0]))
+        else:
+            *trgts, rhs = n.args
+            return self.ast.assignment_n(self.lower(rhs), tuple(map(self.lower, trgts)))
+        h = self.ast.hint_n(trgt, self.lower(hint))
+        return self.ast.assignment_n(self.lower(rhs[0]), (h,)) if rhs else h
+
+    def assignment_expression_l(self, n:syntax_n):
+        trgt = self.ast.idf_trgt_n(self.toks[n.start].str)
+        return self.ast.assignment_n(self.lower(n.args[0]), (trgt,))
+
+    def named_expression_l(self, n:syntax_n):
+        return self.lower(n.args[0])
+
+    def yield_expr_l(self, n:syntax_n):
+        if self.toks[n.start + 1].str == 'from': return self.ast.yield_n(self.ast.star_n(self.lower(n.args[0])))
+        return self.ast.yield_n(self.lower(n.args[0]) if n.args else self.ast.bool_n(None))
+
+    ############################################################
+    # targets
+
+    def star_targets_l(self, n:syntax_n):
+        if self.tupled(n): return self.ast.tuple_trgt_n(self.lowered(n))
+        return self.lower(n.args[0])
+
+    def star_target_l(self, n:syntax_n):
+        return self.ast.star_trgt_n(self.lower(n.args[0]))
+
+    def target_with_star_atom_l(self, n:syntax_n):
+        return self.ast.idf_trgt_n(self.toks[n.start].str)
+
+    single_target_l = target_with_star_atom_l
+
+    def star_atom_l(self, n:syntax_n):
+        if n.args: return self.lower(n.args[0])
+        if self.toks[n.start].str == '[': return self.ast.list_trgt_n(())
+        return self.ast.tuple_trgt_n(())
+
+    def star_targets_tuple_seq_l(self, n:syntax_n):
+        return self.ast.tuple_trgt_n(self.lowered(n))
+
+    def star_targets_list_seq_l(self, n:syntax_n):
+        return self.ast.list_trgt_n(self.lowered(n))
+
+    v_single_target_l = named_expression_l
+
+    def single_subscript_attribute_target_l(self, n:syntax_n):
+        prim = self.lower(n.args[0])
+        if self.toks[n.args[0].end].str == '.': return self.ast.attribute_trgt_n(prim, self.toks[n.end - 1].str)
+        return self.ast.subscript_trgt_n(prim, self.lower(n.args[1]))
+
+    ############################################################
+    # expressions
+
+    def star_expressions_l(self, n:syntax_n):
+        return self.ast.tuple_n(self.lowered(n))
+
+    def star_expression_l(self, n:syntax_n):
+        return self.ast.star_n(self.lower(n.args[0]))
+
+    star_named_expression_l = starred_expression_l = star_expression_l
+
+    def expression_l(self, n:syntax_n):
+        true, test, false = map(self.lower, n.args)
+        return self.ast.if_n(test, true, false)
+
+    def disjunction_l(self, n:syntax_n):
+        return self.ast.or_block_n(self.lowered(n))
+
+    def conjunction_l(self, n:syntax_n):
+        return self.ast.and_block_n(self.lowered(n))
+
+    def inversion_l(self, n:syntax_n):
+        return self.ast.unary_op_n('not', self.lower(n.args[0]))
+
+    def comparison_l(self, n:syntax_n):
+        expr, *pairs = n.args
+        compares = tuple((' '.join(self.ops(pair)), self.lower(pair.args[0])) for pair in pairs)
+        return self.ast.compare_n(self.lower(expr), compares)
+
+    def binary_l(self, n:syntax_n):
+        a, b = n.args
+        op = self.toks[a.end].str
+        return self.ast.binary_op_n(op, self.lower(a), self.lower(b))
+
+    bitwise_or_l = bitwise_xor_l = bitwise_and_l = shift_expr_l = binary_l
+    sum_l = term_l = power_l = binary_l
+
+    def factor_l(self, n:syntax_n):
+        return self.ast.unary_op_n(self.toks[n.start].str, self.lower(n.args[0]))
+
+    def await_primary_l(self, n:syntax_n):
+        return self.ast.await_n(self.lower(n.args[0]))
+
+    def primary_l(self, n:syntax_n):
+        first, *rest = n.args
+        prim = self.lower(first)
+        if first.end == n.end: return prim # atom &t_lookahead
+        if rest and rest[0].start == first.end: # genexp
+            return self.ast.call_n(prim, self.ast.arguments_n((self.lower(rest[0]),)))
+        op = self.toks[first.end].str
+        if op == '.': return self.ast.attribute_ref_n(prim, self.toks[n.end - 1].str)
+        if op == '[': return self.ast.subscript_n(prim, self.lower(rest[0]))
+        return self.ast.call_n(prim, self.lower(rest[0]) if rest else self.ast.arguments_n(()))
+
+    t_primary_l = primary_l
+
+    def arguments_l(self, n:syntax_n):
+        return self.ast.arguments_n(self.lowered(n, 'args', 'kwargs'))
+
+    args_l = kwargs_l = arguments_l
+    arg_l = named_expression_l
+
+    def kwarg_or_starred_l(self, n:syntax_n):
+        if n.args[0].start > n.start + 1: # NAME '=' expression
+            return self.ast.kwarg_n(self.toks[n.start].str, self.lower(n.args[0]))
+        return self.ast.kw_star_n(self.lower(n.args[0])) # '**' expression
+
+    kwarg_or_double_starred_l = kwarg_or_starred_l
+
+    def slices_l(self, n:syntax_n):
+        if self.tupled(n): return self.ast.tuple_n(self.lowered(n))
+        return self.lower(n.args[0])
+
+    def slice_l(self, n:syntax_n):
+        args:'list[tree_node|int|None]' = [None, None, None]
+        i = 0
+        for part in self.parts(n):
+            if isinstance(part, syntax_n): args[i] = self.lower(part)
+            else: i += 1 # a ':'
+        return self.ast.slice_n(*args)
+
+    ############################################################
+    # atoms
+
+    def atom_l(self, n:syntax_n):
+        if n.args: return self.lower(n.args[0]) # a tuple, group or list behind a lookahead
+        tok = self.toks[n.start]
+        if isinstance(tok, lex.idftok): return self.ast.idf_n(tok.str)
+        if isinstance(tok, lex.numtok): return self.ast.int_lit_n(tok.str)
+        if tok.str == '...': return self.ast.ellipsis_n()
+        return self.ast.bool_n(True if tok.str == 'True' else False if tok.str == 'False' else None)
+
+    def strings_l(self, n:syntax_n):
+        return self.ast.string_n(tuple(self.ops(n)))
+
+    def tuple_l(self, n:syntax_n):
+        return self.ast.tuple_n(self.lowered(n, 'star_named_expressions'))
+
+    group_l = named_expression_l
+
+    def list_l(self, n:syntax_n):
+        return self.ast.list_n(self.lowered(n, 'star_named_expressions'))
+
+    def listcomp_l(self, n:syntax_n):
+        g = self.ast.generator_n(self.clauses(n.args[1], self.ast.yield_n(self.lower(n.args[0]))))
+        return self.ast.list_n((self.ast.star_n(g),))
+
+    def genexp_l(self, n:syntax_n):
+        return self.ast.generator_n(self.clauses(n.args[1], self.ast.yield_n(self.lower(n.args[0]))))
+
+    def clauses(self, n:syntax_n, inner:'tree_node|int'):
+        '''
+        the for_if_clauses n around inner, each 'for' holds what follows
+        it and each 'if' skips it with a continue
+        '''
+        for clause in reversed(n.args):
+            trgt, iterable, *tests = clause.args
+            for test in reversed(tests):
+                inner = self.ast.if_n(self.lower(test), inner, self.ast.continue_n())
+            inner = self.ast.for_n(self.lower(trgt), self.lower(iterable), inner)
+            if self.toks[clause.start].str == 'async': inner = self.ast.async_n(inner)
+        return inner
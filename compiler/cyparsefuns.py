@@ -1,16 +1,39 @@
 # cyparsefuns.py
-from dataclasses import dataclass
-from cyparser import parser, todo
+from cyparser import parser, todo, memo, first
 import cylexer as lex
 import cytree as tree
 
 
+############################################################
+# operator masks for p.getop/p.nextop
+semi_op = lex.opmask(';')
+comma_op = lex.opmask(',')
+colon_op = lex.opmask(':')
+eq_op = lex.opmask('=')
+walrus_op = lex.opmask(':=')
+star_op = lex.opmask('*')
+dstar_op = lex.opmask('**')
+dot_op = lex.opmask('.')
+lpar_op, rpar_op = lex.opmask('('), lex.opmask(')')
+lsqb_op, rsqb_op = lex.opmask('['), lex.opmask(']')
+atom_ops = lex.opmask('(','{','[')
+factor_ops = lex.opmask('+','-','~')
+bool_ellipsis_ops = lex.opmask('True','False','None','...')
+if_op, else_op = lex.opmask('if'), lex.opmask('else')
+elif_else_ops = lex.opmask('elif','else')
+for_op, in_op = lex.opmask('for'), lex.opmask('in')
+async_for_ops = lex.opmask('async','for')
+or_op, and_op, not_op = lex.opmask('or'), lex.opmask('and'), lex.opmask('not')
+lambda_op = lex.opmask('lambda')
+await_op = lex.opmask('await')
+yield_op, from_op = lex.opmask('yield'), lex.opmask('from')
+
 ############################################################
 if "file_r: NEWLINE statements_r ~ ENDMARKER":
     def file_r(p:parser):
         if p.nextnewline() and (r := p.rule(statements_r)):
             p.gettok(lex.endtok, "failed to reach end of file")
-            return tree.program_n(r)
+            return p.ast.program_n(r)
 
 
 ############################################################
@@ -21,10 +44,9 @@ block_r:
 """:
     def block_r(p:parser):
         if p.nextnewline():
-            i = p.nextindent()
-            if i is None: p.error('no indent')
+            if not p.nextindent(): p.error('no indent')
             r = p.rule_err(statements_r, 'expected statements after indent')
-            if p.nextdedent(i) and p.nextnewline(): return r
+            if p.nextdedent(): return r
             else: p.error('no dedent after block')
         else: return p.rule(simple_stmts_r)
 
@@ -34,12 +56,13 @@ if "statements_r: statement_r+":
     def statements_r(p:parser):
         if args := tuple(gen_statements(p)):
             if len(args) == 1: return args[0]
-            return tree.statements_n(args)
+            return p.ast.statements_n(args)
 
     def gen_statements(p:parser):
         while r := p.rule(statement_r):
-            if isinstance(r, tree.statements_n):
-                yield from r.exprs
+            p.cut() # statements_r only runs at file level or after a block cut
+            if stmts := p.ast.statements(r):
+                yield from stmts
             else: yield r
 
 
@@ -54,28 +77,30 @@ if "statement_r: compound_stmt_r  | simple_stmts_r":
 
 ############################################################
 if "simple_stmts_r: ';'.simple_stmt_r+ [';'] NEWLINE":
+    @first
     def simple_stmts_r(p:parser):
         if (args := tuple(gen_simple_stmts(p))) and p.nextnewline():
             if len(args) == 1: return args[0]
-            return tree.statements_n(args)
+            return p.ast.statements_n(args)
 
     def gen_simple_stmts(p:parser):
         while r := p.rule(simple_stmt_r):
             yield r
-            if not p.nextop({';'}): break
+            if not p.nextop(semi_op): break
 
 
 ############################################################
 if "identifier_r: NAME":
     def identifier_r(p:parser):
         if name := p.nexttok(lex.idftok):
-            return tree.idf_n(name.str)
+            return p.ast.idf_n(name.str)
 
 
 ############################################################
 if "star_expression_r: '*' bitwise_or_r":
+    @first
     def star_expression_r(p:parser):
-        return p.nextop({'*'}) and p.rule(bitwise_or_r)
+        return p.nextop(star_op) and p.rule(bitwise_or_r)
 
 
 ############################################################
@@ -84,12 +109,13 @@ star_target_r:
     | '*' (!'*' target_with_star_atom)
     | target_with_star_atom_r
 """:
+    @first
     def star_target_r(p:parser):
-        if not p.nextop({'*'}):
+        if not p.nextop(star_op):
             return p.rule(target_with_star_atom_r)
-        elif p.getop({'*'}): return
+        elif p.getop(star_op): return
         elif r := p.rule(target_with_star_atom_r):
-            return tree.star_trgt_n(r)
+            return p.ast.star_trgt_n(r)
 
 
 ############################################################
@@ -99,22 +125,21 @@ star_targets_r:
     | star_target_r (',' star_target_r )* [',']
 """:
     def star_targets_r(p:parser):
-        if (r := p.rule(star_target_r)) and not p.nextop({','}):
-            return r
-        if args := tuple(gen_star_targets(p)):
-            return tree.tuple_trgt_n(args)
+        if (r := p.rule(star_target_r)) and p.nextop(comma_op):
+            return p.ast.tuple_trgt_n((r, *gen_star_targets(p)))
+        return r
 
     def gen_star_targets(p:parser):
-        if r := p.rule(star_target_r):
+        while r := p.rule(star_target_r):
             yield r
-            while p.nextop({','}) and (r := p.rule(star_target_r)):
-                yield r
+            if not p.nextop(comma_op): break
 
 
 ############################################################
 if "v_single_target_r: TODO":
+    @first
     def v_single_target_r(p:parser):
-        return p.ignore_tracking('(', single_target_r, ')')
+        return p.bracketed(lpar_op, single_target_r, rpar_op)
 
 
 ############################################################
@@ -138,61 +163,61 @@ target_with_star_atom_r: TODO
                 p.rule(star_targets_list_seq_r))
 
     def p_target_with_star_atom_r(p:parser):
-        return p.ignore_tracking('(', target_with_star_atom_r, ')')
+        return p.bracketed(lpar_op, target_with_star_atom_r, rpar_op)
 
 
 ############################################################
 if "p_star_targets_tuple_seq_r: TODO":
     def p_star_targets_tuple_seq_r(p:parser):
-        return p.ignore_tracking('(', tuple_seq_r, ')')
+        return p.bracketed(lpar_op, tuple_seq_r, rpar_op)
 
     def tuple_seq_r(p:parser):
         r = p.rule(star_target_r)
-        if not r: return tree.tuple_trgt_n(tuple())
-        if not p.nextop({','}): return
-        return tree.tuple_trgt_n(tuple(gen_tuple_seq(p,r)))
+        if not r: return p.ast.tuple_trgt_n(tuple())
+        if not p.nextop(comma_op): return
+        return p.ast.tuple_trgt_n(tuple(gen_tuple_seq(p,r)))
 
     def gen_tuple_seq(p:parser, r:tree.tree_node):
         yield r
         while r and (r := p.rule(star_target_r)):
             yield r
-            r = p.nextop({','})
+            r = p.nextop(comma_op)
 
 
 ############################################################
 if "star_targets_tuple_seq_r: TODO":
     def star_targets_tuple_seq_r(p:parser):
         if args := tuple(gen_star_targets_tuple_seq(p)):
-            return tree.tuple_n(args)
+            return p.ast.tuple_n(args)
 
     def gen_star_targets_tuple_seq(p:parser):
-        if (r := p.rule(star_target_r)) and (op := p.nextop({','})):
+        if (r := p.rule(star_target_r)) and (op := p.nextop(comma_op)):
             yield r
             while op and (r := p.rule(star_target_r)):
                 yield r
-                op = p.nextop({','})
+                op = p.nextop(comma_op)
 
 
 ############################################################
 if "star_targets_list_seq_r: TODO":
     def star_targets_list_seq_r(p:parser):
-        return p.ignore_tracking('[', targets_r, ']')
+        return p.bracketed(lsqb_op, targets_r, rsqb_op)
 
     def targets_r(p:parser):
         if args := tuple(gen_targets(p)):
-            return tree.list_trgt_n(args)
+            return p.ast.list_trgt_n(args)
 
     def gen_targets(p:parser):
         while r := p.rule(star_target_r):
             yield r
-            if not p.nextop({','}): break
+            if not p.nextop(comma_op): break
 
 
 ############################################################
 if "identifier_target_r: NAME":
     def identifier_target_r(p:parser):
         if t := p.nexttok(lex.idftok):
-            return tree.idf_trgt_n(t.str)
+            return p.ast.idf_trgt_n(t.str)
 
 ############################################################
 if """
@@ -232,13 +257,13 @@ named_assignment_r:
     def named_assignment_r(p:parser):
         if ((t := p.rule(name_target_r))
             and
-            p.nextop({':'})
+            p.nextop(colon_op)
             and
             (h := p.rule(expression_r))):
-            n = tree.hint_n(t, h)
-            if p.nextop({'='}):
+            n = p.ast.hint_n(t, h)
+            if p.nextop(eq_op):
                 expr = p.rule_err(annotated_rhs, "no annotated_rhs after '=' operrator")
-                return tree.assignment_n(expr, (n,))
+                return p.ast.assignment_n(expr, (n,))
             return n
 
 
@@ -255,14 +280,14 @@ if "assignment_list_r: (star_targets_r '=')+ ~ annotated_rhs":
     def assignment_list_r(p:parser):
         if targets := tuple(gen_assign_targets(p)):
             expr = p.rule_err(annotated_rhs, "no expression after '=' operator")
-            return tree.assignment_n(expr, targets)
+            return p.ast.assignment_n(expr, targets)
 
     def gen_assign_targets(p:parser):
         while target := p.rule(assign_target_r):
             yield target
 
     def assign_target_r(p:parser):
-        if (r := p.rule(star_targets_r)) and p.nextop({'='}):
+        if (r := p.rule(star_targets_r)) and p.nextop(eq_op):
             return r
 
 
@@ -271,9 +296,9 @@ if "augassign_r: single_target_r {augassign_op} ~ annotated_rhs":
     def augassign_r(p:parser):
         if (target := p.rule(single_target_r)) and (op := p.nextop(augassign_ops)):
             expr = p.rule_err(annotated_rhs, f"expected argument after '{op.str}' operator")
-            return tree.binary_op_n(op.str, target, expr)
+            return p.ast.binary_op_n(op.str, target, expr)
 
-    augassign_ops = {'+=','-=','*=','@=','/=','%=','&=','|=','^=','<<=','>>=','**=','//=',}
+    augassign_ops = lex.opmask('+=','-=','*=','@=','/=','%=','&=','|=','^=','<<=','>>=','**=','//=')
 
 
 ############################################################
@@ -293,15 +318,14 @@ star_expressions_r:
     | ','.(star_expression_r | expression_r)+ [',']
 """:
     def star_expressions_r(p:parser):
-        if r := p.rule(star_expression_r) or p.rule(expression_r):
-            if args := tuple(gen_star_expressions(p,r)):
-                return tree.tuple_n(args)
-            return r
+        if (r := p.rule(star_expression_r) or p.rule(expression_r)) and p.nextop(comma_op):
+            return p.ast.tuple_n((r, *gen_star_expressions(p)))
+        return r
 
-    def gen_star_expressions(p:parser, r:tree.tree_node):
-        while r and p.nextop({','}):
+    def gen_star_expressions(p:parser):
+        while r := p.rule(star_expression_r) or p.rule(expression_r):
             yield r
-            r = p.rule(star_expression_r) or p.rule(expression_r)
+            if not p.nextop(comma_op): break
 
 
 ############################################################
@@ -335,17 +359,18 @@ def pass_stmt_r(p:parser): pass
 
 ############################################################
 if "yield_expr_r: 'yield' yield_stmt_r":
+    @first
     def yield_expr_r(p:parser):
-        return p.nextop({'yield'}) and p.rule(yield_stmt_r)
+        return p.nextop(yield_op) and p.rule(yield_stmt_r)
 
 ############################################################
 if "yield_stmt_r: 'yield'& ['from' ~ expression_r | star_expressions_r]":
     def yield_stmt_r(p:parser):
-        if p.nextop({'from'}):
+        if p.nextop(from_op):
             r = p.rule_err(expression_r, f"no expression after 'yield from' operator")
-            r = tree.star_n(r)
-        else: r = p.rule(star_expressions_r) or tree.bool_n(None)
-        return tree.yield_n(r)
+            r = p.ast.star_n(r)
+        else: r = p.rule(star_expressions_r) or p.ast.bool_n(None)
+        return p.ast.yield_n(r)
 
 
 ############################################################
@@ -391,7 +416,7 @@ if """
     | 'nonlocal' ~ nonlocal_stmt_r
 """:
     def simple_stmt_r(p:parser):
-        if op := p.nextop(simple_stmt_map.keys()):
+        if op := p.nextop(simple_stmt_ops):
             return p.rule_err(simple_stmt_map[op.str], f'"{op.str}" invalid syntax')
         return p.rule(assignment_r) or p.rule(star_expressions_r)
 
@@ -409,6 +434,7 @@ if """
         'global': global_stmt_r,
         'nonlocal': nonlocal_stmt_r,
     }
+    simple_stmt_ops = lex.opmask(*simple_stmt_map)
 
 
 ############################################################
@@ -442,14 +468,15 @@ def_stmt_r:
 """:
     def def_stmt_r(p:parser):
         if op := p.nextop(def_stmt_ops):
-            return p.rule_err(def_stmt_ops[op.str],
+            return p.rule_err(def_stmt_map[op.str],
                 f"no def_stmt after '{op.str}' operator")
 
-def_stmt_ops = {
+def_stmt_map = {
     '@': decorator_stmt_r,
     'def': function_def_r,
     'class': class_def_r
 }
+def_stmt_ops = lex.opmask(*def_stmt_map)
 
 
 ##############################################################
@@ -460,19 +487,19 @@ else_block_r: 'else'& ~ ':' ~ block
 """:
     def if_stmt_r(p:parser):
         if_test = p.rule_err(named_expression_r, "missing 'if/elif test'")
-        p.nextop({':'}, "missing ':'")
+        p.nextop(colon_op, "missing ':'")
         if_true = p.rule_err(block_r, "missing if block")
 
-        if t := p.nextop({'elif', 'else'}):
+        if t := p.nextop(elif_else_ops):
             if t.str == 'elif':
                 if_false = p.rule(if_stmt_r)
             else:
                 if_false = p.rule(else_block_r)
-        else: if_false = tree.pass_n()
-        return tree.if_n(if_test, if_true, if_false)
+        else: if_false = p.ast.pass_n()
+        return p.ast.if_n(if_test, if_true, if_false)
 
     def else_block_r(p:parser):
-        p.nextop({':'}, "missing ':")
+        p.nextop(colon_op, "missing ':")
         return p.rule_err(block_r, "missing else block")
 
 ############################################################
@@ -523,8 +550,9 @@ if """
     | 'while' ~ while_stmt_r
     | 'match' ~ match_stmt_r
 """:
+    @first
     def compound_stmt_r(p:parser):
-        if op := p.nextop(compound_stmt_map.keys()):
+        if op := p.nextop(compound_stmt_ops):
             err = f'"{op.str}" invalid syntax'
             return p.rule_err(compound_stmt_map[op.str], err)
 
@@ -540,18 +568,21 @@ if """
         'while': while_stmt_r,
         'match': match_stmt_r,
     }
+    compound_stmt_ops = lex.opmask(*compound_stmt_map)
 
 
 ############################################################
 if "assignment_expression_r: identifier_r ':=' ~ expression_r":
+    @first
     def assignment_expression_r(p:parser):
-        if (target := p.rule(identifier_target_r)) and p.nextop({':='}):
+        if (target := p.rule(identifier_target_r)) and p.nextop(walrus_op):
             expr = p.rule_err(expression_r, "no expression after ':=' operator")
-            return tree.assignment_n(expr, (target,))
+            return p.ast.assignment_n(expr, (target,))
 
 
 ############################################################
 if "named_expression_r: assignment_expression_r | expression_r":
+    @first
     def named_expression_r(p:parser):
         return p.rule(assignment_expression_r) or p.rule(expression_r)
 
@@ -568,94 +599,35 @@ if """
     | 'lambda' ~ lambda_def_r
     | disjunction_r ['if' ~ disjunction_r ~ 'else' ~ expression_r]
 """:
+    @first
     def expression_r(p:parser):
-        if p.nextop({'lambda'}):
+        if p.nextop(lambda_op):
             return p.rule_err(lambda_def_r, "missing lambda body")
         elif if_true := p.rule(disjunction_r):
-            if p.nextop({'if'}):
+            if p.nextop(if_op):
                 if_test = p.rule_err(disjunction_r, "missing if body")
-                p.nextop({'else'}, sys="missing 'else' token")
+                p.nextop(else_op, "missing 'else' token")
                 if_false = p.rule_err(expression_r, "missing else body")
-                return tree.if_n(if_test, if_true, if_false)
+                return p.ast.if_n(if_test, if_true, if_false)
             return if_true
 
 
 ############################################################
-if "disjunction_r: 'or'.conjunction_r+":
+if """
+disjunction_r: 'or'.conjunction+
+# conjunction: 'and'.inversion+
+# inversion: 'not' ~ inversion | comparison
+# comparison: bitwise_or (comparison_op_pr ~ bitwise_or)*
+""":
+    @first
+    @memo # expression_r retries it after assignment_expression_r and the targets fail
     def disjunction_r(p:parser):
-        if args := list(gen_disjunction(p)):
-            if len(args) == 1:
-                return args[0]
-            return tree.or_block_n(args)
-
-    def gen_disjunction(p:parser):
-        if a := p.rule(conjunction_r):
-            yield a
-            while p.nextop({'or'}):
-                yield p.rule_err(conjunction_r, "no conjunction after 'or' operator")
-
-
-############################################################
-if "conjunction_r: 'and'.inversion_r+":
-    def conjunction_r(p:parser):
-        if args := tuple(gen_conjunction(p)):
-            if len(args) == 1:
-                return args[0]
-            return tree.and_block_n(args)
-
-    def gen_conjunction(p:parser):
-        if a := p.rule(inversion_r):
-            yield a
-            while p.nextop({'and'}):
-                yield p.rule_err(inversion_r, "no conjunction after 'and' operator")
-
-
-############################################################
-if "inversion_r: 'not' ~ inversion_r | comparison_r":
-    def inversion_r(p:parser):
-        if p.nextop({'not'}):
-            err = "no inversion after 'not' operator"
-            return tree.unary_op_n('not', p.rule_err(inversion_r, err))
-        return p.rule(comparison_r)
-
-
-############################################################
-if "comparison_r: bitwise_or_r (comparison_op_r ~ bitwise_or_r)*":
-    def comparison_r(p:parser):
-        if expr := p.rule(bitwise_or_r):
-            if comps := tuple(gen_comparison(p)):
-                return tree.compare_n(expr, comps)
-            return expr
-
-    def gen_comparison(p:parser):
-        while r := p.rule(comparison_op_r):
-            op:lex.opstok = r.node
-            r = p.rule_err(bitwise_or_r, f"no bitwise_or after operator")
-            yield op.str, r
-
-    """
-    comparison_op_r:
-        | 'is' ['not']
-        | 'not' ~ 'in'
-        | {comparison_ops}
-    """
-    def comparison_op_r(p:parser):
-        if op := p.nextop(comparison_ops):
-            if op.str == 'is':
-                if p.nextop('not'):
-                    return lex.opstok('is not', len('is not'), op.tidx, op.lnum, op.lidx)
-                return op
-            elif op.str != 'not':
-                return op
-            elif p.nextop({'in'}):
-                return lex.opstok('not in', len('not in'), op.tidx, op.lnum, op.lidx)
-
-    comparison_ops = {'is','not','in','>', '>=', '<', '<=', '!=', '=='}
+        return expr_pr(p, or_priority)
 
 
 ############################################################
 if """
-bitwise_or:
+bitwise_or_r:
     | bitwise_or '|' bitwise_xor
     | bitwise_xor
 # bitwise_xor:
@@ -681,70 +653,104 @@ bitwise_or:
     | factor
 """:
     def bitwise_or_r(p:parser):
-        if f := p.rule(factor_r):
-            f_node = root = fact_bit_fn(f, 0)
-            idx = 0
-            opmap:dict[tuple[int,int],op_bit_fn] = {}
-            keys = bitwise_op_priority.keys()
-            while op := p.nextop(keys):
-                f = p.rule_err(factor_r, f"no factor after '{op.str}' operator")
-                op_node = op_bit_fn(op.str, f_node, f)
-                f_node = op_node.next
-                opmap[bitwise_op_priority[op.str], idx] = op_node
-                idx += 1
-            keys = list(opmap.keys()); keys.sort()
-            for key in keys: opmap[key].join()
-            return root.fact
+        return expr_pr(p, bitwise_op_priority['|'])
 
     bitwise_op_priority = {
         '@':0, '%':0, '//':0, '/':0, '*':0,
         '+':1, '-':1, '<<':2, '>>':2,
         '&':3, '&':4, '^':5, '|':6 }
+    bitwise_ops = lex.opmask(*bitwise_op_priority)
+
+    # looser than every bitwise operator, 'not' only starts an operand
+    compare_priority, not_priority, and_priority, or_priority = 7, 8, 9, 10
+    expr_op_priority = {**bitwise_op_priority, 'and':and_priority, 'or':or_priority,
+        **{op:compare_priority for op in ('is','not','in','>','>=','<','<=','!=','==')}}
+    expr_ops = lex.opmask(*expr_op_priority)
+
+    def ranged(p:parser, node:tree.tree_node, tok:lex.lextok):
+        '''node spanned as p.rule would span it from tok'''
+        return p.span(node, tok)
+
+    def expr_pr(p:parser, priority:int):
+        '''
+        precedence climbing from 'or' down to the bitwise operators, parses
+        an operand and every operator that binds at priority or tighter,
+        operands are ranged where the grammar's layers of rules would be
+        '''
+        tok = p.tok
+        if priority >= not_priority and p.nextop(not_op):
+            arg = p.tok
+            r = expr_pr(p, not_priority) or p.error("no inversion after 'not' operator")
+            left = ranged(p, p.ast.unary_op_n('not', ranged(p, r, arg)), tok)
+        elif not (left := factor_pr(p)): return
+        while (op := p.tok).bit & expr_ops and (op_priority := expr_op_priority[op.str]) <= priority:
+            if op_priority < compare_priority: # left associative, so the right side binds tighter
+                p.next()
+                r = expr_pr(p, op_priority - 1) or p.error(f"no factor after '{op.str}' operator")
+                left = p.ast.binary_op_n(op.str, left, r)
+            elif op_priority == compare_priority:
+                operand = ranged(p, left, tok)
+                if not (comps := tuple(gen_comparison(p))): break # a 'not' without 'in'
+                left = ranged(p, p.ast.compare_n(operand, comps), tok)
+            else:
+                args = [ranged(p, left, tok)]
+                while p.nextop(op.bit):
+                    err = f"no conjunction after '{op.str}' operator"
+                    arg = p.tok
+                    args.append(ranged(p, expr_pr(p, op_priority - 1) or p.error(err), arg))
+                left = ranged(p, p.ast.and_block_n(tuple(args)) if op.str == 'and' else p.ast.or_block_n(tuple(args)), tok)
+        return left
 
-    @dataclass
-    class fact_bit_fn:
-        fact:tree.tree_node
-        prev:'op_bit_fn|None' = None
-        next:'op_bit_fn|None' = None
+    def gen_comparison(p:parser):
+        while op := comparison_op_pr(p):
+            tok = p.tok
+            r = expr_pr(p, compare_priority - 1) or p.error(f"no bitwise_or after operator")
+            yield op.str, ranged(p, r, tok)
 
-    class op_bit_fn:
-        def __init__(self, op:str, prev:fact_bit_fn, f:tree.tree_node):
-            self.op = op
-            self.prev = prev
-            prev.next = self
-            self.next = fact_bit_fn(f, self)
-        def join(self):
-            # a    +    b    -          ...
-            # prev self next next.next
-            self.prev.fact = tree.binary_op_n(self.op, self.prev.fact, self.next.fact)
-            self.prev.next = self.next.next
-            if self.next.next:
-                self.next.next.prev = self.prev
+    """
+    comparison_op_pr:
+        | 'is' ['not']
+        | 'not' ~ 'in'
+        | {comparison_ops}
+    """
+    def comparison_op_pr(p:parser) -> 'lex.lextok|None':
+        '''the operator token, not a node, so no rule spans it'''
+        if op := p.nextop(comparison_ops):
+            if op.str == 'is':
+                if p.nextop(not_op):
+                    return lex.opstok('is not', len('is not'), op.tidx, op.fidx, op.lines)
+                return op
+            elif op.str != 'not':
+                return op
+            elif p.nextop(in_op):
+                return lex.opstok('not in', len('not in'), op.tidx, op.fidx, op.lines)
+            p.tok = op
+
+    comparison_ops = lex.opmask('is','not','in','>', '>=', '<', '<=', '!=', '==')
 
 
 ############################################################
 if """
-factor_r: ('+' | '-' | '~') ~ factor_r | power_r
-power_r: await_primary_r ['**' ~ factor]
+factor: ('+' | '-' | '~') ~ factor | power
+# power: await_primary_r ['**' ~ factor]
 await_primary_r: 'await' ~ primary_r | primary_r
 """:
-    def factor_r(p:parser):
-        if op := p.nextop({'+','-','~'}):
-            r = p.rule_err(factor_r, f"no factor after '{op.str}' operator")
-            return tree.unary_op_n(op.str, r)
-        return p.rule(power_r)
-
-    def power_r(p:parser):
+    def factor_pr(p:parser):
+        '''an operand of expr_pr, ranged like the factor rule'''
+        tok = p.tok
+        if op := p.nextop(factor_ops):
+            r = factor_pr(p) or p.error(f"no factor after '{op.str}' operator")
+            return ranged(p, p.ast.unary_op_n(op.str, r), tok)
         if a := p.rule(await_primary_r):
-            if p.nextop({'**'}):
-                b = p.rule_err(factor_r, "no factor after '**' operator")
-                return tree.binary_op_n('**', a, b)
+            if p.nextop(dstar_op):
+                b = factor_pr(p) or p.error("no factor after '**' operator")
+                return ranged(p, p.ast.binary_op_n('**', a, b), tok)
             return a
 
     def await_primary_r(p:parser):
-        if p.nextop({'await'}):
+        if p.nextop(await_op):
             r = p.rule_err(primary_r), f"no primary after 'await' operator"
-            return tree.await_n(r)
+            return p.ast.await_n(r)
         return p.rule(primary_r)
 
 
@@ -753,31 +759,32 @@ if "slices_r: TODO":
     def slices_r(p:parser):
         if r := p.rule(single_slice_r): return r
         elif args := tuple(gen_tuple_slices(p)):
-            return tree.tuple_n(args)
+            return p.ast.tuple_n(args)
 
     def slice_r(p:parser):
         a1 = p.rule(expression_r)
-        if p.nextop({':'}):
+        if p.nextop(colon_op):
             a2 = p.rule(expression_r)
-            a3 = p.nextop({':'}) and p.rule(expression_r)
-            return tree.slice_n(a1,a2,a3)
+            a3 = p.nextop(colon_op) and p.rule(expression_r)
+            return p.ast.slice_n(a1,a2,a3)
 
     def single_slice_r(p:parser):
         if ((r := p.rule(slice_r) or p.rule(named_expression_r))
-        and not p.getop({','})): return r
+        and not p.getop(comma_op)): return r
 
     def gen_tuple_slices(p:parser):
         while r := p.rule(slice_r) or p.rule(named_expression_r):
             yield r
-            if not p.nextop(','): break
+            if not p.nextop(comma_op): break
 
 
 ############################################################
 if "star_named_expression_r: TODO":
+    @first
     def star_named_expression_r(p:parser):
-        if p.nextop({'*'}):
+        if p.nextop(star_op):
             r = p.rule(bitwise_or_r)
-            return r and tree.star_n(r)
+            return r and p.ast.star_n(r)
         return p.rule(named_expression_r)
 
 
@@ -786,7 +793,7 @@ if "star_named_expression_gr: TODO":
     def star_named_expression_gr(p:parser):
         while r := p.rule(star_named_expression_r):
             yield r
-            if not p.nextop({','}): break
+            if not p.nextop(comma_op): break
 
 
 ############################################################
@@ -794,24 +801,24 @@ if """
 sub_primary_pr:
     | primary& '.' ~ NAME
     | primary& '[' ~ slices ']'
-    | primary& &'(' genexp
     | primary& &'(' p_arguments_r
+    | primary& &'(' genexp
 """:
     def sub_primary_pr(p:parser, a:tree.tree_node):
-        if p.tok.str == '.':
+        if p.tok.bit & dot_op:
             p.next()
             if n := p.nexttok(lex.idftok):
-                return tree.attribute_ref_n(a, n.str)
+                return p.ast.attribute_ref_n(a, n.str)
             p.error("no identifier after '.' operator")
-        elif p.tok.str == '[':
-            if s := p.ignore_tracking('[',slices_r,']'):
-                return tree.subscript_n(a, s)
+        elif p.tok.bit & lsqb_op:
+            if s := p.bracketed(lsqb_op, slices_r, rsqb_op):
+                return p.ast.subscript_n(a, s)
             p.error("no slice after '[' operator")
-        elif n := p.rule(genexp_r):
-            args = tree.arguments_n((n,))
-            return tree.call_n(a, args)
         elif args := p.rule(p_arguments_r):
-            return tree.call_n(a, args)
+            return p.ast.call_n(a, args)
+        elif n := p.rule(genexp_r):
+            args = p.ast.arguments_n((n,))
+            return p.ast.call_n(a, args)
 
 
 ############################################################
@@ -820,16 +827,17 @@ single_subscript_attribute_target_r:
     | t_primary_r '.' ~ NAME !{lookahead_set}
     | t_primary_r '[' slices ']' !{lookahead_set}
 """:
+    @first
     def single_subscript_attribute_target_r(p:parser):
         if (a := p.rule(t_primary_r)):
-            if p.tok.str == '.':
+            if p.tok.bit & dot_op:
                 p.next()
                 if n := p.nexttok(lex.idftok):
-                    return tree.attribute_trgt_n(a, n.str)
+                    return p.ast.attribute_trgt_n(a, n.str)
                 p.error("no identifier after '.' operator")
-            elif p.tok.str == '[':
-                if s := p.ignore_tracking('[',slices_r,']'):
-                    return tree.subscript_trgt_n(a, s)
+            elif p.tok.bit & lsqb_op:
+                if s := p.bracketed(lsqb_op, slices_r, rsqb_op):
+                    return p.ast.subscript_trgt_n(a, s)
                 p.error("no slice after '[' operator")
 
 
@@ -837,51 +845,57 @@ single_subscript_attribute_target_r:
 if "primary_r: atom_r (&{lookahead_set} sub_primary_pr)*":
     def primary_r(p:parser):
         if a := p.rule(atom_r):
-            r = a
-            def sub_primary_r(p:parser):
-                return p.getop(lookahead_set) and sub_primary_pr(p, r)
-            while a := p.rule(sub_primary_r): r = a
-            return r
+            return postfix_pr(p, a)
 
-    lookahead_set = {'.','[','('}
+    lookahead_set = lex.opmask('.','[','(')
 
 
     "t_primary_r: atom_r &{lookahead_set} (sub_primary_pr &{lookahead_set})*"
+    @first
     def t_primary_r(p:parser):
         if (a := p.rule(atom_r)) and p.getop(lookahead_set):
-            r = a
-            def sub_t_primary_r(p:parser):
-                if (s := sub_primary_pr(p, r)) and p.getop(lookahead_set):
-                    return s
-            while a := p.rule(sub_t_primary_r): r = a
-            return r
+            return postfix_pr(p, a, True)
+
+    def postfix_pr(p:parser, r:tree.tree_node, target:bool=False):
+        '''
+        the '.', '[' and '(' steps after the atom r in one loop, a target
+        stops before the step that is not followed by another of them
+        '''
+        while p.tok.bit & lookahead_set:
+            tok = p.tok
+            if not (s := sub_primary_pr(p, r)): break
+            if target and not p.tok.bit & lookahead_set:
+                p.tok = tok
+                break
+            r = s
+        return r
 
 ############################################################
 if "for_if_clauses_ir: TODO":
     def for_if_clauses_ir(i:tree.tree_node):
 
         def if_clause_r(p:parser):
-            if p.nextop({'if'}) and (test := p.rule(disjunction_r)):
+            if p.nextop(if_op) and (test := p.rule(disjunction_r)):
                 r = p.rule(for_clause_r) or p.rule(if_clause_r) or i
-                return tree.if_n(test, r, tree.continue_n())
+                return p.ast.if_n(test, r, p.ast.continue_n())
 
         def for_clause_r(p:parser):
             fail = False
-            if ((op := p.nextop({'async','for'}))
+            if ((op := p.nextop(async_for_ops))
             and
-            (op.str == 'for' or p.nextop({'for'}))
+            (op.str == 'for' or p.nextop(for_op))
             and
             (target := p.rule(star_targets_r))
             and
-            p.nextop({'in'})
+            p.nextop(in_op)
             and
             (fail := True)
             and
             (iterable := p.rule(disjunction_r))):
                 block = p.rule(for_clause_r) or p.rule(if_clause_r) or i
-                r = tree.for_n(target, iterable, block)
+                r = p.ast.for_n(target, iterable, block)
                 if op.str == 'async':
-                    return tree.async_n(r)
+                    return p.ast.async_n(r)
                 return r
             if fail: p.error("expected disjunction after 'in' operator")
 
@@ -897,6 +911,7 @@ if """
     | kwarg_r
     | starred_expression_r
 """:
+    @first
     def arg_r(p:parser):
         return (p.rule(starred_expression_r)
                 or
@@ -911,24 +926,25 @@ if """
 
 ############################################################
 if "starred_expression_r: '*' expression_r":
+    @first
     def starred_expression_r(p:parser):
-        if r := p.nextop({'*'}) and expression_r(p):
-            return tree.star_n(r)
+        if r := p.nextop(star_op) and expression_r(p):
+            return p.ast.star_n(r)
 
 
 ############################################################
 if "double_starred_expression_r: '**' expression_r":
     def double_starred_expression_r(p:parser):
-        if r := p.nextop({'**'}) and expression_r(p):
-            return tree.kw_star_n(r)
+        if r := p.nextop(dstar_op) and expression_r(p):
+            return p.ast.kw_star_n(r)
 
 
 ############################################################
 if "kwarg_r: NAME '=' ~ expression_r":
     def kwarg_r(p:parser):
-        if (i := p.nexttok(lex.idftok)) and p.nextop({'='}):
+        if (i := p.nexttok(lex.idftok)) and p.nextop(eq_op):
             e = p.rule_err(expression_r, 'no expression after kwarg')
-            return tree.kwarg_n(i.str, e)
+            return p.ast.kwarg_n(i.str, e)
 
 
 ############################################################
@@ -937,10 +953,10 @@ if "p_arguments_r: '(' [','.arg_r+ [',']] ')'":
         def gen_args(p:parser):
             while r := p.rule(arg_r):
                 yield r
-                if not p.nextop(','): break
+                if not p.nextop(comma_op): break
         def args_r(p:parser):
-            return tree.arguments_n(tuple(gen_args(p)))
-        return p.ignore_tracking('(', args_r, ')')
+            return p.ast.arguments_n(tuple(gen_args(p)))
+        return p.bracketed(lpar_op, args_r, rpar_op)
 
 
 ############################################################
@@ -950,26 +966,26 @@ if "genexp_r: TODO":
             i = p.rule(assignment_expression_r)
             if not i:
                 i = p.rule(expression_r)
-                if not i or p.getop({':='}): return
-            if r := p.rule(for_if_clauses_ir(tree.yield_n(i))):
-                return tree.generator_n(r)
-        return p.ignore_tracking('(', sub_genexp_r, ')')
+                if not i or p.getop(walrus_op): return
+            if r := p.rule(for_if_clauses_ir(p.ast.yield_n(i))):
+                return p.ast.generator_n(r)
+        return p.bracketed(lpar_op, sub_genexp_r, rpar_op)
 
 
 ############################################################
 if "tuple_group_genexp_r: TODO":
     def tuple_group_genexp_r(p:parser):
-        return (p.ignore_tracking('(', tuple_r, ')')
+        return (p.bracketed(lpar_op, tuple_r, rpar_op)
                 or
-                p.ignore_tracking('(', group_r, ')')
+                p.bracketed(lpar_op, group_r, rpar_op)
                 or
                 p.rule(genexp_r))
 
     def tuple_r(p:parser):
         r = p.rule(star_named_expression_r)
-        if not p.nextop({','}): return
+        if not p.nextop(comma_op): return
         t = r, *star_named_expression_gr(p)
-        return tree.tuple_n(t)
+        return p.ast.tuple_n(t)
 
     def group_r(p:parser):
         return p.rule(yield_expr_r) or p.rule(named_expression_r)
@@ -978,23 +994,23 @@ if "tuple_group_genexp_r: TODO":
 ############################################################
 if "list_listcomp_r: TODO":
     def list_listcomp_r(p:parser):
-        return (p.ignore_tracking('[', list_r, ']')
+        return (p.bracketed(lsqb_op, list_r, rsqb_op)
                 or
-                p.ignore_tracking('[', listcomp_r, ']'))
+                p.bracketed(lsqb_op, listcomp_r, rsqb_op))
 
     def list_r(p:parser):
         t = tuple(star_named_expression_gr(p))
-        return tree.list_n(t)
+        return p.ast.list_n(t)
 
     def listcomp_r(p:parser):
         if ((i := p.rule(named_expression_r))
         and
-        (i := tree.yield_n(i))
+        (i := p.ast.yield_n(i))
         and
         (r := p.rule(for_if_clauses_ir(i)))):
-            g = tree.generator_n(r)
-            t = tree.star_n(g)
-            return tree.list_n(t)
+            g = p.ast.generator_n(r)
+            t = p.ast.star_n(g)
+            return p.ast.list_n((t,))
 
 
 ############################################################
@@ -1004,8 +1020,9 @@ def dict_set_dictcomp_setcomp_r(p:parser): pass
 
 ############################################################
 if "atom_r: TODO":
+    @first
     def atom_r(p:parser):
-        if op := p.getop({'(','{','['}):
+        if op := p.getop(atom_ops):
             return p.rule(atom_map[op.str])
         return (p.rule(identifier_r)
             or
@@ -1022,17 +1039,18 @@ if "atom_r: TODO":
 
     def number_r(p:parser):
         if tok := p.nexttok(lex.numtok):
-            return tree.int_lit_n(tok.str)
+            return p.ast.int_lit_n(tok.str)
 
     def bool_ellipsis_r(p:parser):
-        if op := p.nextop({'True','False','None','...'}):
-            if op.str == '...': return tree.ellipsis_n()
-            return tree.bool_n(
+        if op := p.nextop(bool_ellipsis_ops):
+            if op.str == '...': return p.ast.ellipsis_n()
+            return p.ast.bool_n(
                 True if op.str == 'True' else
                 False if op.str == 'False' else
                 None)
 
+    @first
     def strings_r(p:parser):
         def getstrs():
             while tok := p.nexttok(lex.strtok): yield tok.str
-        if p.gettok(lex.strtok): return tree.string_n(tuple(getstrs()))
+        if p.gettok(lex.strtok): return p.ast.string_n(tuple(getstrs()))
@@ -1,69 +1,129 @@
 # cyparser.py
-from typing import Callable, Literal, NoReturn
+from typing import TYPE_CHECKING, Callable, Literal, NoReturn
 import cylexer as lex
-from cytree import tree_node, tree_range_n
+import cyfirsts
+import cytree
+from cytree import tree_node
+if TYPE_CHECKING:
+    from cycache import tokcache
+    from cyarena import arena as ast_arena
+
+memo_rules:'set[Callable[[parser],tree_node|None]]' = set()
+
+def memo(r:'Callable[[parser],tree_node|None]'):
+    '''
+    opts a rule into packrat memoization, for module level rules that
+    several alternatives try at the same token, closures are not keyed
+    '''
+    memo_rules.add(r)
+    return r
+
+first_rules:'dict[Callable[[parser],tree_node|None], int]' = {}
+
+def first(r:'Callable[[parser],tree_node|None]'):
+    '''
+    skips a rule without calling it when the current token is not in the
+    FIRST set of the py.bnf rule of the same name, for rules that parse
+    no more than that rule does, the sets are generated into cyfirsts.py
+    '''
+    first_rules[r] = cyfirsts.firsts[r.__name__.removesuffix('_r')]
+    return r
 
 class parser:
 
-    def __init__(self, filename:str, file:str):
-        self.lexer = lex.lexer(filename, file)
-        self.tmap:'dict[tuple[int,int],tree_range_n|Literal[True]]' = {}
-        self.indent_level = 0
-        self.indent_tracking = True
+    def __init__(self, filename:str, file:'str|bytes|mmap', stream:bool=False,
+            cache:'tokcache|None'=None, memo:bool=True, first:bool=True, arena:'ast_arena|None'=None):
+        self.lexer = lex.lexer(filename, file, stream, cache)
+        # the rules build nodes through ast, cytree objects or handles into arena
+        self.arena = arena
+        self.ast = cytree if arena is None else arena
+        # (id of rule, tidx) to the node the rule parsed there and the token
+        # after it, True when it failed
+        self.tmap:'dict[tuple[int,int],tuple[tree_node,lex.lextok]|Literal[True]]' = {}
+        self.memo_rules = memo_rules if memo else frozenset()
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.memo_peak = 0 # most memo entries held at a cut
+        self.first_rules = first_rules if first else {}
+        self.first_skips = 0 # rule calls the FIRST sets made unnecessary
         self.tok = self.lexer.toks[0]
 
     def error(self, msg:str) -> NoReturn:
         self.lexer.error(msg, self.tok.lnum, self.tok.lidx)
 
+    # the lexer works out the blocks, these are plain token matches
     def nextnewline(self):
-        if tab := self.gettok(lex.tabtok):
-            if tab.slen == self.indent_level:
-                self.next()
-            return True
-        return False
+        return self.nexttok(lex.tabtok)
 
     def nextindent(self):
-        if ((tab := self.gettok(lex.tabtok))
-        and
-        (tab.slen > self.indent_level)):
-            self.next()
-            i = self.indent_level
-            self.indent_level = tab.slen
-            return i
-        return None
-
-    def nextdedent(self, indent_level:int):
-        self.indent_level = indent_level
-        return ((tab := self.gettok(lex.tabtok))
-        and
-        tab.slen <= self.indent_level)
-
-    def ignore_tracking(self, start:str, rule:'Callable[[parser],tree_node|None]', end:str):
+        return self.nexttok(lex.indtok)
+
+    def nextdedent(self):
+        return self.nexttok(lex.dedtok)
+
+    def bracketed(self, start:int, rule:'Callable[[parser],tree_node|None]', end:int):
+        '''start rule end, the lexer drops the newlines between brackets'''
         tok = self.tok
-        tracking = self.indent_tracking
-        self.indent_tracking = False
-        if r := self.nextop({start}) and rule(self):
-            self.indent_tracking = tracking
-            if self.nextop({end}): return r
-        else: self.indent_tracking = tracking
+        if (r := self.nextop(start) and rule(self)) and self.nextop(end): return r
         self.tok = tok
 
     def rule(self, rule:'Callable[[parser],tree_node|None]'):
+        if (mask := self.first_rules.get(rule)) and not self.tok.bit & mask:
+            self.first_skips += 1
+            return None
+        if rule in self.memo_rules: return self.memo_rule(rule)
         tok = self.tok
         if ret := rule(self):
-            if isinstance(ret, tree_range_n): ret = ret.node
-            ret = tree_range_n(ret, tok, self.tok)
+            if self.arena is None: ret.start, ret.end = tok.tidx, self.tok.tidx
+            else: self.arena.span(ret, tok.tidx, self.tok.tidx)
             return ret
         self.tok = tok
 
-    def rule_err(self, rule:'Callable[[parser],tree_node|None]', err:str) -> 'tree_range_n | NoReturn':
+    def span(self, node:tree_node, tok:lex.lextok):
+        '''spans node from tok to the current token, as rule does'''
+        if self.arena is None: node.start, node.end = tok.tidx, self.tok.tidx
+        else: self.arena.span(node, tok.tidx, self.tok.tidx)
+        return node
+
+    def memo_rule(self, rule:'Callable[[parser],tree_node|None]'):
+        key = (id(rule), (tok := self.tok).tidx)
+        if r := self.tmap.get(key):
+            self.memo_hits += 1
+            if r is True: return None
+            ret, self.tok = r
+            return self.span(ret, tok) # undo any rule that returned it whole
+        self.memo_misses += 1
+        if ret := rule(self):
+            self.tmap[key] = (self.span(ret, tok), self.tok)
+            return ret
+        self.tmap[key] = True
+        self.tok = tok
+
+    def cut(self):
+        '''
+        commits every rule entered so far, none of them will backtrack
+        before the current token so the lexer may release those tokens
+        and the memo entries keyed before it can never be hit again,
+        only the leading run of those in insertion order is dropped, an
+        entry behind a live one goes at the next cut, which every entry
+        made before this one is keyed before
+        '''
+        tidx = self.tok.tidx
+        self.lexer.toks.release(tidx)
+        if tmap := self.tmap:
+            self.memo_peak = max(self.memo_peak, len(tmap))
+            expired:'list[tuple[int,int]]' = []
+            for key in tmap:
+                if key[1] >= tidx: break
+                expired.append(key)
+            for key in expired: del tmap[key]
+
+    def rule_err(self, rule:'Callable[[parser],tree_node|None]', err:str) -> 'tree_node | NoReturn':
         return self.rule(rule) or self.error(err)
 
     def next(self):
         tok = self.tok
         self.tok = self.lexer.toks[self.tok.tidx+1]
-        if not self.indent_tracking:
-            self.nexttok(lex.tabtok)
         return tok
 
     def gettok(self, lex:type[lex.lextok], err:'str|None'=None):
@@ -76,13 +136,15 @@ class parser:
             return self.next()
         if err: self.error(err)
 
-    def getop(self, ops:set[str], err:'str|None'=None):
-        if isinstance(tok := self.tok, lex.opstok) and tok.str in ops:
+    def getop(self, ops:int, err:'str|None'=None):
+        '''ops is a mask from lex.opmask'''
+        if (tok := self.tok).bit & ops:
             return tok
         if err: self.error(err)
 
-    def nextop(self, ops:set[str], err:'str|None'=None):
-        if isinstance(tok := self.tok, lex.opstok) and tok.str in ops:
+    def nextop(self, ops:int, err:'str|None'=None):
+        '''ops is a mask from lex.opmask'''
+        if (tok := self.tok).bit & ops:
             self.next()
             return tok
         if err: self.error(err)
@@ -0,0 +1,2773 @@
+# cypyparser.py
+# generated from py.bnf by cygen.py, edit the grammar and rerun it
+from cyparser import parser
+from cytree import tree_node
+import cylexer as lex
+
+if lex.opnames != ('', '!', '!=', '%', '%=', '&', '&=', '(', ')', '*', '**', '**=', '*=', '+', '+=', ',', '-', '-=', '->', '.', '...', '/', '//', '//=', '/=', ':', ':=', ';', '<', '<<', '<<=', '<=', '<>', '=', '==', '>', '>=', '>>', '>>=', '?', '@', '@=', 'False', 'None', 'True', '[', ']', '^', '^=', 'and', 'as', 'assert', 'async', 'await', 'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'while', 'with', '{', '|', '|=', '}', '~'):
+    raise ImportError('cypyparser.py was generated for other operators, rerun cygen.py')
+
+keywords = frozenset(['except', 'try', 'yield'])
+
+
+def file_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x13c7ee7c7f83d0000112280 and ((p.tok.bit & 0x3c7ee7c7f83d0000112280 and (n := statements_r(p)) and not k.append(n)) or True) and p.tok.bit & 0x10000000000000000000000:
+        return p.span(p.ast.syntax_n('file', tuple(k)), tok)
+    p.tok = tok
+
+
+def interactive_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1bc7ee7c7f83d0000112280 and (n := statement_newline_r(p)):
+        return n
+
+
+def eval_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x3c40a000203c0000112080 and (n := expressions_r(p)) and not k.append(n)) and _eval_1(p, k) and p.tok.bit & 0x10000000000000000000000:
+        return p.span(p.ast.syntax_n('eval', tuple(k)), tok)
+    p.tok = tok
+
+def _eval_1(p:parser, k:'list[tree_node]'):
+    while p.tok.bit & 0x8000000000000000000000: p.next()
+    return True
+
+
+def func_type_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112680 and (n := type_expressions_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()) and (p.tok.bit & 0x40000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and _func_type_1(p, k) and p.tok.bit & 0x10000000000000000000000:
+        return p.span(p.ast.syntax_n('func_type', tuple(k)), tok)
+    p.tok = tok
+
+def _func_type_1(p:parser, k:'list[tree_node]'):
+    while p.tok.bit & 0x8000000000000000000000: p.next()
+    return True
+
+
+def fstring_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)):
+        return n
+
+
+def type_expressions_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112080 and _type_expressions_1(p, k) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and _type_expressions_2(p, k) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and _type_expressions_3(p, k) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and _type_expressions_4(p, k):
+        return p.span(p.ast.syntax_n('type_expressions', tuple(k)), tok)
+    p.tok = tok
+
+def _type_expressions_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _type_expressions_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _type_expressions_3(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _type_expressions_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def statements_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c7ee7c7f83d0000112280 and _statements_1(p, k):
+        return p.span(p.ast.syntax_n('statements', tuple(k)), tok)
+    p.tok = tok
+
+def _statements_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c7ee7c7f83d0000112280 and (n := statement_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x3c7ee7c7f83d0000112280 and (n := statement_r(p)) and not k.append(n)): pass
+    return True
+
+
+def statement_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1030024290010000000000 and (n := compound_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x3c4ee585683c0000112280 and (n := simple_stmts_r(p)):
+        return n
+
+
+def statement_newline_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1030024290010000000000 and (n := compound_stmt_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('statement_newline', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c4ee585683c0000112280 and (n := simple_stmts_r(p)):
+        return n
+    if (p.tok.bit & 0x8000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('statement_newline', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x10000000000000000000000:
+        return p.span(p.ast.syntax_n('statement_newline', tuple(k)), tok)
+    p.tok = tok
+
+
+def simple_stmts_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x3c4ee585683c0000112280 and (n := simple_stmt_r(p)) and not k.append(n)) and not p.tok.bit & 0x8000000 and (p.tok.bit & 0x8000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('simple_stmts', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c4ee585683c0000112280 and _simple_stmts_1(p, k) and ((p.tok.bit & 0x8000000 and p.next()) or True) and (p.tok.bit & 0x8000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('simple_stmts', tuple(k)), tok)
+    p.tok = tok
+
+def _simple_stmts_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c4ee585683c0000112280 and (n := simple_stmt_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000000 and p.next()) and (p.tok.bit & 0x3c4ee585683c0000112280 and (n := simple_stmt_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def simple_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100280 and (n := assignment_r(p)):
+        return n
+    if p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)):
+        return n
+    if p.tok.bit & 0x8000000000000000000 and (n := return_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x48000000000000000 and (n := import_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x4000000000000000000 and (n := raise_stmt_r(p)):
+        return n
+    if (p.tok.bit & 0x2000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('simple_stmt', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x400000000000000 and (n := del_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := yield_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x8000000000000 and (n := assert_stmt_r(p)):
+        return n
+    if (p.tok.bit & 0x40000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('simple_stmt', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x100000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('simple_stmt', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x10000000000000000 and (n := global_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x400000000000000000 and (n := nonlocal_stmt_r(p)):
+        return n
+
+
+def compound_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x210010000000000 and (n := function_def_r(p)):
+        return n
+    if p.tok.bit & 0x20000000000000000 and (n := if_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x80010000000000 and (n := class_def_r(p)):
+        return n
+    if p.tok.bit & 0x20000010000000000000 and (n := with_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x4010000000000000 and (n := for_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := try_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x10000000000000000000 and (n := while_stmt_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := match_stmt_r(p)):
+        return n
+
+
+def assignment_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (_assignment_1(p, k) or True):
+        return p.span(p.ast.syntax_n('assignment', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x38400000003c0000100080 and _assignment_2(p, k) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (_assignment_3(p, k) or True):
+        return p.span(p.ast.syntax_n('assignment', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x38400000003c0000100280 and _assignment_5(p, k) and _assignment_6(p, k) and not p.tok.bit & 0x200000000:
+        return p.span(p.ast.syntax_n('assignment', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x38400000003c0000100080 and (n := single_target_r(p)) and not k.append(n)) and (p.tok.bit & 0x100000001024041825850 and p.next()) and _assignment_7(p, k) and _assignment_8(p, k):
+        return p.span(p.ast.syntax_n('assignment', tuple(k)), tok)
+    p.tok = tok
+
+def _assignment_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x200000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := annotated_rhs_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _assignment_2(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := single_target_r(p)) and not k.append(n)) and (p.tok.bit & 0x100 and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x38400000003c0000100080 and (n := p.memo_rule(single_subscript_attribute_target_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _assignment_3(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x200000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := annotated_rhs_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _assignment_4(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_r(p)) and not k.append(n)) and (p.tok.bit & 0x200000000 and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _assignment_5(p:parser, k:'list[tree_node]'):
+    if not _assignment_4(p, k): return False
+    while _assignment_4(p, k): pass
+    return True
+
+def _assignment_6(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x1000000000000000000000 and (n := yield_expr_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _assignment_7(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if True: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _assignment_8(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x1000000000000000000000 and (n := yield_expr_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def augassign_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x4000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x20000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x1000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x20000000000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x1000000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x10 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x40 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x100000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x1000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x40000000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x4000000000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x800 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x800000 and p.next()):
+        return p.span(p.ast.syntax_n('augassign', tuple(k)), tok)
+    p.tok = tok
+
+
+def global_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x10000000000000000 and p.next()) and _global_stmt_1(p, k):
+        return p.span(p.ast.syntax_n('global_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _global_stmt_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next())):
+            p.tok = tok
+            return True
+
+
+def nonlocal_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400000000000000000 and p.next()) and _nonlocal_stmt_1(p, k):
+        return p.span(p.ast.syntax_n('nonlocal_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _nonlocal_stmt_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next())):
+            p.tok = tok
+            return True
+
+
+def yield_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := yield_expr_r(p)):
+        return n
+
+
+def assert_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x8000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (_assert_stmt_1(p, k) or True):
+        return p.span(p.ast.syntax_n('assert_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _assert_stmt_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def del_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := del_targets_r(p)) and not k.append(n)) and p.tok.bit & 0x8000000000000008000000:
+        return p.span(p.ast.syntax_n('del_stmt', tuple(k)), tok)
+    p.tok = tok
+
+
+def import_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x40000000000000000 and (n := import_name_r(p)):
+        return n
+    if p.tok.bit & 0x8000000000000000 and (n := import_from_r(p)):
+        return n
+
+
+def import_name_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x40000000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := dotted_as_names_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('import_name', tuple(k)), tok)
+    p.tok = tok
+
+
+def import_from_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x8000000000000000 and p.next()) and _import_from_1(p, k) and (p.tok.bit & 0x1000000000000000000000 and (n := dotted_name_r(p)) and not k.append(n)) and (p.tok.bit & 0x40000000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000280 and (n := import_from_targets_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('import_from', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x8000000000000000 and p.next()) and _import_from_2(p, k) and (p.tok.bit & 0x40000000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000280 and (n := import_from_targets_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('import_from', tuple(k)), tok)
+    p.tok = tok
+
+def _import_from_1(p:parser, k:'list[tree_node]'):
+    while p.tok.bit & 0x180000: p.next()
+    return True
+
+def _import_from_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x180000 and p.next()): return False
+    while p.tok.bit & 0x180000: p.next()
+    return True
+
+
+def import_from_targets_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := import_from_as_names_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('import_from_targets', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and (n := import_from_as_names_r(p)) and not k.append(n)) and not p.tok.bit & 0x8000:
+        return p.span(p.ast.syntax_n('import_from_targets', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200 and p.next()):
+        return p.span(p.ast.syntax_n('import_from_targets', tuple(k)), tok)
+    p.tok = tok
+
+
+def import_from_as_names_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _import_from_as_names_1(p, k):
+        return p.span(p.ast.syntax_n('import_from_as_names', tuple(k)), tok)
+    p.tok = tok
+
+def _import_from_as_names_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := import_from_as_name_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := import_from_as_name_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def import_from_as_name_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (_import_from_as_name_1(p, k) or True):
+        return p.span(p.ast.syntax_n('import_from_as_name', tuple(k)), tok)
+    p.tok = tok
+
+def _import_from_as_name_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x4000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def dotted_as_names_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _dotted_as_names_1(p, k):
+        return p.span(p.ast.syntax_n('dotted_as_names', tuple(k)), tok)
+    p.tok = tok
+
+def _dotted_as_names_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := dotted_as_name_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := dotted_as_name_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def dotted_as_name_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and (n := dotted_name_r(p)) and not k.append(n)) and (_dotted_as_name_1(p, k) or True):
+        return p.span(p.ast.syntax_n('dotted_as_name', tuple(k)), tok)
+    p.tok = tok
+
+def _dotted_as_name_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x4000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def dotted_name_r(p:parser):
+    start = p.tok
+    if not (left := _dotted_name_seed(p)): return
+    while True:
+        if not p.tok.bit & 0x80000: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x80000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+            left = p.span(p.ast.syntax_n('dotted_name', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+def _dotted_name_seed(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('dotted_name', tuple(k)), tok)
+    p.tok = tok
+
+
+def if_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x20000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and (p.tok.bit & 0x800000000000000 and (n := elif_stmt_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('if_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x20000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('if_stmt', tuple(k)), tok)
+    p.tok = tok
+
+
+def elif_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x800000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and (p.tok.bit & 0x800000000000000 and (n := elif_stmt_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('elif_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x800000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('elif_stmt', tuple(k)), tok)
+    p.tok = tok
+
+
+def else_block_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000 and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('else_block', tuple(k)), tok)
+    p.tok = tok
+
+
+def while_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x10000000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('while_stmt', tuple(k)), tok)
+    p.tok = tok
+
+
+def for_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x4000000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_r(p)) and not k.append(n)) and (p.tok.bit & 0x80000000000000000 and p.next()) and _for_stmt_1(p, k) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('for_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x10000000000000 and p.next()) and (p.tok.bit & 0x4000000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_r(p)) and not k.append(n)) and (p.tok.bit & 0x80000000000000000 and p.next()) and _for_stmt_2(p, k) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('for_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _for_stmt_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if True: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _for_stmt_2(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if True: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def with_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x20000000000000000000 and p.next()) and (p.tok.bit & 0x80 and p.next()) and _with_stmt_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x100 and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('with_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x20000000000000000000 and p.next()) and _with_stmt_2(p, k) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('with_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x10000000000000 and p.next()) and (p.tok.bit & 0x20000000000000000000 and p.next()) and (p.tok.bit & 0x80 and p.next()) and _with_stmt_3(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x100 and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('with_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x10000000000000 and p.next()) and (p.tok.bit & 0x20000000000000000000 and p.next()) and _with_stmt_4(p, k) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('with_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _with_stmt_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _with_stmt_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _with_stmt_3(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _with_stmt_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := with_item_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def with_item_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x4000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)) and not k.append(n)) and p.tok.bit & 0x2008100:
+            return p.span(p.ast.syntax_n('with_item', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        return k[0]
+
+
+def try_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'try' and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000000000000 and (n := finally_block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('try_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'try' and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and _try_stmt_1(p, k) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True) and ((p.tok.bit & 0x2000000000000000 and (n := finally_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('try_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'try' and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)) and _try_stmt_2(p, k) and ((p.tok.bit & 0x1000000000000000 and (n := else_block_r(p)) and not k.append(n)) or True) and ((p.tok.bit & 0x2000000000000000 and (n := finally_block_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('try_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _try_stmt_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := except_block_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := except_block_r(p)) and not k.append(n)): pass
+    return True
+
+def _try_stmt_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := except_star_block_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := except_star_block_r(p)) and not k.append(n)): pass
+    return True
+
+
+def except_block_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'except' and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (_except_block_1(p, k) or True) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('except_block', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'except' and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('except_block', tuple(k)), tok)
+    p.tok = tok
+
+def _except_block_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x4000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def except_star_block_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'except' and p.next()) and (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (_except_star_block_1(p, k) or True) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('except_star_block', tuple(k)), tok)
+    p.tok = tok
+
+def _except_star_block_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x4000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def finally_block_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000 and p.next()) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('finally_block', tuple(k)), tok)
+    p.tok = tok
+
+
+def match_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'match' and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := subject_expr_r(p)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x8000000000000000000000 and p.next()) and (p.tok.bit & 0x40000000000000000000000 and p.next()) and _match_stmt_1(p, k) and (p.tok.bit & 0x80000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('match_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _match_stmt_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := case_block_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := case_block_r(p)) and not k.append(n)): pass
+    return True
+
+
+def subject_expr_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expressions_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('subject_expr', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)):
+        return n
+
+
+def case_block_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'case' and p.next()) and (p.tok.bit & 0x38400000003c0000010280 and (n := patterns_r(p)) and not k.append(n)) and ((p.tok.bit & 0x20000000000000000 and (n := guard_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('case_block', tuple(k)), tok)
+    p.tok = tok
+
+
+def guard_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x20000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('guard', tuple(k)), tok)
+    p.tok = tok
+
+
+def patterns_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000010280 and (n := open_sequence_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)):
+        return n
+
+
+def pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000010080 and (n := as_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(or_pattern_r)):
+        return n
+
+
+def as_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(or_pattern_r)) and not k.append(n)) and (p.tok.bit & 0x4000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := pattern_capture_target_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('as_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def or_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000010080 and _or_pattern_1(p, k):
+        return p.span(p.ast.syntax_n('or_pattern', tuple(k)), tok)
+    p.tok = tok
+
+def _or_pattern_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x38400000003c0000010080 and (n := closed_pattern_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x80000000000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := closed_pattern_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def closed_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x28000000001c0000010000 and (n := literal_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := capture_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := wildcard_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := value_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x80 and (n := group_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x200000000080 and (n := sequence_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x40000000000000000000 and (n := mapping_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000000000000000 and (n := class_pattern_r(p)):
+        return n
+
+
+def literal_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000010000 and (n := signed_number_r(p)) and not k.append(n)) and not p.tok.bit & 0x12000:
+        return p.span(p.ast.syntax_n('literal_pattern', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x2000000000000000010000 and (n := complex_number_r(p)):
+        return n
+    if p.tok.bit & 0x800000000000000000000 and (n := strings_r(p)):
+        return n
+    if (p.tok.bit & 0x80000000000 and p.next()):
+        return p.span(p.ast.syntax_n('literal_pattern', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x100000000000 and p.next()):
+        return p.span(p.ast.syntax_n('literal_pattern', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x40000000000 and p.next()):
+        return p.span(p.ast.syntax_n('literal_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def literal_expr_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000010000 and (n := signed_number_r(p)) and not k.append(n)) and not p.tok.bit & 0x12000:
+        return p.span(p.ast.syntax_n('literal_expr', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x2000000000000000010000 and (n := complex_number_r(p)):
+        return n
+    if p.tok.bit & 0x800000000000000000000 and (n := strings_r(p)):
+        return n
+    if (p.tok.bit & 0x80000000000 and p.next()):
+        return p.span(p.ast.syntax_n('literal_expr', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x100000000000 and p.next()):
+        return p.span(p.ast.syntax_n('literal_expr', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x40000000000 and p.next()):
+        return p.span(p.ast.syntax_n('literal_expr', tuple(k)), tok)
+    p.tok = tok
+
+
+def complex_number_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x2000000000000000010000 and (n := signed_real_number_r(p)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x2000 and p.next()) and (p.tok.bit & 0x2000000000000000000000 and p.next()):
+            return p.span(p.ast.syntax_n('complex_number', tuple(k)), tok)
+        p.tok = after
+        if (p.tok.bit & 0x10000 and p.next()) and (p.tok.bit & 0x2000000000000000000000 and p.next()):
+            return p.span(p.ast.syntax_n('complex_number', tuple(k)), tok)
+    p.tok = tok
+
+
+def signed_number_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('signed_number', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x10000 and p.next()) and (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('signed_number', tuple(k)), tok)
+    p.tok = tok
+
+
+def signed_real_number_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('signed_real_number', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x10000 and p.next()) and (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('signed_real_number', tuple(k)), tok)
+    p.tok = tok
+
+
+def real_number_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('real_number', tuple(k)), tok)
+    p.tok = tok
+
+
+def imaginary_number_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('imaginary_number', tuple(k)), tok)
+    p.tok = tok
+
+
+def capture_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := pattern_capture_target_r(p)):
+        return n
+
+
+def pattern_capture_target_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _pattern_capture_target_1(p, k) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and not p.tok.bit & 0x200080080:
+        return p.span(p.ast.syntax_n('pattern_capture_target', tuple(k)), tok)
+    p.tok = tok
+
+def _pattern_capture_target_1(p:parser, k:'list[tree_node]'):
+    tok, k = p.tok, []
+    r = (p.tok.bit & 0x1000000000000000000000 and p.tok.str == '_' and p.next())
+    p.tok = tok
+    return not r
+
+
+def wildcard_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == '_' and p.next()):
+        return p.span(p.ast.syntax_n('wildcard_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def value_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(attr_r)) and not k.append(n)) and not p.tok.bit & 0x200080080:
+        return p.span(p.ast.syntax_n('value_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def attr_r(p:parser):
+    start = p.tok
+    if not (left := _attr_seed(p)): return
+    while True:
+        if not p.tok.bit & 0x80000: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x80000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+            left = p.span(p.ast.syntax_n('attr', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+def _attr_seed(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x80000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('attr', tuple(k)), tok)
+    p.tok = tok
+
+
+def name_or_attr_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(attr_r)):
+        return n
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('name_or_attr', tuple(k)), tok)
+    p.tok = tok
+
+
+def group_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)) and not k.append(n)) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('group_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def sequence_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200000000000 and p.next()) and ((p.tok.bit & 0x38400000003c0000010280 and (n := maybe_sequence_pattern_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x400000000000 and p.next()):
+        return p.span(p.ast.syntax_n('sequence_pattern', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x38400000003c0000010280 and (n := open_sequence_pattern_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('sequence_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def open_sequence_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x38400000003c0000010280 and (n := maybe_star_pattern_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and ((p.tok.bit & 0x38400000003c0000010280 and (n := maybe_sequence_pattern_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('open_sequence_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def maybe_sequence_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000010280 and _maybe_sequence_pattern_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+        return p.span(p.ast.syntax_n('maybe_sequence_pattern', tuple(k)), tok)
+    p.tok = tok
+
+def _maybe_sequence_pattern_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x38400000003c0000010280 and (n := maybe_star_pattern_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38400000003c0000010280 and (n := maybe_star_pattern_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def maybe_star_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x200 and (n := star_pattern_r(p)):
+        return n
+    if p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)):
+        return n
+
+
+def star_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := pattern_capture_target_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('star_pattern', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := wildcard_pattern_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('star_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def mapping_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('mapping_pattern', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x400 and (n := double_star_pattern_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('mapping_pattern', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x38000000001c0000010000 and (n := items_pattern_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x400 and (n := double_star_pattern_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('mapping_pattern', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x38000000001c0000010000 and (n := items_pattern_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('mapping_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def items_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38000000001c0000010000 and _items_pattern_1(p, k):
+        return p.span(p.ast.syntax_n('items_pattern', tuple(k)), tok)
+    p.tok = tok
+
+def _items_pattern_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x38000000001c0000010000 and (n := key_value_pattern_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38000000001c0000010000 and (n := key_value_pattern_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def key_value_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38000000001c0000010000 and _key_value_pattern_1(p, k) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('key_value_pattern', tuple(k)), tok)
+    p.tok = tok
+
+def _key_value_pattern_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x28000000001c0000010000 and (n := literal_expr_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(attr_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def double_star_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := pattern_capture_target_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('double_star_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def class_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := name_or_attr_r(p)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x100 and p.next()):
+            return p.span(p.ast.syntax_n('class_pattern', tuple(k)), tok)
+        p.tok = after
+        if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := positional_patterns_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x100 and p.next()):
+            return p.span(p.ast.syntax_n('class_pattern', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := keyword_patterns_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x100 and p.next()):
+            return p.span(p.ast.syntax_n('class_pattern', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := positional_patterns_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := keyword_patterns_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and (p.tok.bit & 0x100 and p.next()):
+            return p.span(p.ast.syntax_n('class_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def positional_patterns_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000010080 and _positional_patterns_1(p, k):
+        return p.span(p.ast.syntax_n('positional_patterns', tuple(k)), tok)
+    p.tok = tok
+
+def _positional_patterns_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def keyword_patterns_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _keyword_patterns_1(p, k):
+        return p.span(p.ast.syntax_n('keyword_patterns', tuple(k)), tok)
+    p.tok = tok
+
+def _keyword_patterns_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := keyword_pattern_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := keyword_pattern_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def keyword_pattern_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x200000000 and p.next()) and (p.tok.bit & 0x38400000003c0000010080 and (n := p.memo_rule(pattern_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('keyword_pattern', tuple(k)), tok)
+    p.tok = tok
+
+
+def return_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x8000000000000000000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('return_stmt', tuple(k)), tok)
+    p.tok = tok
+
+
+def raise_stmt_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x4000000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (_raise_stmt_1(p, k) or True):
+        return p.span(p.ast.syntax_n('raise_stmt', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x4000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('raise_stmt', tuple(k)), tok)
+    p.tok = tok
+
+def _raise_stmt_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def function_def_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x10000000000 and (n := p.memo_rule(decorators_r)) and not k.append(n)) and (p.tok.bit & 0x210000000000000 and (n := function_def_raw_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('function_def', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x210000000000000 and (n := function_def_raw_r(p)):
+        return n
+
+
+def function_def_raw_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x1000000000000000000600 and (n := params_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()) and (_function_def_raw_1(p, k) or True) and (p.tok.bit & 0x2000000 and p.next()) and ((p.tok.bit & 0x8000000000000000000000 and (n := func_type_comment_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('function_def_raw', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x10000000000000 and p.next()) and (p.tok.bit & 0x200000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x1000000000000000000600 and (n := params_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()) and (_function_def_raw_2(p, k) or True) and (p.tok.bit & 0x2000000 and p.next()) and ((p.tok.bit & 0x8000000000000000000000 and (n := func_type_comment_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('function_def_raw', tuple(k)), tok)
+    p.tok = tok
+
+def _function_def_raw_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x40000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _function_def_raw_2(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x40000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def func_type_comment_r(p:parser):
+    tok, k = p.tok, []
+
+
+def params_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000600 and (n := parameters_r(p)):
+        return n
+
+
+def parameters_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and (n := slash_no_default_r(p)) and not k.append(n)) and _parameters_1(p, k) and _parameters_2(p, k) and ((p.tok.bit & 0x600 and (n := star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and (n := slash_with_default_r(p)) and not k.append(n)) and _parameters_3(p, k) and ((p.tok.bit & 0x600 and (n := star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _parameters_4(p, k) and _parameters_5(p, k) and ((p.tok.bit & 0x600 and (n := star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _parameters_6(p, k) and ((p.tok.bit & 0x600 and (n := star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x600 and (n := star_etc_r(p)):
+        return n
+
+def _parameters_1(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _parameters_2(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _parameters_3(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _parameters_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _parameters_5(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _parameters_6(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+
+def slash_no_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _slash_no_default_1(p, k) and (p.tok.bit & 0x200000 and p.next()) and (p.tok.bit & 0x8000 and p.next()):
+        return p.span(p.ast.syntax_n('slash_no_default', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _slash_no_default_2(p, k) and (p.tok.bit & 0x200000 and p.next()) and p.tok.bit & 0x100:
+        return p.span(p.ast.syntax_n('slash_no_default', tuple(k)), tok)
+    p.tok = tok
+
+def _slash_no_default_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _slash_no_default_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): pass
+    return True
+
+
+def slash_with_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _slash_with_default_1(p, k) and _slash_with_default_2(p, k) and (p.tok.bit & 0x200000 and p.next()) and (p.tok.bit & 0x8000 and p.next()):
+        return p.span(p.ast.syntax_n('slash_with_default', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _slash_with_default_3(p, k) and _slash_with_default_4(p, k) and (p.tok.bit & 0x200000 and p.next()) and p.tok.bit & 0x100:
+        return p.span(p.ast.syntax_n('slash_with_default', tuple(k)), tok)
+    p.tok = tok
+
+def _slash_with_default_1(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _slash_with_default_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _slash_with_default_3(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _slash_with_default_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+
+def star_etc_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)) and _star_etc_1(p, k) and ((p.tok.bit & 0x400 and (n := kwds_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('star_etc', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x8000 and p.next()) and _star_etc_2(p, k) and ((p.tok.bit & 0x400 and (n := kwds_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('star_etc', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x400 and (n := kwds_r(p)):
+        return n
+
+def _star_etc_1(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_maybe_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _star_etc_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := param_maybe_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := param_maybe_default_r(p)) and not k.append(n)): pass
+    return True
+
+
+def kwds_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_no_default_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('kwds', tuple(k)), tok)
+    p.tok = tok
+
+
+def param_no_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_r)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('param_no_default', tuple(k)), tok)
+        p.tok = after
+        if p.tok.bit & 0x100:
+            return p.span(p.ast.syntax_n('param_no_default', tuple(k)), tok)
+    p.tok = tok
+
+
+def param_with_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_r)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('param_with_default', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) and p.tok.bit & 0x100:
+            return p.span(p.ast.syntax_n('param_with_default', tuple(k)), tok)
+    p.tok = tok
+
+
+def param_maybe_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(param_r)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x200008000 and ((p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('param_maybe_default', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if ((p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) or True) and p.tok.bit & 0x100:
+            return p.span(p.ast.syntax_n('param_maybe_default', tuple(k)), tok)
+    p.tok = tok
+
+
+def param_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and ((p.tok.bit & 0x2000000 and (n := annotation_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('param', tuple(k)), tok)
+    p.tok = tok
+
+
+def annotation_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('annotation', tuple(k)), tok)
+    p.tok = tok
+
+
+def default_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('default', tuple(k)), tok)
+    p.tok = tok
+
+
+def decorators_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x10000000000 and _decorators_2(p, k):
+        return p.span(p.ast.syntax_n('decorators', tuple(k)), tok)
+    p.tok = tok
+
+def _decorators_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x10000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000000000000000000000 and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _decorators_2(p:parser, k:'list[tree_node]'):
+    if not _decorators_1(p, k): return False
+    while _decorators_1(p, k): pass
+    return True
+
+
+def class_def_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x10000000000 and (n := p.memo_rule(decorators_r)) and not k.append(n)) and (p.tok.bit & 0x80000000000000 and (n := class_def_raw_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('class_def', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x80000000000000 and (n := class_def_raw_r(p)):
+        return n
+
+
+def class_def_raw_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80000000000000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (_class_def_raw_1(p, k) or True) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0xbc4ee585683c0000112280 and (n := block_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('class_def_raw', tuple(k)), tok)
+    p.tok = tok
+
+def _class_def_raw_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112680 and (n := arguments_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def block_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x8000000000000000000000 and p.next()) and (p.tok.bit & 0x40000000000000000000000 and p.next()) and (p.tok.bit & 0x3c7ee7c7f83d0000112280 and (n := statements_r(p)) and not k.append(n)) and (p.tok.bit & 0x80000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('block', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c4ee585683c0000112280 and (n := simple_stmts_r(p)):
+        return n
+
+
+def star_expressions_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expression_r(p)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x8000 and _star_expressions_2(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+            return p.span(p.ast.syntax_n('star_expressions', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('star_expressions', tuple(k)), tok)
+        p.tok = after
+        return k[0]
+
+def _star_expressions_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expression_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _star_expressions_2(p:parser, k:'list[tree_node]'):
+    if not _star_expressions_1(p, k): return False
+    while _star_expressions_1(p, k): pass
+    return True
+
+
+def star_expression_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('star_expression', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)):
+        return n
+
+
+def star_named_expressions_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112280 and _star_named_expressions_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+        return p.span(p.ast.syntax_n('star_named_expressions', tuple(k)), tok)
+    p.tok = tok
+
+def _star_named_expressions_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expression_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expression_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def star_named_expression_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('star_named_expression', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)):
+        return n
+
+
+def assignment_expression_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x4000000 and p.next()) and _assignment_expression_1(p, k) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('assignment_expression', tuple(k)), tok)
+    p.tok = tok
+
+def _assignment_expression_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if True: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def named_expression_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := assignment_expression_r(p)):
+        return n
+    if (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and not p.tok.bit & 0x4000000:
+        return p.span(p.ast.syntax_n('named_expression', tuple(k)), tok)
+    p.tok = tok
+
+
+def annotated_rhs_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := yield_expr_r(p)):
+        return n
+    if p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)):
+        return n
+
+
+def expressions_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x8000 and _expressions_2(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+            return p.span(p.ast.syntax_n('expressions', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('expressions', tuple(k)), tok)
+        p.tok = after
+        return k[0]
+
+def _expressions_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _expressions_2(p:parser, k:'list[tree_node]'):
+    if not _expressions_1(p, k): return False
+    while _expressions_1(p, k): pass
+    return True
+
+
+def expression_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c408000203c0000112080 and (n := disjunction_r(p)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x20000000000000000 and p.next()) and (p.tok.bit & 0x3c408000203c0000112080 and (n := disjunction_r(p)) and not k.append(n)) and (p.tok.bit & 0x1000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+            return p.span(p.ast.syntax_n('expression', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        return k[0]
+    if p.tok.bit & 0x200000000000000000 and (n := lambdef_r(p)):
+        return n
+
+
+def lambdef_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200000000000000000 and p.next()) and ((p.tok.bit & 0x1000000000000000000600 and (n := lambda_params_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('lambdef', tuple(k)), tok)
+    p.tok = tok
+
+
+def lambda_params_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000600 and (n := lambda_parameters_r(p)):
+        return n
+
+
+def lambda_parameters_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and (n := lambda_slash_no_default_r(p)) and not k.append(n)) and _lambda_parameters_1(p, k) and _lambda_parameters_2(p, k) and ((p.tok.bit & 0x600 and (n := lambda_star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('lambda_parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and (n := lambda_slash_with_default_r(p)) and not k.append(n)) and _lambda_parameters_3(p, k) and ((p.tok.bit & 0x600 and (n := lambda_star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('lambda_parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _lambda_parameters_4(p, k) and _lambda_parameters_5(p, k) and ((p.tok.bit & 0x600 and (n := lambda_star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('lambda_parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _lambda_parameters_6(p, k) and ((p.tok.bit & 0x600 and (n := lambda_star_etc_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('lambda_parameters', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x600 and (n := lambda_star_etc_r(p)):
+        return n
+
+def _lambda_parameters_1(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _lambda_parameters_2(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _lambda_parameters_3(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _lambda_parameters_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _lambda_parameters_5(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _lambda_parameters_6(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+
+def lambda_slash_no_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _lambda_slash_no_default_1(p, k) and (p.tok.bit & 0x200000 and p.next()) and (p.tok.bit & 0x8000 and p.next()):
+        return p.span(p.ast.syntax_n('lambda_slash_no_default', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _lambda_slash_no_default_2(p, k) and (p.tok.bit & 0x200000 and p.next()) and p.tok.bit & 0x2000000:
+        return p.span(p.ast.syntax_n('lambda_slash_no_default', tuple(k)), tok)
+    p.tok = tok
+
+def _lambda_slash_no_default_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _lambda_slash_no_default_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): pass
+    return True
+
+
+def lambda_slash_with_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and _lambda_slash_with_default_1(p, k) and _lambda_slash_with_default_2(p, k) and (p.tok.bit & 0x200000 and p.next()) and (p.tok.bit & 0x8000 and p.next()):
+        return p.span(p.ast.syntax_n('lambda_slash_with_default', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000000 and _lambda_slash_with_default_3(p, k) and _lambda_slash_with_default_4(p, k) and (p.tok.bit & 0x200000 and p.next()) and p.tok.bit & 0x2000000:
+        return p.span(p.ast.syntax_n('lambda_slash_with_default', tuple(k)), tok)
+    p.tok = tok
+
+def _lambda_slash_with_default_1(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _lambda_slash_with_default_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _lambda_slash_with_default_3(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)): pass
+    return True
+
+def _lambda_slash_with_default_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_with_default_r(p)) and not k.append(n)): pass
+    return True
+
+
+def lambda_star_etc_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)) and _lambda_star_etc_1(p, k) and ((p.tok.bit & 0x400 and (n := lambda_kwds_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('lambda_star_etc', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x8000 and p.next()) and _lambda_star_etc_2(p, k) and ((p.tok.bit & 0x400 and (n := lambda_kwds_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('lambda_star_etc', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x400 and (n := lambda_kwds_r(p)):
+        return n
+
+def _lambda_star_etc_1(p:parser, k:'list[tree_node]'):
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_maybe_default_r(p)) and not k.append(n)): pass
+    return True
+
+def _lambda_star_etc_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_maybe_default_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x1000000000000000000000 and (n := lambda_param_maybe_default_r(p)) and not k.append(n)): pass
+    return True
+
+
+def lambda_kwds_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_no_default_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('lambda_kwds', tuple(k)), tok)
+    p.tok = tok
+
+
+def lambda_param_no_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_r)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('lambda_param_no_default', tuple(k)), tok)
+        p.tok = after
+        if p.tok.bit & 0x2000000:
+            return p.span(p.ast.syntax_n('lambda_param_no_default', tuple(k)), tok)
+    p.tok = tok
+
+
+def lambda_param_with_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_r)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('lambda_param_with_default', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) and p.tok.bit & 0x2000000:
+            return p.span(p.ast.syntax_n('lambda_param_with_default', tuple(k)), tok)
+    p.tok = tok
+
+
+def lambda_param_maybe_default_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000000 and (n := p.memo_rule(lambda_param_r)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x200008000 and ((p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('lambda_param_maybe_default', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if ((p.tok.bit & 0x200000000 and (n := default_r(p)) and not k.append(n)) or True) and p.tok.bit & 0x2000000:
+            return p.span(p.ast.syntax_n('lambda_param_maybe_default', tuple(k)), tok)
+    p.tok = tok
+
+
+def lambda_param_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('lambda_param', tuple(k)), tok)
+    p.tok = tok
+
+
+def disjunction_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c408000203c0000112080 and (n := conjunction_r(p)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x1000000000000000000 and _disjunction_2(p, k):
+            return p.span(p.ast.syntax_n('disjunction', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        return k[0]
+
+def _disjunction_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x1000000000000000000 and p.next()) and (p.tok.bit & 0x3c408000203c0000112080 and (n := conjunction_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _disjunction_2(p:parser, k:'list[tree_node]'):
+    if not _disjunction_1(p, k): return False
+    while _disjunction_1(p, k): pass
+    return True
+
+
+def conjunction_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c408000203c0000112080 and (n := inversion_r(p)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x2000000000000 and _conjunction_2(p, k):
+            return p.span(p.ast.syntax_n('conjunction', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        return k[0]
+
+def _conjunction_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x2000000000000 and p.next()) and (p.tok.bit & 0x3c408000203c0000112080 and (n := inversion_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _conjunction_2(p:parser, k:'list[tree_node]'):
+    if not _conjunction_1(p, k): return False
+    while _conjunction_1(p, k): pass
+    return True
+
+
+def inversion_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x800000000000000000 and p.next()) and (p.tok.bit & 0x3c408000203c0000112080 and (n := inversion_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('inversion', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c400000203c0000112080 and (n := comparison_r(p)):
+        return n
+
+
+def comparison_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x980000001c90000004 and _comparison_1(p, k):
+            return p.span(p.ast.syntax_n('comparison', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        return k[0]
+
+def _comparison_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x980000001c90000004 and (n := compare_op_bitwise_or_pair_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x980000001c90000004 and (n := compare_op_bitwise_or_pair_r(p)) and not k.append(n)): pass
+    return True
+
+
+def compare_op_bitwise_or_pair_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x400000000 and (n := eq_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x4 and (n := noteq_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x80000000 and (n := lte_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x10000000 and (n := lt_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x1000000000 and (n := gte_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x800000000 and (n := gt_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x800000000000000000 and (n := notin_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x80000000000000000 and (n := in_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x100000000000000000 and (n := isnot_bitwise_or_r(p)):
+        return n
+    if p.tok.bit & 0x100000000000000000 and (n := is_bitwise_or_r(p)):
+        return n
+
+
+def eq_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('eq_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def noteq_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x4 and (p.tok.bit & 0x4 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('noteq_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def lte_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('lte_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def lt_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x10000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('lt_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def gte_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('gte_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def gt_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x800000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('gt_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def notin_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x800000000000000000 and p.next()) and (p.tok.bit & 0x80000000000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('notin_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def in_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80000000000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('in_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def isnot_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x100000000000000000 and p.next()) and (p.tok.bit & 0x800000000000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('isnot_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def is_bitwise_or_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x100000000000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('is_bitwise_or', tuple(k)), tok)
+    p.tok = tok
+
+
+def bitwise_or_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_xor_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x80000000000000000000: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x80000000000000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_xor_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('bitwise_or', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def bitwise_xor_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_and_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x800000000000: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x800000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_and_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('bitwise_xor', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def bitwise_and_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x3c400000203c0000112080 and (n := shift_expr_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x20: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x20 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := shift_expr_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('bitwise_and', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def shift_expr_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x3c400000203c0000112080 and (n := sum_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x2020000000: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x20000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := sum_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('shift_expr', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x2000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := sum_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('shift_expr', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def sum_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x3c400000203c0000112080 and (n := term_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x12000: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x2000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := term_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('sum', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x10000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := term_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('sum', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def term_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x10000600208: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('term', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x200000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('term', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x400000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('term', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x8 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('term', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x10000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+            left = p.span(p.ast.syntax_n('term', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def factor_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x2000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('factor', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x10000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('factor', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x400000000000000000000 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('factor', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x38400000203c0000100080 and (n := power_r(p)):
+        return n
+
+
+def power_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000203c0000100080 and (n := await_primary_r(p)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := factor_r(p)) and not k.append(n)):
+            return p.span(p.ast.syntax_n('power', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        return k[0]
+
+
+def await_primary_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x20000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := primary_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('await_primary', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x38400000003c0000100080 and (n := primary_r(p)):
+        return n
+
+
+def primary_r(p:parser):
+    start = p.tok
+    if not (p.tok.bit & 0x38400000003c0000100080 and (n := atom_r(p))): return
+    left = n
+    while True:
+        if not p.tok.bit & 0x200000080080: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x80000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+            left = p.span(p.ast.syntax_n('primary', tuple(k)), start); continue
+        p.tok = tok
+        if p.tok.bit & 0x80 and (n := genexp_r(p)):
+            k.append(n)
+            left = p.span(p.ast.syntax_n('primary', tuple(k)), start); continue
+        if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112680 and (n := arguments_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()):
+            left = p.span(p.ast.syntax_n('primary', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x200000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0002112080 and (n := slices_r(p)) and not k.append(n)) and (p.tok.bit & 0x400000000000 and p.next()):
+            left = p.span(p.ast.syntax_n('primary', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+
+def slices_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x3c40a000203c0002112080 and (n := p.memo_rule(slice_r)) and not k.append(n)) and not p.tok.bit & 0x8000:
+        return p.span(p.ast.syntax_n('slices', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0002112080 and _slices_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+        return p.span(p.ast.syntax_n('slices', tuple(k)), tok)
+    p.tok = tok
+
+def _slices_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0002112080 and (n := p.memo_rule(slice_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0002112080 and (n := p.memo_rule(slice_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def slice_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0002112080 and ((p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) or True) and (p.tok.bit & 0x2000000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) or True) and (_slice_1(p, k) or True):
+        return p.span(p.ast.syntax_n('slice', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)):
+        return n
+
+def _slice_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x2000000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) or True): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def atom_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x100000000000 and p.next()):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x40000000000 and p.next()):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x80000000000 and p.next()):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x800000000000000000000 and (n := strings_r(p)):
+        return n
+    if (p.tok.bit & 0x2000000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x80 and _atom_1(p, k):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x200000000000 and _atom_2(p, k):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x40000000000000000000 and _atom_3(p, k):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x100000 and p.next()):
+        return p.span(p.ast.syntax_n('atom', tuple(k)), tok)
+    p.tok = tok
+
+def _atom_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x80 and (n := tuple_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x80 and (n := group_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x80 and (n := genexp_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _atom_2(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x200000000000 and (n := list_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x200000000000 and (n := listcomp_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _atom_3(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x40000000000000000000 and (n := dict_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x40000000000000000000 and (n := set_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x40000000000000000000 and (n := dictcomp_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x40000000000000000000 and (n := setcomp_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def strings_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x800000000000000000000 and _strings_1(p, k):
+        return p.span(p.ast.syntax_n('strings', tuple(k)), tok)
+    p.tok = tok
+
+def _strings_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x800000000000000000000 and p.next()): return False
+    while p.tok.bit & 0x800000000000000000000: p.next()
+    return True
+
+
+def list_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200000000000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expressions_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x400000000000 and p.next()):
+        return p.span(p.ast.syntax_n('list', tuple(k)), tok)
+    p.tok = tok
+
+
+def listcomp_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x4010000000000000 and (n := for_if_clauses_r(p)) and not k.append(n)) and (p.tok.bit & 0x400000000000 and p.next()):
+        return p.span(p.ast.syntax_n('listcomp', tuple(k)), tok)
+    p.tok = tok
+
+
+def tuple_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and (_tuple_1(p, k) or True) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('tuple', tuple(k)), tok)
+    p.tok = tok
+
+def _tuple_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x8000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expressions_r(p)) and not k.append(n)) or True): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def group_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and _group_1(p, k) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('group', tuple(k)), tok)
+    p.tok = tok
+
+def _group_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x1000000000000000000000 and (n := yield_expr_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def genexp_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and _genexp_1(p, k) and (p.tok.bit & 0x4010000000000000 and (n := for_if_clauses_r(p)) and not k.append(n)) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('genexp', tuple(k)), tok)
+    p.tok = tok
+
+def _genexp_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x1000000000000000000000 and (n := assignment_expression_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and not p.tok.bit & 0x4000000: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def set_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := star_named_expressions_r(p)) and not k.append(n)) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('set', tuple(k)), tok)
+    p.tok = tok
+
+
+def setcomp_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := named_expression_r(p)) and not k.append(n)) and (p.tok.bit & 0x4010000000000000 and (n := for_if_clauses_r(p)) and not k.append(n)) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('setcomp', tuple(k)), tok)
+    p.tok = tok
+
+
+def dict_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112480 and (n := double_starred_kvpairs_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('dict', tuple(k)), tok)
+    p.tok = tok
+
+
+def dictcomp_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x40000000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := kvpair_r(p)) and not k.append(n)) and (p.tok.bit & 0x4010000000000000 and (n := for_if_clauses_r(p)) and not k.append(n)) and (p.tok.bit & 0x200000000000000000000 and p.next()):
+        return p.span(p.ast.syntax_n('dictcomp', tuple(k)), tok)
+    p.tok = tok
+
+
+def double_starred_kvpairs_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112480 and _double_starred_kvpairs_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+        return p.span(p.ast.syntax_n('double_starred_kvpairs', tuple(k)), tok)
+    p.tok = tok
+
+def _double_starred_kvpairs_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112480 and (n := double_starred_kvpair_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112480 and (n := double_starred_kvpair_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def double_starred_kvpair_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c400000203c0000112080 and (n := bitwise_or_r(p)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('double_starred_kvpair', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x3c40a000203c0000112080 and (n := kvpair_r(p)):
+        return n
+
+
+def kvpair_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and (p.tok.bit & 0x2000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('kvpair', tuple(k)), tok)
+    p.tok = tok
+
+
+def for_if_clauses_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x4010000000000000 and _for_if_clauses_1(p, k):
+        return p.span(p.ast.syntax_n('for_if_clauses', tuple(k)), tok)
+    p.tok = tok
+
+def _for_if_clauses_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x4010000000000000 and (n := for_if_clause_r(p)) and not k.append(n)): return False
+    while (p.tok.bit & 0x4010000000000000 and (n := for_if_clause_r(p)) and not k.append(n)): pass
+    return True
+
+
+def for_if_clause_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x10000000000000 and p.next()) and (p.tok.bit & 0x4000000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_r(p)) and not k.append(n)) and (p.tok.bit & 0x80000000000000000 and p.next()) and _for_if_clause_1(p, k) and (p.tok.bit & 0x3c408000203c0000112080 and (n := disjunction_r(p)) and not k.append(n)) and _for_if_clause_3(p, k):
+        return p.span(p.ast.syntax_n('for_if_clause', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x4000000000000000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_r(p)) and not k.append(n)) and (p.tok.bit & 0x80000000000000000 and p.next()) and _for_if_clause_4(p, k) and (p.tok.bit & 0x3c408000203c0000112080 and (n := disjunction_r(p)) and not k.append(n)) and _for_if_clause_6(p, k):
+        return p.span(p.ast.syntax_n('for_if_clause', tuple(k)), tok)
+    p.tok = tok
+
+def _for_if_clause_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if True: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _for_if_clause_2(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x20000000000000000 and p.next()) and (p.tok.bit & 0x3c408000203c0000112080 and (n := disjunction_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _for_if_clause_3(p:parser, k:'list[tree_node]'):
+    while _for_if_clause_2(p, k): pass
+    return True
+
+def _for_if_clause_4(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if True: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _for_if_clause_5(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x20000000000000000 and p.next()) and (p.tok.bit & 0x3c408000203c0000112080 and (n := disjunction_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _for_if_clause_6(p:parser, k:'list[tree_node]'):
+    while _for_if_clause_5(p, k): pass
+    return True
+
+
+def yield_expr_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'yield' and p.next()) and (p.tok.bit & 0x8000000000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('yield_expr', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str == 'yield' and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112280 and (n := star_expressions_r(p)) and not k.append(n)) or True):
+        return p.span(p.ast.syntax_n('yield_expr', tuple(k)), tok)
+    p.tok = tok
+
+
+def arguments_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x3c40a000203c0000112680 and (n := args_r(p)) and not k.append(n)) and ((p.tok.bit & 0x8000 and p.next()) or True) and p.tok.bit & 0x100:
+        return p.span(p.ast.syntax_n('arguments', tuple(k)), tok)
+    p.tok = tok
+
+
+def arg_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x200 and (n := p.memo_rule(starred_expression_r)):
+        return n
+    if p.tok.bit & 0x3c40a000203c0000112080 and _arg_1(p, k) and not p.tok.bit & 0x200000000:
+        return p.span(p.ast.syntax_n('arg', tuple(k)), tok)
+    p.tok = tok
+
+def _arg_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x1000000000000000000000 and (n := assignment_expression_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    if (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)) and not p.tok.bit & 0x4000000: return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def args_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x3c40a000203c0000112280 and _args_1(p, k) and (_args_2(p, k) or True):
+        return p.span(p.ast.syntax_n('args', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000600 and (n := kwargs_r(p)):
+        return n
+
+def _args_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x3c40a000203c0000112280 and (n := arg_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112280 and (n := arg_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _args_2(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000600 and (n := kwargs_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def kwargs_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x1000000000000000000200 and _kwargs_1(p, k) and (p.tok.bit & 0x8000 and p.next()) and _kwargs_2(p, k):
+        return p.span(p.ast.syntax_n('kwargs', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000200 and _kwargs_3(p, k):
+        return p.span(p.ast.syntax_n('kwargs', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x1000000000000000000400 and _kwargs_4(p, k):
+        return p.span(p.ast.syntax_n('kwargs', tuple(k)), tok)
+    p.tok = tok
+
+def _kwargs_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000200 and (n := p.memo_rule(kwarg_or_starred_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000200 and (n := p.memo_rule(kwarg_or_starred_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _kwargs_2(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000400 and (n := kwarg_or_double_starred_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000400 and (n := kwarg_or_double_starred_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _kwargs_3(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000200 and (n := p.memo_rule(kwarg_or_starred_r)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000200 and (n := p.memo_rule(kwarg_or_starred_r)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+def _kwargs_4(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x1000000000000000000400 and (n := kwarg_or_double_starred_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x1000000000000000000400 and (n := kwarg_or_double_starred_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def starred_expression_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('starred_expression', tuple(k)), tok)
+    p.tok = tok
+
+
+def kwarg_or_starred_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x200000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('kwarg_or_starred', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x200 and (n := p.memo_rule(starred_expression_r)):
+        return n
+
+
+def kwarg_or_double_starred_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and (p.tok.bit & 0x200000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('kwarg_or_double_starred', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x400 and p.next()) and (p.tok.bit & 0x3c40a000203c0000112080 and (n := p.memo_rule(expression_r)) and not k.append(n)):
+        return p.span(p.ast.syntax_n('kwarg_or_double_starred', tuple(k)), tok)
+    p.tok = tok
+
+
+def star_targets_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)):
+        k.append(n)
+        after = p.tok
+        if not p.tok.bit & 0x8000:
+            return p.span(p.ast.syntax_n('star_targets', tuple(k)), tok)
+        p.tok = after
+        if _star_targets_2(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+            return p.span(p.ast.syntax_n('star_targets', tuple(k)), tok)
+    p.tok = tok
+
+def _star_targets_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _star_targets_2(p:parser, k:'list[tree_node]'):
+    while _star_targets_1(p, k): pass
+    return True
+
+
+def star_targets_list_seq_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100280 and _star_targets_list_seq_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+        return p.span(p.ast.syntax_n('star_targets_list_seq', tuple(k)), tok)
+    p.tok = tok
+
+def _star_targets_list_seq_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def star_targets_tuple_seq_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)):
+        k.append(n)
+        after = p.tok
+        if p.tok.bit & 0x8000 and _star_targets_tuple_seq_2(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+            return p.span(p.ast.syntax_n('star_targets_tuple_seq', tuple(k)), tok)
+        p.tok = after
+        del k[1:]
+        if (p.tok.bit & 0x8000 and p.next()):
+            return p.span(p.ast.syntax_n('star_targets_tuple_seq', tuple(k)), tok)
+    p.tok = tok
+
+def _star_targets_tuple_seq_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if (p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+def _star_targets_tuple_seq_2(p:parser, k:'list[tree_node]'):
+    if not _star_targets_tuple_seq_1(p, k): return False
+    while _star_targets_tuple_seq_1(p, k): pass
+    return True
+
+
+def star_target_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x200 and p.next()) and _star_target_1(p, k):
+        return p.span(p.ast.syntax_n('star_target', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if p.tok.bit & 0x38400000003c0000100080 and (n := target_with_star_atom_r(p)):
+        return n
+
+def _star_target_1(p:parser, k:'list[tree_node]'):
+    tok, nk = p.tok, len(k)
+    if p.tok.bit & 0x38400000003c0000100280 and not p.tok.bit & 0x200 and (p.tok.bit & 0x38400000003c0000100280 and (n := star_target_r(p)) and not k.append(n)): return True
+    p.tok = tok
+    del k[nk:]
+    return False
+
+
+def target_with_star_atom_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100080 and (n := p.memo_rule(single_subscript_attribute_target_r)):
+        return n
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('target_with_star_atom', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x200000000080 and (n := star_atom_r(p)):
+        return n
+
+
+def star_atom_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := target_with_star_atom_r(p)) and not k.append(n)) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('star_atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_tuple_seq_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('star_atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200000000000 and p.next()) and ((p.tok.bit & 0x38400000003c0000100280 and (n := star_targets_list_seq_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x400000000000 and p.next()):
+        return p.span(p.ast.syntax_n('star_atom', tuple(k)), tok)
+    p.tok = tok
+
+
+def v_single_target_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := single_target_r(p)) and not k.append(n)) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('v_single_target', tuple(k)), tok)
+    p.tok = tok
+
+
+def single_target_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100080 and (n := p.memo_rule(single_subscript_attribute_target_r)):
+        return n
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('single_target', tuple(k)), tok)
+    p.tok = tok
+    if p.tok.bit & 0x80 and (n := v_single_target_r(p)):
+        return n
+
+
+def single_subscript_attribute_target_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100080 and (n := t_primary_r(p)):
+        k.append(n)
+        after = p.tok
+        if (p.tok.bit & 0x80000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and not p.tok.bit & 0x200000080080:
+            return p.span(p.ast.syntax_n('single_subscript_attribute_target', tuple(k)), tok)
+        p.tok = after
+        if (p.tok.bit & 0x200000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0002112080 and (n := slices_r(p)) and not k.append(n)) and (p.tok.bit & 0x400000000000 and p.next()) and not p.tok.bit & 0x200000080080:
+            return p.span(p.ast.syntax_n('single_subscript_attribute_target', tuple(k)), tok)
+    p.tok = tok
+
+
+def del_targets_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100080 and _del_targets_1(p, k) and ((p.tok.bit & 0x8000 and p.next()) or True):
+        return p.span(p.ast.syntax_n('del_targets', tuple(k)), tok)
+    p.tok = tok
+
+def _del_targets_1(p:parser, k:'list[tree_node]'):
+    if not (p.tok.bit & 0x38400000003c0000100080 and (n := del_target_r(p)) and not k.append(n)): return False
+    while True:
+        tok = p.tok
+        if not ((p.tok.bit & 0x8000 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := del_target_r(p)) and not k.append(n))):
+            p.tok = tok
+            return True
+
+
+def del_target_r(p:parser):
+    tok, k = p.tok, []
+    if p.tok.bit & 0x38400000003c0000100080 and (n := p.memo_rule(single_subscript_attribute_target_r)):
+        return n
+    if p.tok.bit & 0x1000000000200000000080 and (n := del_t_atom_r(p)):
+        return n
+
+
+def del_t_atom_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()):
+        return p.span(p.ast.syntax_n('del_t_atom', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x80 and p.next()) and (p.tok.bit & 0x38400000003c0000100080 and (n := del_target_r(p)) and not k.append(n)) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('del_t_atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x38400000003c0000100080 and (n := del_targets_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()):
+        return p.span(p.ast.syntax_n('del_t_atom', tuple(k)), tok)
+    p.tok = tok
+    k.clear()
+    if (p.tok.bit & 0x200000000000 and p.next()) and ((p.tok.bit & 0x38400000003c0000100080 and (n := del_targets_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x400000000000 and p.next()):
+        return p.span(p.ast.syntax_n('del_t_atom', tuple(k)), tok)
+    p.tok = tok
+
+
+def t_primary_r(p:parser):
+    start = p.tok
+    if not (left := _t_primary_seed(p)): return
+    while True:
+        if not p.tok.bit & 0x200000080080: return left
+        tok, k = p.tok, [left]
+        if (p.tok.bit & 0x80000 and p.next()) and (p.tok.bit & 0x1000000000000000000000 and p.tok.str not in keywords and p.next()) and p.tok.bit & 0x200000080080:
+            left = p.span(p.ast.syntax_n('t_primary', tuple(k)), start); continue
+        p.tok = tok
+        if (p.tok.bit & 0x200000000000 and p.next()) and (p.tok.bit & 0x3c40a000203c0002112080 and (n := slices_r(p)) and not k.append(n)) and (p.tok.bit & 0x400000000000 and p.next()) and p.tok.bit & 0x200000080080:
+            left = p.span(p.ast.syntax_n('t_primary', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x80 and (n := genexp_r(p)) and not k.append(n)) and p.tok.bit & 0x200000080080:
+            left = p.span(p.ast.syntax_n('t_primary', tuple(k)), start); continue
+        p.tok = tok
+        del k[1:]
+        if (p.tok.bit & 0x80 and p.next()) and ((p.tok.bit & 0x3c40a000203c0000112680 and (n := arguments_r(p)) and not k.append(n)) or True) and (p.tok.bit & 0x100 and p.next()) and p.tok.bit & 0x200000080080:
+            left = p.span(p.ast.syntax_n('t_primary', tuple(k)), start); continue
+        p.tok = tok
+        return left
+
+def _t_primary_seed(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x38400000003c0000100080 and (n := atom_r(p)) and not k.append(n)) and p.tok.bit & 0x200000080080:
+        return p.span(p.ast.syntax_n('t_primary', tuple(k)), tok)
+    p.tok = tok
+
+
+def t_lookahead_r(p:parser):
+    tok, k = p.tok, []
+    if (p.tok.bit & 0x80 and p.next()):
+        return p.span(p.ast.syntax_n('t_lookahead', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x200000000000 and p.next()):
+        return p.span(p.ast.syntax_n('t_lookahead', tuple(k)), tok)
+    p.tok = tok
+    if (p.tok.bit & 0x80000 and p.next()):
+        return p.span(p.ast.syntax_n('t_lookahead', tuple(k)), tok)
+    p.tok = tok
+
+
+def parse(p:parser):
+    '''file_r past the newline the lexer starts every file with'''
+    if p.nextnewline(): return file_r(p)
@@ -0,0 +1,98 @@
+# cyserver.py
+import dataclasses
+import hashlib
+import json
+import os
+import socketserver
+import sys
+import time
+from collections import OrderedDict
+import cycache
+import cyclient
+import main as driver
+
+class compile_server(socketserver.UnixStreamServer):
+    '''
+    a long running compiler on a unix socket, the modules, compiled
+    lexer patterns and token cache stay loaded between requests
+
+    a request is one line of json naming a file by path or carrying its
+    source, the reply one line of json with the fields of main.compile_result,
+    results are kept by the hash of the source so a repeated compile of an
+    unchanged file is answered without compiling it again
+    '''
+
+    def __init__(self, path:str, cache:'cycache.tokcache|None'=None, max_results:int=256):
+        self.cache = cache
+        self.results:'OrderedDict[tuple, driver.compile_result]' = OrderedDict()
+        self.max_results = max_results
+        self.compiles = self.hits = 0
+        self.done = False
+        if os.path.exists(path):
+            try: cyclient.request({'ping':True}, path)
+            except OSError: os.unlink(path) # left behind by a server that died
+            else: raise OSError(f'a server is already listening on {path}')
+        super().__init__(path, handler)
+
+    def compile(self, req:dict):
+        filename, source = req['filename'], req.get('source')
+        if not (isinstance(filename, str) and isinstance(req['path'] if source is None else source, str)):
+            raise TypeError('filename, source and path must be strings')
+        if source is not None: file = source.encode()
+        else:
+            try:
+                with open(req['path'], 'rb') as f: file = f.read()
+            except OSError as e:
+                return driver.compile_result(filename, False, f'{e}\n', 0, 0.0), False
+        key = (hashlib.sha256(file).digest(), filename, bool(req.get('stream')), bool(req.get('arena')))
+        if r := self.results.get(key):
+            self.results.move_to_end(key)
+            self.hits += 1
+            return r, True
+        r = driver.compile_file(filename, key[2], file=file, cache=self.cache, arena=key[3])
+        self.compiles += 1
+        self.results[key] = r
+        if len(self.results) > self.max_results: self.results.popitem(last=False)
+        return r, False
+
+    def reply(self, req:dict):
+        if req.get('ping'): return {'ok':True, 'compiles':self.compiles, 'hits':self.hits}
+        if req.get('shutdown'):
+            self.done = True
+            return {'ok':True}
+        start = time.perf_counter()
+        r, cached = self.compile(req)
+        return dict(dataclasses.asdict(r), cached=cached, seconds=time.perf_counter() - start)
+
+    def serve(self):
+        try:
+            while not self.done: self.handle_request()
+        finally:
+            self.server_close()
+            os.unlink(self.server_address)
+
+class handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        server:compile_server = self.server
+        try:
+            req = json.loads(self.rfile.readline())
+            if not isinstance(req, dict): raise TypeError(f'a request is a json object, not {type(req).__name__}')
+            reply = server.reply(req)
+        except (ValueError, KeyError, TypeError) as e:
+            reply = {'ok':False, 'output':f'bad request: {e}\n'}
+        self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+def serve(path:'str|None'=None, cache:'cycache.tokcache|None'=None):
+    compile_server(path or cyclient.default_socket(), cache).serve()
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    path = next((a[len('--socket='):] for a in args if a.startswith('--socket=')), None)
+    # --cache uses the default cache directory, --cache=path another one
+    cachedir = next((a[len('--cache='):] or cycache.default_dir()
+        for a in args if a.startswith('--cache')), None)
+    if '--stop' in args:
+        cyclient.request({'shutdown':True}, path)
+        exit(0)
+    serve(path, cachedir and cycache.tokcache(cachedir))
@@ -1,333 +1,426 @@
 # cytree.py
-from dataclasses import dataclass
-import cylexer
+from dataclasses import dataclass, field
+from typing import Sequence
 from cycompiler import context, context_paths
 
+@dataclass(slots=True)
 class tree_node:
+    # the token indices a rule parsed the node from, set by parser.rule,
+    # keyword only so they follow the fields of every node's constructor
+    start:int = field(default=-1, kw_only=True, repr=False, compare=False)
+    end:int = field(default=-1, kw_only=True, repr=False, compare=False)
 
     def asm(self, ctx: context) -> context_paths:
         name = self.__class__.__name__
         msg = f"asm not implemented for '{name}'"
         raise NotImplementedError(msg)
 
+    def setrange(self, ctx: context):
+        '''ctx moved to the node's span, for the nodes whose position matters'''
+        return ctx.setrange(self.start, self.end) if self.start >= 0 else ctx
 
-@dataclass
-class tree_range_n(tree_node):
-    node:tree_node
-    start_tok:cylexer.lextok
-    next_tok:cylexer.lextok
 
-    def asm(self, ctx: context) -> context_paths:
-        ctx = ctx.setrange(self.start_tok.tidx, self.next_tok.tidx)
-        return self.node.asm(ctx)
+class lowering:
+    '''
+    how the lower of a node reaches its children, the object tree hands
+    it the child nodes and cyarena.arena the handles of its rows
+    '''
+
+    def asm(self, n:tree_node, ctx: context) -> context_paths:
+        return n.asm(ctx)
+
+    def setrange(self, n:tree_node, ctx: context):
+        return n.setrange(ctx)
 
+nodes = lowering()
 
-@dataclass
+
+@dataclass(slots=True)
 class program_n(tree_node):
     stmt:tree_node
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.stmt)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, stmt:'tree_node|int') -> context_paths:
         fctx = context('frame', 'program')
-        fpaths = self.stmt.asm(fctx)
+        fpaths = lw.asm(stmt, fctx)
         return ctx.catch_frame(fctx, fpaths)
 
 
-@dataclass
+@dataclass(slots=True)
 class int_lit_n(tree_node):
     num:str
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = ctx.inst('int-l', self.num)
+        return self.lower(nodes, ctx, self.num)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, num:str) -> context_paths:
+        paths, ctx = ctx.inst('int-l', num)
         return ctx.join_nxt(paths)
 
 
-@dataclass
+@dataclass(slots=True)
 class string_n(tree_node):
     strings:tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class idf_n(tree_node):
     name:str
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = ctx.inst('idf-val', self.name)
+        return self.lower(nodes, ctx, self.name)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, name:str) -> context_paths:
+        paths, ctx = ctx.inst('idf-val', name)
         return ctx.join_nxt(paths)
 
 
-@dataclass
+@dataclass(slots=True)
 class bool_n(tree_node):
     value:'bool|None'
 
 
-@dataclass
+@dataclass(slots=True)
 class ellipsis_n(tree_node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class statements_n(tree_node):
     exprs:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.exprs)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, exprs:'Sequence[tree_node|int]') -> context_paths:
         paths, ctx = ctx.join_nxt().split_nxt()
-        for expr in self.exprs:
-            paths, ctx = expr.asm(ctx).split_nxt(paths)
+        for expr in exprs:
+            paths, ctx = lw.asm(expr, lw.setrange(expr, ctx)).split_nxt(paths)
             paths, ctx = ctx.inst('del', 'reg', paths)
         return ctx.join_nxt(paths)
 
+def statements(n:tree_node):
+    '''the statements of a statements_n, None for any other node'''
+    return n.exprs if isinstance(n, statements_n) else None
+
 
-@dataclass
+@dataclass(slots=True)
 class raise_n(tree_node):
     expr:tree_node
 
-@dataclass
+@dataclass(slots=True)
 class yield_n(tree_node):
     expr:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.expr.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.expr)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, expr:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(expr, ctx).set_stack()
         paths, ctx = ctx.push_reg(paths)
         paths, ctx = ctx.inst('yield', 'reg', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class hint_n(tree_node):
     trgt:tree_node
     hint:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.trgt.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.trgt, self.hint)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, trgt:'tree_node|int', hint:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(trgt, ctx).set_stack()
         paths, ctx = ctx.push_reg(paths)
-        paths, ctx = self.hint.asm(ctx).split_nxt(paths)
+        paths, ctx = lw.asm(hint, ctx).split_nxt(paths)
         paths, ctx = ctx.push_reg(paths)
         paths, ctx = ctx.reg_peeks(2, paths)
         paths, ctx = ctx.inst('hint', 'var,hint', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class kwarg_n(tree_node):
     name:str
     expr:tree_node
 
-@dataclass
+@dataclass(slots=True)
 class star_n(tree_node):
     iterable:tree_node
 
-@dataclass
+@dataclass(slots=True)
 class kw_star_n(tree_node):
     expr:tree_node
 
-@dataclass
+@dataclass(slots=True)
 class arguments_n(tree_node):
     exprs:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.exprs)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, exprs:'Sequence[tree_node|int]') -> context_paths:
         paths, ctx = ctx.set_stack()
-        for expr in self.exprs:
-            paths, ctx = expr.asm(ctx).split_nxt(paths)
+        for expr in exprs:
+            paths, ctx = lw.asm(expr, ctx).split_nxt(paths)
             paths, ctx = ctx.push_reg(paths)
-        paths, ctx = ctx.reg_peeks(len(self.exprs), paths)
+        paths, ctx = ctx.reg_peeks(len(exprs), paths)
         paths, ctx = ctx.inst('group', 'args', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class call_n(tree_node):
     func:tree_node
     args:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.func.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.func, self.args)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, func:'tree_node|int', args:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(func, ctx).set_stack()
         paths, ctx = ctx.push_reg(paths)
-        paths, ctx = self.args.asm(ctx).split_nxt(paths)
+        paths, ctx = lw.asm(args, ctx).split_nxt(paths)
         paths, ctx = ctx.push_reg(paths)
         paths, ctx = ctx.reg_peeks(2, paths)
         paths, ctx = ctx.inst('call', 'func,args', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class attribute_ref_n(tree_node):
     prim:tree_node
     attrib:str
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.prim.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.prim, self.attrib)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, prim:'tree_node|int', attrib:str) -> context_paths:
+        paths, ctx = lw.asm(prim, ctx).set_stack()
         paths, ctx = ctx.push_reg()
-        paths, ctx = ctx.inst('attrib', self.attrib, paths)
+        paths, ctx = ctx.inst('attrib', attrib, paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class attribute_trgt_n(tree_node):
     prim:tree_node
     attrib:str
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.prim.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.prim, self.attrib)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, prim:'tree_node|int', attrib:str) -> context_paths:
+        paths, ctx = lw.asm(prim, ctx).set_stack()
         paths, ctx = ctx.push_reg()
-        paths, ctx = ctx.inst('attrib-ref', self.attrib, paths)
+        paths, ctx = ctx.inst('attrib-ref', attrib, paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class slice_n(tree_node):
     arg1:'tree_node|None'
     arg2:'tree_node|None'
     arg3:'tree_node|None'
 
 
-@dataclass
+@dataclass(slots=True)
 class subscript_n(tree_node):
     prim:tree_node
     arg:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.prim.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.prim, self.arg)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, prim:'tree_node|int', arg:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(prim, ctx).set_stack()
         paths, ctx = ctx.push_reg(paths)
-        paths, ctx = self.arg.asm(ctx).split_nxt(paths)
+        paths, ctx = lw.asm(arg, ctx).split_nxt(paths)
         paths, ctx = ctx.push_reg(paths)
         paths, ctx = ctx.reg_peeks(2, paths)
         paths, ctx = ctx.inst('subscript', 'get', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class subscript_trgt_n(tree_node):
     prim:tree_node
     arg:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.prim.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.prim, self.arg)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, prim:'tree_node|int', arg:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(prim, ctx).set_stack()
         paths, ctx = ctx.push_reg(paths)
-        paths, ctx = self.arg.asm(ctx).split_nxt(paths)
+        paths, ctx = lw.asm(arg, ctx).split_nxt(paths)
         paths, ctx = ctx.push_reg(paths)
         paths, ctx = ctx.reg_peeks(2, paths)
         paths, ctx = ctx.inst('subscript', 'ref', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class idf_trgt_n(tree_node):
     name:str
 
     def asm(self, ctx: context) -> context_paths:
-        path, ctx = ctx.inst('idf-ref', self.name)
+        return self.lower(nodes, ctx, self.name)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, name:str) -> context_paths:
+        path, ctx = ctx.inst('idf-ref', name)
         return ctx.join_nxt(path)
 
 
-@dataclass
+@dataclass(slots=True)
 class star_trgt_n(tree_node):
     expr:tree_node
 
-@dataclass
+@dataclass(slots=True)
 class tuple_trgt_n(tree_node):
     trgts:tuple[tree_node, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class tuple_n(tree_node):
     exprs:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.exprs)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, exprs:'Sequence[tree_node|int]') -> context_paths:
         paths, ctx = ctx.set_stack()
-        for expr in self.exprs:
-            paths, ctx = expr.asm(ctx).split_nxt(paths)
+        for expr in exprs:
+            paths, ctx = lw.asm(expr, ctx).split_nxt(paths)
             paths, ctx = ctx.push_reg(paths)
-        paths, ctx = ctx.reg_peeks(len(self.exprs), paths)
+        paths, ctx = ctx.reg_peeks(len(exprs), paths)
         paths, ctx = ctx.inst('group', 'tuple', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class list_trgt_n(tree_node):
     exprs:tuple[tree_node, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class list_n(tree_node):
     exprs:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.exprs)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, exprs:'Sequence[tree_node|int]') -> context_paths:
         paths, ctx = ctx.set_stack()
-        for expr in self.exprs:
-            paths, ctx = expr.asm(ctx).split_nxt(paths)
+        for expr in exprs:
+            paths, ctx = lw.asm(expr, ctx).split_nxt(paths)
             paths, ctx = ctx.push_reg(paths)
-        paths, ctx = ctx.reg_peeks(len(self.exprs), paths)
+        paths, ctx = ctx.reg_peeks(len(exprs), paths)
         paths, ctx = ctx.inst('group', 'list', paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class iter_n(tree_node):
     iterable:tree_node
     pass
 
-@dataclass
+@dataclass(slots=True)
 class for_n(tree_node):
     trgt:tree_node
     iterable:tree_node
     block:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.iterable.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.trgt, self.iterable, self.block)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, trgt:'tree_node|int', iterable:'tree_node|int', block:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(iterable, ctx).set_stack()
         paths, ctx = ctx.inst('iterator', 'reg', paths)
         paths, ctx = ctx.push_reg(paths)
-        paths, ctx = self.trgt.asm(ctx).split_nxt(paths)
+        paths, ctx = lw.asm(trgt, ctx).split_nxt(paths)
         paths, ctx = ctx.push_reg(paths)
         lctx = lctx_start = context('frame', 'loop')
         lpaths, lctx = lctx.reg_peeks(2)
         lpaths, lctx = lctx.inst('next', 'iter,trgt', lpaths)
-        lpaths, lctx = self.block.asm(lctx).split_nxt(lpaths)
+        lpaths, lctx = lw.asm(block, lctx).split_nxt(lpaths)
         lpaths, lctx = lctx.inst('del', 'reg', lpaths)
         lpaths = lctx.join_nxt(lpaths)
         return ctx.catch_frame(lctx_start, lpaths, paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class if_n(tree_node):
     test:tree_node
     true_block:tree_node
     false_block:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.test.asm(ctx).split_nxt()
+        return self.lower(nodes, ctx, self.test, self.true_block, self.false_block)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, test:'tree_node|int', true_block:'tree_node|int', false_block:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(test, ctx).split_nxt()
         paths, tctx, fctx = ctx.branch(paths)
         tpaths, tctx = tctx.inst('del', 'reg')
         fpaths, fctx = fctx.inst('del', 'reg')
-        tpaths = self.true_block.asm(tctx).join(tpaths)
-        fpaths = self.false_block.asm(fctx).join(fpaths)
+        tpaths = lw.asm(true_block, tctx).join(tpaths)
+        fpaths = lw.asm(false_block, fctx).join(fpaths)
         return paths.join(tpaths, fpaths)
 
 
-@dataclass
+@dataclass(slots=True)
 class pass_n(tree_node):
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context) -> context_paths:
         return ctx.join_nxt()
 
 
-@dataclass
+@dataclass(slots=True)
 class continue_n(tree_node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class async_n(tree_node):
     expr:tree_node
 
-@dataclass
+@dataclass(slots=True)
 class generator_n(tree_node):
     stmt:tree_node
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.stmt)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, stmt:'tree_node|int') -> context_paths:
         gctx = context('frame', 'generator')
-        gpaths = self.stmt.asm(gctx)
+        gpaths = lw.asm(stmt, gctx)
         return ctx.catch_frame(gctx, gpaths)
 
 
-@dataclass
+@dataclass(slots=True)
 class or_block_n(tree_node):
     '''
     calls each test in sequence and
@@ -338,16 +431,20 @@ class or_block_n(tree_node):
     exprs:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.exprs)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, exprs:'Sequence[tree_node|int]') -> context_paths:
         paths, fctx = ctx.inst('bool', 'False')
-        for expr in self.exprs:
+        for expr in exprs:
             paths, fctx = fctx.inst('del', 'reg', paths)
-            paths, fctx = expr.asm(fctx).split_nxt(paths)
+            paths, fctx = lw.asm(expr, fctx).split_nxt(paths)
             paths, tctx, fctx = fctx.branch(paths)
             paths = tctx.join_nxt(paths)
         return fctx.join_nxt(paths)
 
 
-@dataclass
+@dataclass(slots=True)
 class and_block_n(tree_node):
     '''
     calls each test in sequence and
@@ -358,25 +455,33 @@ class and_block_n(tree_node):
     exprs:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
+        return self.lower(nodes, ctx, self.exprs)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, exprs:'Sequence[tree_node|int]') -> context_paths:
         paths, tctx = ctx.inst('bool', 'True')
-        for expr in self.exprs:
+        for expr in exprs:
             paths, tctx = tctx.inst('del', 'reg', paths)
-            paths, tctx = expr.asm(tctx).split_nxt(paths)
+            paths, tctx = lw.asm(expr, tctx).split_nxt(paths)
             paths, tctx, fctx = tctx.branch(paths)
             paths = fctx.join_nxt(paths)
         return tctx.join_nxt(paths)
 
 
-@dataclass
+@dataclass(slots=True)
 class assignment_n(tree_node):
     expr:tree_node
     trgts:tuple[tree_node, ...]
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.expr.asm(ctx).set_stack()
-        for trgt in self.trgts:
+        return self.lower(nodes, ctx, self.expr, self.trgts)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, expr:'tree_node|int', trgts:'Sequence[tree_node|int]') -> context_paths:
+        paths, ctx = lw.asm(expr, ctx).set_stack()
+        for trgt in trgts:
             paths, ctx = ctx.push_reg(paths)
-            paths, ctx = trgt.asm(ctx).split_nxt(paths)
+            paths, ctx = lw.asm(trgt, ctx).split_nxt(paths)
             paths, ctx = ctx.push_reg(paths)
             paths, ctx = ctx.reg_peeks(2, paths)
             paths, ctx = ctx.inst('assign', 'val,ref', paths)
@@ -384,19 +489,23 @@ class assignment_n(tree_node):
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class compare_n(tree_node):
     expr:tree_node
     compares:tuple[tuple[str,tree_node], ...]
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.expr.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.expr, self.compares)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, expr:'tree_node|int', compares:'Sequence[tuple[str, tree_node|int]]') -> context_paths:
+        paths, ctx = lw.asm(expr, ctx).set_stack()
         paths, ctx = ctx.push_reg()
-        if self.compares:
+        if compares:
             paths, ctx = ctx.inst('bool', 'True', paths)
-        for op,expr in self.compares:
+        for op,expr in compares:
             paths, ctx = ctx.inst('del', 'reg', paths)
-            paths, ctx = expr.asm(ctx).split_nxt(paths)
+            paths, ctx = lw.asm(expr, ctx).split_nxt(paths)
             paths, ctx = ctx.push_reg(paths)
             paths, ctx = ctx.reg_peeks(2, paths)
             paths, ctx = ctx.inst('comp', op, paths)
@@ -406,7 +515,7 @@ class compare_n(tree_node):
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class binary_op_n(tree_node):
     '''
     calls expr_a then expr_b and calls op on return values
@@ -416,16 +525,20 @@ class binary_op_n(tree_node):
     expr_b:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.expr_a.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.op, self.expr_a, self.expr_b)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, op:str, expr_a:'tree_node|int', expr_b:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(expr_a, ctx).set_stack()
         paths, ctx = ctx.push_reg(paths)
-        paths, ctx = self.expr_b.asm(ctx).split_nxt(paths)
+        paths, ctx = lw.asm(expr_b, ctx).split_nxt(paths)
         paths, ctx = ctx.push_reg(paths)
         paths, ctx = ctx.reg_peeks(2, paths)
-        paths, ctx = ctx.inst('binop', self.op, paths)
+        paths, ctx = ctx.inst('binop', op, paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class unary_op_n(tree_node):
     '''
     calls expr, then calls op on return value
@@ -434,12 +547,25 @@ class unary_op_n(tree_node):
     expr:tree_node
 
     def asm(self, ctx: context) -> context_paths:
-        paths, ctx = self.expr.asm(ctx).set_stack()
+        return self.lower(nodes, ctx, self.op, self.expr)
+
+    @staticmethod
+    def lower(lw:lowering, ctx: context, op:str, expr:'tree_node|int') -> context_paths:
+        paths, ctx = lw.asm(expr, ctx).set_stack()
         paths, ctx = ctx.push_reg()
-        paths, ctx = ctx.inst('unop', self.op, paths)
+        paths, ctx = ctx.inst('unop', op, paths)
         return ctx.join_nxt(paths).reset_stack()
 
 
-@dataclass
+@dataclass(slots=True)
 class await_n(tree_node):
     expr:tree_node
+
+
+@dataclass(slots=True)
+class syntax_n(tree_node):
+    '''
+    a py.bnf rule parsed by cypyparser, its tokens are left to its span
+    '''
+    rule:str
+    args:tuple[tree_node, ...]
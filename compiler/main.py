@@ -1,19 +1,38 @@
 # main.py
+import io
+import os
 import sys
+import mmap
+import time
+import contextlib
+from dataclasses import dataclass
+import cylexer as lex
 import cyparser
 import cyparsefuns as funs
 import cycompiler as comp
+import cycache
+import cyarena
 import cyassembler as assy
 
 class parser_manip:
 
-    def __init__(self, filename:str, file:str):
-        p = cyparser.parser(filename, file)
-        n = funs.file_r(p)
+    def __init__(self, filename:str, file:'str|bytes|mmap.mmap', stream:bool=False,
+            cache:'cycache.tokcache|None'=None, arena:bool=False, generated:bool=False):
+        a = cyarena.arena() if arena else None
+        if generated:
+            # the parser py.bnf generates, its syntax_n tree is lowered into
+            # the nodes the rules build, only compiles through it pay the imports
+            import cypyparser
+            import cylower
+            p = cyparser.parser(filename, file, stream, cache)
+            n = cylower.lower(p.lexer, cypyparser.parse(p) or p.error('invalid syntax'), a)
+        else:
+            p = cyparser.parser(filename, file, stream, cache, arena=a)
+            n = funs.file_r(p)
 
 
         ctx = comp.context('program', 'start')
-        paths = n.asm(ctx)
+        paths = a.asm(n, ctx) if a else n.asm(ctx)
         for n,nctx in paths._ctxs.items():
             xctx = comp.context('program-exit', n)
             nctx._setctxs(n=xctx)
@@ -21,13 +40,131 @@ class parser_manip:
         assy.assember(ctx)
         print('main success')
 
-def main(filename:str):
-    with open(filename, 'r') as f:
-        file = f.read()
-    parser_manip(filename, file)
+def main(filename:str, stream:bool=False, cache:'cycache.tokcache|None'=None, arena:bool=False,
+        generated:bool=False):
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else: file = b'' # empty files cannot be mapped
+    parser_manip(filename, file, stream, cache, arena, generated)
+
+@dataclass
+class compile_result:
+    filename:str
+    ok:bool
+    output:str # the listing, or the error report when not ok
+    nbytes:int
+    seconds:float
+
+def compile_file(filename:str, stream:bool=False, cachedir:'str|None'=None,
+        file:'str|bytes|None'=None, cache:'cycache.tokcache|None'=None, arena:bool=False,
+        generated:bool=False):
+    '''
+    compiles one file of a batch or of a cyserver request, what main would
+    print is captured and errors are returned rather than ending the process,
+    file is the source when the caller has read it already
+    '''
+    out = io.StringIO()
+    start = time.perf_counter()
+    cache = cache or (cachedir and cycache.tokcache(cachedir)) or None
+    try:
+        with contextlib.redirect_stdout(out):
+            if file is None: main(filename, stream, cache, arena, generated)
+            else: parser_manip(filename, file, stream, cache, arena, generated)
+        ok = True
+    except lex.compile_error as e:
+        print(e, file=out)
+        ok = False
+    except Exception:
+        import traceback # only failed compiles pay for the import
+        print(f'File "{filename}"', file=out)
+        print(traceback.format_exc(), end='', file=out)
+        ok = False
+    if file is not None: nbytes = len(file)
+    else: nbytes = os.path.getsize(filename) if os.path.exists(filename) else 0
+    return compile_result(filename, ok, out.getvalue(), nbytes, time.perf_counter() - start)
+
+def compile_batch(filenames:'list[str]', stream:bool=False, jobs:'int|None'=None, cachedir:'str|None'=None):
+    '''
+    compiles filenames over a pool of jobs processes, one per cpu by default,
+    and returns their results in the same order
+    '''
+    # the pool pulls in multiprocessing, which single file compiles never need
+    from concurrent.futures import ProcessPoolExecutor
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(filenames) // (jobs * 4))
+    n = len(filenames)
+    with ProcessPoolExecutor(jobs) as pool:
+        return list(pool.map(compile_file, filenames, [stream] * n, [cachedir] * n, chunksize=chunksize))
+
+def readpaths(args:'list[str]'):
+    '''source paths from args, @name reads a manifest with one path per line'''
+    paths:'list[str]' = []
+    for arg in args:
+        if arg.startswith('@'):
+            with open(arg[1:], 'r') as f:
+                paths.extend(line.strip() for line in f if line.strip())
+        else: paths.append(arg)
+    return paths
+
+def batch(args:'list[str]', stream:bool=False, jobs:'int|None'=None, cachedir:'str|None'=None):
+    filenames = readpaths(args)
+    start = time.perf_counter()
+    results = compile_batch(filenames, stream, jobs, cachedir)
+    wall = time.perf_counter() - start
+
+    failed = [r for r in results if not r.ok]
+    for r in failed:
+        print(r.output, end='')
+    nbytes = sum(r.nbytes for r in results)
+    busy = sum(r.seconds for r in results)
+    print(f'batch {len(results)} files {len(failed)} failed '
+        f'{nbytes/2**20:.1f} MiB in {wall:.2f} s '
+        f'{len(results)/wall:,.0f} files/s {nbytes/wall/2**20:.2f} MiB/s '
+        f'x{busy/wall:.1f} parallel')
+    return not failed
+
+usage = 'usage: python main.py [--stream] [--arena] [--generated] [--cache[=dir]] file.cy\n' \
+    '       python main.py --batch [--stream] [--jobs=n] [--cache[=dir]] file.cy|@manifest ...'
+
+def options(args:'list[str]'):
+    '''
+    splits args into (paths, stream, arena, generated, batch, jobs, cachedir), options
+    may come before or after the file names, None means the args are not valid
+    '''
+    paths:'list[str]' = []
+    stream = arena = generated = batch = False
+    jobs:'int|None' = None
+    cachedir:'str|None' = None
+    for a in args:
+        if not a.startswith('--'): paths.append(a)
+        elif a == '--stream': stream = True
+        elif a == '--arena': arena = True
+        elif a == '--generated': generated = True
+        elif a == '--batch': batch = True
+        elif a.startswith('--jobs='):
+            n = a[len('--jobs='):]
+            if not n.isdigit() or int(n) < 1: return None
+            jobs = int(n)
+        # --cache uses the default cache directory, --cache=path another one
+        elif a == '--cache': cachedir = cycache.default_dir()
+        elif a.startswith('--cache=') and len(a) > len('--cache='): cachedir = a[len('--cache='):]
+        else: return None
+    if not paths or (not batch and len(paths) > 1): return None
+    return paths, stream, arena, generated, batch, jobs, cachedir
 
 if __name__ == "__main__":
-    filename = sys.argv[1]
+    opts = options(sys.argv[1:])
+    if opts is None:
+        print(usage, file=sys.stderr)
+        exit(2)
+    paths, stream, arena, generated, isbatch, jobs, cachedir = opts
 
     # test()
-    main(filename)
+    if isbatch:
+        exit(0 if batch(paths, stream, jobs, cachedir) else -1)
+    try:
+        main(paths[0], stream, cachedir and cycache.tokcache(cachedir), arena, generated)
+    except lex.compile_error as e:
+        print(e)
+        exit(-1)
@@ -0,0 +1,193 @@
+# lexbench.py
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, 'compiler'))
+
+import cylexer
+import cythonlexer
+
+def loadmodule(name:str, filename:str):
+    '''modules whose file name is not an identifier, like c.lexer.py'''
+    spec = importlib.util.spec_from_file_location(name, os.path.join(here, filename))
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+clexer = loadmodule('clexer', 'c.lexer.py')
+
+
+############################################################
+# synthetic corpora, one generator per dialect and token mix
+
+pyops = ('+', '-', '*', '/', '//', '%', '**', '<<', '>>', '&', '|', '^', '==', '!=', '<=', '>=')
+cops = ('+', '-', '*', '/', '%', '<<', '>>', '&', '|', '^', '&&', '||', '==', '!=', '<=', '>=')
+
+def idf(rng:random.Random, lo:int=1, hi:int=8):
+    first = rng.choice('abcdefghijklmnopqrstuvwxyz_')
+    return first + ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz_0123456789')
+        for _ in range(rng.randint(lo, hi) - 1))
+
+def expr(rng:random.Random, ops:'tuple[str, ...]', nops:int, name:'Callable[[], str]'):
+    terms = [name() if rng.random() < .7 else str(rng.randint(0, 999)) for _ in range(nops + 1)]
+    return terms[0] + ''.join(f' {rng.choice(ops)} {t}' for t in terms[1:])
+
+def py_lines(rng:random.Random, mix:str):
+    name = lambda: idf(rng, 40, 120) if mix == 'idents' else idf(rng)
+    depth = 0
+    while True:
+        tab = '    ' * depth
+        if mix == 'indent':
+            if depth < 40 and rng.random() < .8:
+                yield f'{tab}if {name()} < {rng.randint(0, 99)}:'
+                depth += 1
+                continue
+            yield f'{tab}{name()} = {expr(rng, pyops, 2, name)}'
+            depth = rng.randint(0, depth)
+        elif mix == 'ops':
+            yield f'{name()} = {expr(rng, pyops, rng.randint(20, 60), name)}'
+        elif mix == 'comments':
+            yield f'# {" ".join(idf(rng) for _ in range(rng.randint(4, 14)))}'
+            if rng.random() < .2: yield f'{name()} = {name()}  # {idf(rng)}'
+        else:
+            r = rng.random()
+            if r < .15: yield f'def {name()}({name()}, {name()}):'; yield f'    return {expr(rng, pyops, 2, name)}'
+            elif r < .3: yield f'{name()} = "{" ".join(idf(rng) for _ in range(3))}"'
+            elif r < .4: yield f'# {idf(rng)} {idf(rng)}'
+            elif r < .5: yield f'while {name()} < {rng.randint(0, 99)}:'; yield f'    {name()} += 1'
+            else: yield f'{name()} = {expr(rng, pyops, rng.randint(1, 4), name)}'
+
+def c_lines(rng:random.Random, mix:str):
+    name = lambda: idf(rng, 40, 120) if mix == 'idents' else idf(rng)
+    depth = 0
+    while True:
+        tab = '    ' * depth
+        if mix == 'indent':
+            if depth < 40 and rng.random() < .8:
+                yield f'{tab}if ({name()} < {rng.randint(0, 99)}) {{'
+                depth += 1
+                continue
+            yield f'{tab}{name()} = {expr(rng, cops, 2, name)};'
+            close = rng.randint(0, depth)
+            for d in range(depth - 1, close - 1, -1): yield '    ' * d + '}'
+            depth = close
+        elif mix == 'ops':
+            yield f'{name()} = {expr(rng, cops, rng.randint(20, 60), name)};'
+        elif mix == 'comments':
+            words = " ".join(idf(rng) for _ in range(rng.randint(4, 14)))
+            yield f'// {words}' if rng.random() < .7 else f'/* {words} */'
+            if rng.random() < .2: yield f'{name()} = {name()}; // {idf(rng)}'
+        else:
+            r = rng.random()
+            if r < .15: yield f'int {name()}(int {name()}, char {name()}) {{ return {expr(rng, cops, 2, name)}; }}'
+            elif r < .3: yield f'{name()} = "{" ".join(idf(rng) for _ in range(3))}";'
+            elif r < .4: yield f'// {idf(rng)} {idf(rng)}'
+            elif r < .5: yield f'while ({name()} < {rng.randint(0, 99)}) {{ {name()} += 1; }}'
+            else: yield f'{name()} = {expr(rng, cops, rng.randint(1, 4), name)};'
+
+dialects = {'py': py_lines, 'c': c_lines}
+mixes = ('mixed', 'indent', 'ops', 'comments', 'idents')
+
+def gencorpus(dialect:str, mix:str, nbytes:int, seed:int=0):
+    '''about nbytes of source in dialect with the given token mix, the same for the same seed'''
+    lines:'list[str]' = []
+    size = 0
+    for line in dialects[dialect](random.Random(f'{seed}:{dialect}:{mix}'), mix):
+        if size >= nbytes: break
+        lines.append(line)
+        size += len(line) + 1
+    return '\n'.join(lines) + '\n'
+
+
+############################################################
+# lexers, each takes the source and returns its token count
+
+def run_cylexer(file:str):
+    return len(cylexer.lexer('bench.cy', file).toks)
+
+def run_cythonlexer(file:str):
+    # cythonlexer only lexes files, so reading one is part of the run
+    with tempfile.NamedTemporaryFile('w', suffix='.cy', delete=False) as f:
+        f.write(file)
+    try: return sum(1 for _ in cythonlexer.lexer(f.name))
+    finally: os.unlink(f.name)
+
+def run_clexer(file:str):
+    return len(clexer.tokenize(file))
+
+lexers:'dict[str, tuple[str, Callable[[str], int]]]' = {
+    'cylexer': ('py', run_cylexer),
+    'cythonlexer': ('py', run_cythonlexer),
+    'c.lexer': ('c', run_clexer),
+}
+
+
+############################################################
+
+def revision():
+    try:
+        return subprocess.run(('git', 'rev-parse', '--short', 'HEAD'), cwd=here,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def measure(run:'Callable[[str], int]', file:str, reps:int):
+    best = None
+    for _ in range(reps):
+        start = time.perf_counter()
+        ntoks = run(file)
+        t = time.perf_counter() - start
+        if best is None or t < best: best = t
+    tracemalloc.start()
+    try:
+        run(file)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+    return best, ntoks, peak
+
+def bench(names:'list[str]', mixlist:'list[str]', sizes:'list[int]', reps:int, seed:int):
+    common = {'rev': revision(), 'python': platform.python_version(), 'time': time.time(), 'seed': seed}
+    for name in names:
+        dialect, run = lexers[name]
+        for mix in mixlist:
+            for size in sizes:
+                file = gencorpus(dialect, mix, size, seed)
+                nbytes = len(file.encode())
+                seconds, ntoks, peak = measure(run, file, reps)
+                yield {**common, 'lexer': name, 'dialect': dialect, 'mix': mix,
+                    'bytes': nbytes, 'tokens': ntoks, 'seconds': seconds,
+                    'tok_per_s': ntoks / seconds, 'bytes_per_s': nbytes / seconds, 'peak_bytes': peak}
+
+def main(argv:'list[str]'):
+    args = argparse.ArgumentParser(description='tokens/s, bytes/s and peak memory of the lexers')
+    args.add_argument('--lexer', action='append', choices=lexers, help='default: all')
+    args.add_argument('--mix', action='append', choices=mixes, help='default: all')
+    args.add_argument('--size', action='append', type=int, help='corpus bytes, default: 65536')
+    args.add_argument('--reps', type=int, default=3)
+    args.add_argument('--seed', type=int, default=0)
+    args.add_argument('--out', help='append the results to this file as json lines')
+    opts = args.parse_args(argv)
+
+    results = bench(opts.lexer or list(lexers), opts.mix or list(mixes), opts.size or [2**16], opts.reps, opts.seed)
+    for r in results:
+        print(f"{r['lexer']:>12} {r['mix']:>8} {r['bytes']:>9} B {r['tokens']:>8} toks "
+            f"{r['tok_per_s']:>11,.0f} tok/s {r['bytes_per_s']/2**20:>7.2f} MiB/s "
+            f"peak {r['peak_bytes']/2**20:>7.1f} MiB")
+        if opts.out:
+            with open(opts.out, 'a') as f:
+                f.write(json.dumps(r) + '\n')
+
+if __name__ == "__main__":
+    main(sys.argv[1:])